@@ -6,6 +6,7 @@ Module for mixin of basic crud methods based on api_path class method.
 
 import robottelo.api.base as base
 
+from robottelo.common import ledger
 from robottelo.common.helpers import sleep_for_seconds
 from robottelo.common.records import ManyRelatedField, RelatedField
 
@@ -255,7 +256,11 @@ class ApiCrud(object):
         if hasattr(cls, 'api_path_delete'):
             path = cls.parse_path_arg(cls.api_path_get, kwargs)
         path = "{0}/{1}".format(path, uid)
-        return base.delete(path=path, **kwargs)
+        res = base.delete(path=path, **kwargs)
+        if res.ok:
+            # Deleted by the test, not to be cleaned up
+            ledger.forget(("api", cls.__name__, unicode(uid)))
+        return res
 
     @classmethod
     def opts(cls, data):
@@ -498,11 +503,45 @@ class ApiCrud(object):
                 instance.__class__,
                 res.json(),
                 data_load_transform)
+            cls.record_ledger(instance, ninstance, path_args, user=user)
             return ninstance
         else:
             raise ApiException(
                 "Couldn't create record", instance, res)
 
+    @classmethod
+    def record_ledger(cls, instance, ninstance, path_args, user=None):
+        """Records the created record and its related records in the ledger
+        """
+        if not ledger.recording() or "id" not in ninstance:
+            return None
+        # Removed like it was created, with the ids of its related records
+        removable = instance.copy()
+        removable["id"] = ninstance.id
+
+        related_fields = instance._meta.fields.keys(cls=RelatedField)
+        dependencies = [
+            ledger.find((
+                "api",
+                instance[field]._meta.api_class.__name__,
+                unicode(instance[field].id)))
+            for field in related_fields
+            if "id" in (instance[field] or {})
+            ]
+
+        name = cls.__name__
+        return ledger.record(
+            u"%s %s" % (name, ninstance.id),
+            lambda: cls.record_remove(removable, user=user),
+            dependencies,
+            obj=ninstance,
+            key=("api", name, unicode(ninstance.id)),
+            ref={
+                "api": "%s:%s" % (cls.__module__, name),
+                "id": ninstance.id,
+                "path_args": path_args,
+                })
+
     @classmethod
     def record_create_dependencies(cls, instance_orig, user=None):
         """Ensures that all related fields of the record do exist
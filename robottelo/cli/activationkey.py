@@ -31,6 +31,7 @@ class ActivationKey(Base):
     """
 
     command_base = "activation-key"
+    settles_after_create = True
 
     @classmethod
     def add_host_collection(cls, options=None):
@@ -38,9 +39,8 @@ class ActivationKey(Base):
         Associate a resource
         """
 
-        cls.command_sub = "add-host-collection"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'add-host-collection'))
 
     @classmethod
     def add_subscription(cls, options=None):
@@ -48,9 +48,8 @@ class ActivationKey(Base):
         Add subscription
         """
 
-        cls.command_sub = "add-subscription"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'add-subscription'))
 
     @classmethod
     def host_collection(cls, options=None):
@@ -58,9 +57,8 @@ class ActivationKey(Base):
         List associated host collections
         """
 
-        cls.command_sub = "host-collections"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'host-collections'))
 
     @classmethod
     def remove_repository(cls, options=None):
@@ -68,9 +66,8 @@ class ActivationKey(Base):
         Disassociate a resource
         """
 
-        cls.command_sub = "remove-repository"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'remove-repository'))
 
     @classmethod
     def remove_subscription(cls, options=None):
@@ -78,9 +75,8 @@ class ActivationKey(Base):
         Remove subscription
         """
 
-        cls.command_sub = "remove-subscription"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'remove-subscription'))
 
     @classmethod
     def subscriptions(cls, options=None):
@@ -88,6 +84,4 @@ class ActivationKey(Base):
         List associated subscriptions
         """
 
-        cls.command_sub = "subscriptions"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'subscriptions'))
@@ -5,10 +5,12 @@
 Generic base class for cli hammer commands
 """
 
+import collections
 import logging
 
-from robottelo.common import conf, ssh
-from robottelo.common.helpers import info_dictionary
+from robottelo.cli import shell
+from robottelo.common import concurrency, conf, ledger, metrics, ssh
+from robottelo.common.helpers import info_dictionary, iter_csv_rows
 
 
 class Base(object):
@@ -39,8 +41,13 @@ class Base(object):
     @since: 27.Nov.2013
     """
     command_base = None  # each inherited instance should define this
-    command_sub = None  # specific to instance, like: create, update, etc
     command_requires_org = False  # True when command requires organization-id
+    # Subcommands not requiring organization-id even if the above is True
+    command_org_optional = ()
+    # True when new objects can not be used right after being created
+    settles_after_create = False
+    # (command_base, command_sub) pairs hammer can not output as JSON
+    _json_unsupported = set()
 
     logger = logging.getLogger("robottelo")
 
@@ -54,27 +61,102 @@ class Base(object):
         Adds OS to record.
         """
 
-        cls.command_sub = "add-operatingsystem"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'add-operatingsystem'))
 
         return result
 
     @classmethod
-    def create(cls, options=None):
+    def create(cls, options=None, lazy_info=None):
         """
         Creates a new record using the arguments passed via dictionary.
-        """
-
-        cls.command_sub = "create"
 
+        The new object is fetched with ``info`` right after being created.
+        Pass ``lazy_info=True`` (or set ``create.info=lazy`` in the
+        ``[hammer]`` section of robottelo.properties) to only fetch it the
+        first time a field missing from the create output is read. Its
+        fields then show the object as it is at that time, not as it was
+        created.
+        """
         if options is None:
             options = {}
+        if lazy_info is None:
+            lazy_info = cls._lazy_info()
 
         result = cls.execute(
-            cls._construct_command(options),
+            cls._construct_command(options, u'create'),
             expect_csv=True)
 
+        return cls._created(options, result, lazy_info)
+
+    @classmethod
+    def create_many(cls, options_list, lazy_info=None, batch_size=None):
+        """
+        Like create for every options dictionary of ``options_list``, but
+        with the commands sent in concurrent batches, see run_batches.
+
+        Returns one result per options dictionary, in the same order. The
+        new objects are fetched in batches too, unless ``lazy_info``.
+        """
+        if lazy_info is None:
+            lazy_info = cls._lazy_info()
+        options_list = [options or {} for options in options_list]
+
+        results = cls.run_batches(
+            [cls._construct_command(options, u'create')
+             for options in options_list],
+            expect_csv=True, batch_size=batch_size)
+        results = [
+            cls._created(options, result, lazy_info=True)
+            for options, result in zip(options_list, results)
+            ]
+        if not lazy_info:
+            cls.load_many([
+                result.stdout for result in results
+                if isinstance(result.stdout, CreatedObject)],
+                batch_size=batch_size)
+        return results
+
+    @classmethod
+    def _lazy_info(cls):
+        """Tells whether new objects are fetched only when needed"""
+        return conf.properties.get('hammer.create.info', 'eager') == 'lazy'
+
+    @classmethod
+    def run_batches(cls, commands, expect_csv=False, batch_size=None):
+        """
+        Runs the commands in batches (see batch) of ``batch_size`` commands,
+        ``batch.size`` in the ``[hammer]`` section of robottelo.properties,
+        by default as many batches as the shared executor has workers. The
+        batches run concurrently, the commands of each one after the other.
+
+        Returns one result per command, in the same order.
+        """
+        if batch_size is None:
+            batch_size = int(conf.properties.get('hammer.batch.size', 0))
+        if batch_size <= 0:
+            batch_size = -(-len(commands) // concurrency.get_workers())
+
+        futures = []
+        for start in range(0, len(commands), max(1, batch_size)):
+            batch = cls.batch()
+            for command in commands[start:start + batch_size]:
+                batch.add(command, expect_csv)
+            futures.append(concurrency.submit(batch.execute))
+
+        results = []
+        for batch_results in concurrency.gather(futures):
+            results.extend(batch_results)
+        return results
+
+    @classmethod
+    def _created(cls, options, result, lazy_info):
+        """
+        Replaces the output of a create command with a CreatedObject of the
+        new object. The result of a failed command is left as it is.
+        """
+        metrics.increment('cli.create.%s' % cls.__name__)
+
         # Extract new object ID if it was successfully created
         if len(result.stdout) > 0 and 'id' in result.stdout[0]:
             obj_id = result.stdout[0]['id']
@@ -82,41 +164,59 @@ class Base(object):
             # Fetch new object
             # Some Katello obj require the organization-id for subcommands
             info_options = {u'id': obj_id}
-            if cls.command_requires_org:
+            if cls._requires_org(u'info'):
                 if 'organization-id' not in options:
                     raise Exception(
                         'organization-id option is required for %s.create' %
                         cls.__name__)
                 info_options[u'organization-id'] = options[u'organization-id']
 
-            new_obj = cls.info(info_options)
-            # stdout should be a dictionary containing the object
-            if len(new_obj.stdout) > 0:
-                result.stdout = new_obj.stdout
+            def fetch():
+                metrics.increment('cli.create.info.%s' % cls.__name__)
+                return cls.info(info_options).stdout
+
+            result.stdout = CreatedObject(
+                result.stdout[0], fetch, info_options=info_options)
+            if not lazy_info:
+                result.stdout.load()
 
         return result
 
     @classmethod
-    def delete(cls, options=None):
+    def create_async(cls, options=None):
         """
-        Deletes existing record.
+        Like create but returns right away with a future of the result.
         """
+        return concurrency.submit(cls.create, options)
 
-        cls.command_sub = "delete"
+    @classmethod
+    def delete(cls, options=None):
+        """
+        Deletes existing record. Records deleted by id are dropped from the
+        ledger of created entities, see robottelo.common.ledger.
+        """
 
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'delete'))
+        if result.return_code == 0 and options and options.get(u'id'):
+            ledger.forget(('cli', cls.__name__, unicode(options[u'id'])))
 
         return result
 
+    @classmethod
+    def delete_async(cls, options=None):
+        """
+        Like delete but returns right away with a future of the result.
+        """
+        return concurrency.submit(cls.delete, options)
+
     @classmethod
     def delete_parameter(cls, options=None):
         """
         Deletes parameter from record.
         """
 
-        cls.command_sub = "delete-parameter"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'delete-parameter'))
 
         return result
 
@@ -126,33 +226,75 @@ class Base(object):
         Displays the content for existing partition table.
         """
 
-        cls.command_sub = "dump"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'dump'), idempotent=True)
 
         return result
 
     @classmethod
     def execute(cls, command, user=None, password=None,
-                expect_csv=False, timeout=None):
+                expect_csv=False, timeout=None, idempotent=False,
+                expect_json=False):
         """
-        Executes the command
+        Executes the command. Read-only commands should be flagged
+        ``idempotent`` so they are run again if the connection drops.
+        With ``expect_json`` hammer outputs JSON, which is decoded to
+        dictionaries, and ValueError is raised if it does not.
         """
         if user is None:
             user = cls.katello_user
         if password is None:
             password = cls.katello_passwd
 
-        output_csv = u""
-
-        if expect_csv:
-            output_csv = u" --output csv"
-        shell_cmd = u"LANG=%s hammer -v -u %s -p %s %s %s"
+        if conf.properties.get('hammer.backend', 'process') == 'shell':
+            return shell.execute(
+                command, user, password, expect_csv=expect_csv,
+                timeout=timeout, idempotent=idempotent,
+                expect_json=expect_json)
 
-        cmd = shell_cmd % (cls.locale, user, password, output_csv, command)
+        cmd = cls._hammer_command(
+            command, user, password, expect_csv, expect_json)
 
         return ssh.command(
-            cmd.encode('utf-8'), expect_csv=expect_csv, timeout=timeout)
+            cmd.encode('utf-8'), expect_csv=expect_csv, timeout=timeout,
+            idempotent=idempotent, expect_json=expect_json)
+
+    @classmethod
+    def execute_async(cls, command, user=None, password=None,
+                      expect_csv=False, timeout=None, idempotent=False,
+                      expect_json=False):
+        """
+        Like execute but returns right away with a future of the result.
+        The commands run on a shared executor bounded by the ssh pool size,
+        collect them with concurrency.gather or concurrency.as_completed:
+
+            futures = [Org.create_async({u'name': name}) for name in names]
+            results = concurrency.gather(futures)
+        """
+        return concurrency.submit(
+            cls.execute, command, user, password, expect_csv, timeout,
+            idempotent, expect_json)
+
+    @classmethod
+    def batch(cls, user=None, password=None, timeout=None):
+        """
+        Returns a Batch that runs the hammer commands added to it in one
+        round trip. Used as a context manager the commands run when the
+        block exits:
+
+            with Org.batch() as batch:
+                for name in names:
+                    batch.add(
+                        Org._construct_command({u'name': name}, u'create'),
+                        expect_csv=True)
+            results = batch.results
+        """
+        if user is None:
+            user = cls.katello_user
+        if password is None:
+            password = cls.katello_passwd
+
+        return Batch(cls, user, password, timeout)
 
     @classmethod
     def exists(cls, options=None, tuple_search=None):
@@ -168,12 +310,31 @@ class Base(object):
             options.update({"search": "%s=\"%s\"" %
                             (tuple_search[0], tuple_search[1])})
 
-        result = cls.list(options)
+        command = cls._list_command(options)
 
-        if result.stdout:
-            result.stdout = result.stdout[0]
+        if (cls._use_json(u'list') or
+                conf.properties.get('hammer.backend', 'process') != 'process'):
+            result = cls.list(options)
+            if result.stdout:
+                result.stdout = result.stdout[0]
+            return result
 
-        return result
+        # Only the first row is needed, stop hammer once it is read
+        stream = ssh.command_stream(
+            cls._hammer_command(
+                command, cls.katello_user, cls.katello_passwd,
+                expect_csv=True).encode('utf-8'),
+            expect_csv=True)
+        lines = iter(stream)
+        try:
+            row = next(iter_csv_rows(lines), None)
+        finally:
+            lines.close()
+
+        if row is not None:
+            return ssh.SSHCommandResult(stdout=row)
+        return ssh.SSHCommandResult(
+            stdout=[], stderr=stream.stderr, return_code=stream.return_code)
 
     @classmethod
     def info(cls, options=None):
@@ -182,23 +343,81 @@ class Base(object):
         @param options: ID (sometimes name or id).
         """
 
-        cls.command_sub = "info"
-
         if options is None:
             options = {}
 
-        if cls.command_requires_org and 'organization-id' not in options:
+        if cls._requires_org(u'info') and 'organization-id' not in options:
             raise Exception(
                 'organization-id option is required for %s.info' %
                 cls.__name__)
 
-        result = cls.execute(cls._construct_command(options), expect_csv=False)
+        command = cls._construct_command(options, u'info')
+
+        if cls._use_json(u'info'):
+            result = cls._execute_json(command)
+            if result is not None:
+                if result.return_code != 0:
+                    # Just like the legacy output, an empty dictionary
+                    result = info_dictionary(result)
+                return result
+
+        result = cls.execute(command, expect_csv=False, idempotent=True)
 
         # info_dictionary required to convert result.stdout to dic format
         updated_result = info_dictionary(result)
 
         return updated_result
 
+    @classmethod
+    def is_ready(cls, new_obj):
+        """
+        Tells whether the CreatedObject ``new_obj`` can be used. Objects of
+        classes that settle after being created are ready once info finds
+        them, all others right away. Probing fills the object with the info
+        output, so reading it later takes no other info command.
+        """
+        if not cls.settles_after_create:
+            return True
+
+        return bool(new_obj.found) or new_obj.refresh()
+
+    @classmethod
+    def ready_many(cls, new_objs):
+        """
+        Like is_ready for every CreatedObject of ``new_objs``, with the info
+        commands run in concurrent batches, see load_many. Returns a list of
+        booleans.
+        """
+        if not cls.settles_after_create:
+            return [True] * len(new_objs)
+
+        cls.load_many([new_obj for new_obj in new_objs if not new_obj.found])
+        return [bool(new_obj.found) for new_obj in new_objs]
+
+    @classmethod
+    def load_many(cls, objects, batch_size=None):
+        """
+        Like CreatedObject.load for every object of ``objects``, with the
+        info commands run in concurrent batches, see run_batches. Returns
+        a list of booleans telling whether info found each object.
+        """
+        results = cls.run_batches([
+            cls._construct_command(obj.info_options, u'info')
+            for obj in objects], batch_size=batch_size)
+        metrics.increment('cli.create.info.%s' % cls.__name__, len(objects))
+        return [
+            obj.fill(info_dictionary(result).stdout
+                     if result.return_code == 0 else {})
+            for obj, result in zip(objects, results)
+            ]
+
+    @classmethod
+    def info_async(cls, options=None):
+        """
+        Like info but returns right away with a future of the result.
+        """
+        return concurrency.submit(cls.info, options)
+
     @classmethod
     def list(cls, options=None, per_page=True):
         """
@@ -206,22 +425,42 @@ class Base(object):
         @param options: ID (sometimes name works as well) to retrieve info.
         """
 
-        cls.command_sub = "list"
+        command = cls._list_command(options, per_page)
+
+        if cls._use_json(u'list'):
+            result = cls._execute_json(command)
+            if result is not None:
+                return result
 
+        result = cls.execute(command, expect_csv=True, idempotent=True)
+
+        return result
+
+    @classmethod
+    def _list_command(cls, options=None, per_page=True):
+        """
+        Builds the list command, checking the organization is given when
+        required.
+        """
         if options is None:
             options = {}
 
         if 'per-page' not in options and per_page:
             options[u'per-page'] = 10000
 
-        if cls.command_requires_org and 'organization-id' not in options:
+        if cls._requires_org(u'list') and 'organization-id' not in options:
             raise Exception(
                 'organization-id option is required for %s.list' %
                 cls.__name__)
 
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        return cls._construct_command(options, u'list')
 
-        return result
+    @classmethod
+    def list_async(cls, options=None, per_page=True):
+        """
+        Like list but returns right away with a future of the result.
+        """
+        return concurrency.submit(cls.list, options, per_page)
 
     @classmethod
     def puppetclasses(cls, options=None):
@@ -229,9 +468,9 @@ class Base(object):
         Lists all puppet classes.
         """
 
-        cls.command_sub = "puppet-classes"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'puppet-classes'),
+            expect_csv=True, idempotent=True)
 
         return result
 
@@ -241,9 +480,8 @@ class Base(object):
         Removes OS from record.
         """
 
-        cls.command_sub = "remove-operatingsystem"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'remove-operatingsystem'))
 
         return result
 
@@ -253,9 +491,9 @@ class Base(object):
         Lists all smart class parameters.
         """
 
-        cls.command_sub = "sc-params"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'sc-params'), expect_csv=True,
+            idempotent=True)
 
         return result
 
@@ -265,9 +503,7 @@ class Base(object):
         Creates or updates parameter for a record.
         """
 
-        cls.command_sub = "set-parameter"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'set-parameter'))
 
         return result
 
@@ -277,9 +513,8 @@ class Base(object):
         Updates existing record.
         """
 
-        cls.command_sub = "update"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'update'), expect_csv=True)
 
         return result
 
@@ -296,23 +531,234 @@ class Base(object):
         return NUserBase
 
     @classmethod
-    def _construct_command(cls, options=None):
+    def _hammer_command(cls, command, user, password, expect_csv=False,
+                        expect_json=False):
+        """
+        Prefixes the command with the hammer executable and its global
+        options.
+        """
+        output_csv = u""
+
+        if expect_json:
+            output_csv = u" --output json"
+        elif expect_csv:
+            output_csv = u" --output csv"
+        shell_cmd = u"LANG=%s hammer -v -u %s -p %s %s %s"
+
+        return shell_cmd % (cls.locale, user, password, output_csv, command)
+
+    @classmethod
+    def _use_json(cls, command_sub):
+        """
+        Tells whether the subcommand should be run with JSON output, which
+        is enabled with ``output=json`` in the ``[hammer]`` section of
+        robottelo.properties.
+        """
+        return (conf.properties.get('hammer.output', 'csv') == 'json' and
+                (cls.command_base, command_sub) not in Base._json_unsupported)
+
+    @classmethod
+    def _execute_json(cls, command):
+        """
+        Runs the read-only command with JSON output. Returns None when
+        hammer can not output it as JSON, so the caller falls back to the
+        legacy output, and remembers not to try it again.
+        """
+        try:
+            result = cls.execute(command, idempotent=True, expect_json=True)
+            # The output is only parsed on first access
+            result.stdout
+        except ValueError:
+            pass
+        else:
+            # A failed command is a failure of its own, unless hammer
+            # complained about the output format
+            if result.return_code == 0 or \
+                    'json' not in (result.stderr or '').lower():
+                return result
+
+        cls.logger.info(
+            'No JSON output for "%s %s", using the legacy output' %
+            (command.command_base, command.command_sub))
+        Base._json_unsupported.add(
+            (command.command_base, command.command_sub))
+        return None
+
+    @classmethod
+    def _construct_command(cls, options, command_sub):
         """
         Build a hammer cli command based on the options passed
         """
+        return Command(cls.command_base, command_sub, options)
 
-        tail = u""
+    @classmethod
+    def _requires_org(cls, command_sub):
+        """Tells whether the subcommand requires the organization-id"""
+        return (cls.command_requires_org and
+                command_sub not in cls.command_org_optional)
+
+
+class Command(unicode):
+    """
+    A hammer cli command line (without the leading ``hammer``), built anew
+    for every call.
 
+    It is a plain unicode string, so it can be passed around and executed
+    as such, that also exposes the parts it was built from. Nothing about
+    the command being built is kept on the cli classes, which makes them
+    safe to use from several threads at once.
+    """
+
+    def __new__(cls, command_base, command_sub, options=None):
         if options is None:
             options = {}
 
+        tail = u""
+
         for key, val in options.items():
             if val is not None:
                 if val is True:
                     tail += u" --%s" % key
                 elif val is not False:
                     tail += u" --%s='%s'" % (key, val)
-        cmd = u"%s %s %s" % (cls.command_base, cls.command_sub,
-                             tail.strip())
 
-        return cmd
+        command = super(Command, cls).__new__(
+            cls, u"%s %s %s" % (command_base, command_sub, tail.strip()))
+        command.command_base = command_base
+        command.command_sub = command_sub
+        # A copy, later changes to the caller's dictionary do not apply
+        command.options = dict(options)
+        return command
+
+
+class CreatedObject(collections.MutableMapping):
+    """
+    Dictionary of a newly created object that runs the ``info`` command only
+    when needed.
+
+    Fields of the create command output are served as is. Reading any other
+    field (or iterating, comparing, copying...) fetches the object with
+    ``fetch`` once, after which it holds the ``info`` output like a plain
+    dictionary would. ``defaults`` are the fields ``info`` is laid over,
+    e.g. the creation options of a factory. ``info_options`` are the options
+    to look the object up with info.
+    """
+
+    def __init__(self, created, fetch, defaults=None, info_options=None):
+        # The create message is not a field of the object
+        self._created = dict(
+            (key, val) for key, val in created.items() if key != 'message')
+        self._row = created
+        self._fetch = fetch
+        self.defaults = defaults
+        self.info_options = info_options
+        # Whether info found the object, None until fetched
+        self.found = None
+        self._data = None
+
+    @property
+    def loaded(self):
+        """Tells whether ``info`` was fetched already"""
+        return self._data is not None
+
+    def load(self):
+        """Fetches the object with ``info`` unless already done"""
+        if self._data is None:
+            self.refresh()
+        return self._data
+
+    def refresh(self):
+        """Fetches the object with ``info`` again, see fill"""
+        return self.fill(self._fetch())
+
+    def fill(self, info):
+        """
+        Lays the ``info`` output over the defaults, replacing what was
+        fetched before, and tells whether info found the object.
+        """
+        data = dict(self.defaults or {})
+        # stdout should be a dictionary containing the object, fall
+        # back to the create output otherwise
+        data.update(info if len(info) > 0 else self._row)
+        self._data = data
+        self.found = len(info) > 0
+        return self.found
+
+    def __getitem__(self, key):
+        if self._data is None and key in self._created:
+            return self._created[key]
+        return self.load()[key]
+
+    def __setitem__(self, key, value):
+        self.load()[key] = value
+
+    def __delitem__(self, key):
+        del self.load()[key]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    def __repr__(self):
+        return repr(self.load())
+
+    def copy(self):
+        """Returns a plain dictionary copy"""
+        return dict(self.load())
+
+
+class Batch(object):
+    """
+    Collects hammer commands and runs them in one round trip.
+
+    With the process backend all commands are shipped to the server as one
+    script, saving an ssh session per command. With the shell backend they
+    are fed to a shell session one after the other.
+    """
+
+    def __init__(self, cli, user, password, timeout=None):
+        self.cli = cli
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self.commands = []
+        self.results = None
+
+    def add(self, command, expect_csv=False):
+        """
+        Adds a hammer command (as built by _construct_command) to the batch
+        and returns its index in the results.
+        """
+        self.commands.append((command, expect_csv))
+        return len(self.commands) - 1
+
+    def execute(self):
+        """Runs the commands and returns one SSHCommandResult per command"""
+        if conf.properties.get('hammer.backend', 'process') == 'shell':
+            self.results = [
+                shell.execute(
+                    command, self.user, self.password,
+                    expect_csv=expect_csv, timeout=self.timeout)
+                for command, expect_csv in self.commands
+                ]
+        else:
+            timeout = self.timeout
+            if timeout is None:
+                timeout = 60 * max(1, len(self.commands))
+            self.results = ssh.command_batch(
+                [self.cli._hammer_command(
+                    command, self.user, self.password, expect_csv
+                    ).encode('utf-8')
+                 for command, expect_csv in self.commands],
+                expect_csv=[expect_csv for _, expect_csv in self.commands],
+                timeout=timeout)
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
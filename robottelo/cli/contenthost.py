@@ -34,8 +34,7 @@ class ContentHost(Base):
         Lists async tasks for a content host
         """
 
-        cls.command_sub = "tasks"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'tasks'), expect_csv=True)
 
         return result
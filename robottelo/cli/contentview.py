@@ -38,6 +38,7 @@ class ContentView(Base):
     """
 
     command_base = "content-view"
+    settles_after_create = True
 
     @classmethod
     def add_repository(cls, options):
@@ -45,9 +46,9 @@ class ContentView(Base):
         Associate repository to a selected CV.
         """
 
-        cls.command_sub = "add-repository"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'add-repository'),
+            expect_csv=True)
 
         return result
 
@@ -57,9 +58,8 @@ class ContentView(Base):
         Associate version to a selected CV.
         """
 
-        cls.command_sub = "add-version"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'add-version'), expect_csv=True)
 
         return result
 
@@ -69,13 +69,12 @@ class ContentView(Base):
         Publishes a new version of content-view.
         """
 
-        cls.command_sub = "publish"
-
         # Publishing can take a while so try to wait a bit longer
         if timeout is None:
             timeout = 120
 
-        result = cls.execute(cls._construct_command(options), timeout=timeout)
+        result = cls.execute(
+            cls._construct_command(options, u'publish'), timeout=timeout)
 
         return result
 
@@ -85,12 +84,11 @@ class ContentView(Base):
         Provides version info related to content-view's version.
         """
 
-        cls.command_sub = "version info"
-
         if options is None:
             options = {}
 
-        result = cls.execute(cls._construct_command(options), expect_csv=False)
+        result = cls.execute(
+            cls._construct_command(options, u'version info'), expect_csv=False)
 
         # info_dictionary required to convert result.stdout
         # to dictionary format
@@ -104,9 +102,9 @@ class ContentView(Base):
         Associate puppet_module to selected CV
         """
 
-        cls.command_sub = "puppet-module add"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'puppet-module add'),
+            expect_csv=True)
 
         return result
 
@@ -116,12 +114,12 @@ class ContentView(Base):
         Provides puppet-module info related to content-view's version.
         """
 
-        cls.command_sub = "puppet-module info"
-
         if options is None:
             options = {}
 
-        result = cls.execute(cls._construct_command(options), expect_csv=False)
+        result = cls.execute(
+            cls._construct_command(options, u'puppet-module info'),
+            expect_csv=False)
 
         # info_dictionary required to convert result.stdout
         # to dictionary format
@@ -135,12 +133,11 @@ class ContentView(Base):
         Provides filter info related to content-view's version.
         """
 
-        cls.command_sub = "filter info"
-
         if options is None:
             options = {}
 
-        result = cls.execute(cls._construct_command(options), expect_csv=False)
+        result = cls.execute(
+            cls._construct_command(options, u'filter info'), expect_csv=False)
 
         # info_dictionary required to convert result.stdout
         # to dictionary format
@@ -154,12 +151,11 @@ class ContentView(Base):
         Lists content-view's versions.
         """
 
-        cls.command_sub = "version list"
-
         if options is None:
             options = {}
 
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'version list'), expect_csv=True)
 
         return result
 
@@ -169,9 +165,8 @@ class ContentView(Base):
         Promotes content-view version to next env.
         """
 
-        cls.command_sub = "version promote"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'version promote'))
 
         return result
 
@@ -181,8 +176,7 @@ class ContentView(Base):
         Removes content-view version.
         """
 
-        cls.command_sub = "version destroy"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'version destroy'))
 
         return result
@@ -9,10 +9,12 @@ import datetime
 import logging
 import os
 import random
+import time
 
 from os import chmod
 from robottelo.cli.activationkey import ActivationKey
 from robottelo.cli.architecture import Architecture
+from robottelo.cli.base import CreatedObject
 from robottelo.cli.contenthost import ContentHost
 from robottelo.cli.contentview import ContentView
 from robottelo.cli.computeresource import ComputeResource
@@ -34,12 +36,12 @@ from robottelo.cli.syncplan import SyncPlan
 from robottelo.cli.template import Template
 from robottelo.cli.user import User
 from robottelo.cli.operatingsys import OperatingSys
-from robottelo.common import ssh
+from robottelo.common import concurrency, conf, ledger, metrics, ssh
 from robottelo.common.constants import (FOREMAN_PROVIDERS, OPERATING_SYSTEMS,
                                         SYNC_INTERVAL, TEMPLATE_TYPES)
-from robottelo.common.helpers import (generate_ipaddr, generate_name,
-                                      generate_string, sleep_for_seconds,
-                                      update_dictionary)
+from robottelo.common.helpers import (WaitTimeOut, generate_ipaddr,
+                                      generate_name, generate_string,
+                                      update_dictionary, wait_for)
 from tempfile import mkstemp
 
 logger = logging.getLogger("robottelo")
@@ -48,6 +50,49 @@ ORG_KEYS = ['organization', 'organization-id', 'organization-label']
 CONTENT_VIEW_KEYS = ['content-view', 'content-view-id']
 LIFECYCLE_KEYS = ['environment', 'environment-id']
 
+# Seconds a new object may take to become usable
+READY_TIMEOUT = 60
+
+# Options referring to other objects, with the cli classes of the objects
+REFERENCES = {
+    'architecture-id': 'Architecture',
+    'content-view-id': 'ContentView',
+    'domain-id': 'Domain',
+    'gpg-key-id': 'GPGKey',
+    'host-collection-id': 'HostCollection',
+    'medium-id': 'Medium',
+    'operatingsystem-id': 'OperatingSys',
+    'organization-id': 'Org',
+    'product-id': 'Product',
+    'ptable-id': 'PartitionTable',
+    'subnet-id': 'Subnet',
+    'sync-plan-id': 'SyncPlan',
+}
+
+# Options referring to objects of different classes depending on the cli
+# class given them: environment-id is a lifecycle environment for Katello
+# commands and a puppet environment for Foreman ones
+CLI_REFERENCES = {
+    'ActivationKey': {'environment-id': 'LifecycleEnvironment'},
+    'ContentHost': {'environment-id': 'LifecycleEnvironment'},
+    'HostGroup': {'environment-id': 'Environment'},
+}
+
+
+def mark_names(args):
+    """
+    Prefixes the default name and login of ``args`` with ``data.name_prefix``
+    of the ``[main]`` section of robottelo.properties, so the objects the
+    factories create can be told apart, see robottelo.common.orphans.
+    Returns ``args``.
+    """
+    prefix = conf.properties.get('main.data.name_prefix')
+    if prefix:
+        for key in ('name', 'login'):
+            if args.get(key):
+                args[key] = prefix + args[key]
+    return args
+
 
 def create_object(cli_object, args):
     """
@@ -61,12 +106,11 @@ def create_object(cli_object, args):
     created.
 
     @rtype: dict
-    @return: A dictionary representing the newly created resource.
+    @return: A dictionary representing the newly created resource laid
+    over the creation arguments.
     """
 
     result = cli_object.create(args)
-    # Some methods require a bit of waiting
-    sleep_for_seconds(5)
 
     # If the object is not created, raise exception, stop the show.
     if result.return_code != 0:
@@ -74,12 +118,274 @@ def create_object(cli_object, args):
         raise Exception(
             'Failed to create %s with %r data.' % (cli_object.__name__, args))
 
+    new_obj = _created_object(args, result)
+    record_object(cli_object, args, new_obj)
+    if isinstance(new_obj, CreatedObject):
+        wait_until_ready(cli_object, new_obj)
+    return new_obj
+
+
+def create_objects(cli_object, args_list):
+    """
+    Creates several <object>s at once, with their create commands sent in
+    batches (see Base.create_many), and waits until they are all ready.
+
+    @param cli_object: A valid CLI object.
+    @param args_list: A list of python dictionaries, one per object, as
+    for create_object.
+
+    @raise Exception: Raise an exception if any object cannot be created.
+
+    @rtype: list
+    @return: The dictionaries create_object would return, in the order of
+    args_list.
+    """
+
+    results = cli_object.create_many(args_list)
+
+    failed = [
+        (args, result) for args, result in zip(args_list, results)
+        if result.return_code != 0]
+    if failed:
+        for _, result in failed:
+            logger.debug(result.stderr)  # Show why creation failed.
+        raise Exception(
+            'Failed to create %d of %d %s, first with %r data.' %
+            (len(failed), len(args_list), cli_object.__name__, failed[0][0]))
+
+    new_objs = [
+        _created_object(args, result)
+        for args, result in zip(args_list, results)]
+    for args, new_obj in zip(args_list, new_objs):
+        record_object(cli_object, args, new_obj)
+    wait_until_all_ready(cli_object, [
+        new_obj for new_obj in new_objs
+        if isinstance(new_obj, CreatedObject)])
+    return new_objs
+
+
+def _created_object(args, result):
+    """
+    Returns the dictionary of the object created by a successful create
+    command, laid over the creation arguments.
+    """
+
     # Sometimes we get a list with a dictionary and not
     # a dictionary.
     if type(result.stdout) is list and len(result.stdout) > 0:
         result.stdout = result.stdout[0]
 
-    return result.stdout
+    if isinstance(result.stdout, CreatedObject):
+        result.stdout.defaults = dict(args)
+        if result.stdout.loaded:
+            # Fetched before the defaults were known
+            for key, value in args.items():
+                result.stdout.setdefault(key, value)
+        return result.stdout
+
+    new_obj = dict(args)
+    new_obj.update(result.stdout)
+    return new_obj
+
+
+def record_object(cli_object, args, new_obj):
+    """
+    Records the new object in the ledger, depending on the objects its
+    creation arguments refer to, see REFERENCES and CLI_REFERENCES.
+    """
+    if not ledger.recording() or not new_obj.get('id'):
+        return None
+
+    options = {u'id': new_obj['id']}
+    if cli_object._requires_org(u'delete'):
+        options[u'organization-id'] = args.get('organization-id')
+
+    name = cli_object.__name__
+    references = dict(REFERENCES, **CLI_REFERENCES.get(name, {}))
+    return ledger.record(
+        u'%s %s' % (name, new_obj['id']),
+        lambda: delete_object(cli_object, options),
+        [ledger.find(('cli', references[key], unicode(value)))
+         for key, value in args.items() if key in references and value],
+        obj=new_obj, key=('cli', name, unicode(new_obj['id'])),
+        ref={'cli': name, 'options': options})
+
+
+def delete_object(cli_object, options):
+    """
+    Deletes <object> with dictionary of arguments.
+
+    @raise Exception: Raise an exception if object cannot be
+    deleted.
+    """
+
+    result = cli_object.delete(options)
+    if result.return_code != 0:
+        raise Exception(
+            'Failed to delete %s %r: %s' %
+            (cli_object.__name__, options, result.stderr))
+
+
+def wait_until_ready(cli_object, new_obj):
+    """
+    Waits until the newly created object can be used, probing it with
+    exponential backoff, and records how long it took.
+
+    @raise WaitTimeOut: Raise an exception if the object is not ready
+    within READY_TIMEOUT seconds.
+    """
+    probes = []
+
+    def is_ready():
+        probes.append(None)
+        return cli_object.is_ready(new_obj)
+
+    name = cli_object.__name__
+    try:
+        elapsed = wait_for(is_ready, READY_TIMEOUT)
+    except WaitTimeOut:
+        raise WaitTimeOut(
+            '%s %s not ready after %s seconds' %
+            (name, new_obj.info_options, READY_TIMEOUT))
+    finally:
+        metrics.increment('cli.ready.probes.%s' % name, len(probes))
+
+    metrics.record('cli.ready.%s' % name, elapsed)
+    return elapsed
+
+
+def wait_until_all_ready(cli_object, new_objs):
+    """
+    Like wait_until_ready for several objects, probing the objects not
+    ready yet in batches each time.
+
+    @raise WaitTimeOut: Raise an exception if any object is not ready
+    within READY_TIMEOUT seconds.
+    """
+    pending = list(new_objs)
+    probes = []
+
+    def are_ready():
+        probes.append(None)
+        ready = cli_object.ready_many(pending)
+        pending[:] = [
+            new_obj for new_obj, is_ready in zip(pending, ready)
+            if not is_ready]
+        return not pending
+
+    if not pending:
+        return 0
+
+    name = cli_object.__name__
+    try:
+        elapsed = wait_for(are_ready, READY_TIMEOUT)
+    except WaitTimeOut:
+        raise WaitTimeOut(
+            '%d %s not ready after %s seconds, e.g. %s' %
+            (len(pending), name, READY_TIMEOUT, pending[0].info_options))
+    finally:
+        metrics.increment('cli.ready.batches.%s' % name, len(probes))
+
+    metrics.record('cli.ready.%s' % name, elapsed)
+    return elapsed
+
+
+class Reference(object):
+    """
+    Stands for a field of another object of a fixture spec, see
+    make_fixtures.
+    """
+
+    def __init__(self, name, field='id'):
+        self.name = name
+        self.field = field
+
+    def __repr__(self):
+        return 'Reference(%r, %r)' % (self.name, self.field)
+
+
+def make_fixtures(spec, concurrent=True):
+    """
+    Creates related objects, concurrently where they do not depend on each
+    other, and returns a dictionary of the created objects by name.
+
+    The spec maps the name of each object to a ``(factory, options)``
+    tuple. Options may refer to fields of other objects with Reference,
+    which makes the object depend on them::
+
+        fixtures = make_fixtures({
+            'org': (make_org, {}),
+            'env1': (make_lifecycle_environment, {
+                u'organization-id': Reference('org')}),
+            'env2': (make_lifecycle_environment, {
+                u'organization-id': Reference('org'),
+                u'prior': Reference('env1', 'label')}),
+            'product': (make_product, {
+                u'organization-id': Reference('org')}),
+        })
+
+    The objects are created level by level: first the objects depending
+    on none, then the objects depending only on those and so on, the
+    objects of each level at the same time. So creating them takes as long
+    as the longest chain of dependencies, not as the number of objects.
+
+    With ``concurrent=False`` the objects are created one after the other
+    in the calling thread instead, as they always are from a task of the
+    shared executor (see robottelo.common.concurrency).
+
+    @raise ValueError: Raise an exception if a reference is unknown or the
+    references are circular.
+    """
+    start = time.time()
+    objects = {}
+    for level in fixture_levels(spec):
+        futures = []
+        for name in level:
+            factory, options = spec[name]
+            options = dict(
+                (key, objects[value.name][value.field]
+                 if isinstance(value, Reference) else value)
+                for key, value in (options or {}).items())
+            if concurrent:
+                futures.append(concurrency.submit(factory, options))
+            else:
+                objects[name] = factory(options)
+        if futures:
+            objects.update(zip(level, concurrency.gather(futures)))
+
+    metrics.record('cli.fixtures', time.time() - start)
+    return objects
+
+
+def fixture_levels(spec):
+    """
+    Returns the names of the objects of a fixture spec grouped in levels,
+    each object coming after the objects it refers to, see make_fixtures.
+    """
+    dependencies = {}
+    for name, (_, options) in spec.items():
+        dependencies[name] = set(
+            value.name for value in (options or {}).values()
+            if isinstance(value, Reference))
+        unknown = dependencies[name].difference(spec)
+        if unknown:
+            raise ValueError(
+                '%s refers to unknown objects: %s' %
+                (name, ', '.join(sorted(unknown))))
+
+    levels = []
+    done = set()
+    while len(done) < len(dependencies):
+        level = sorted(
+            name for name, needed in dependencies.items()
+            if name not in done and needed <= done)
+        if not level:
+            raise ValueError(
+                'Circular references between %s' %
+                ', '.join(sorted(set(dependencies).difference(done))))
+        levels.append(level)
+        done.update(level)
+    return levels
 
 
 def make_activation_key(options=None):
@@ -123,10 +429,8 @@ def make_activation_key(options=None):
     }
 
     # Override default dictionary with updated one
-    args = update_dictionary(args, options)
-    args.update(create_object(ActivationKey, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(ActivationKey, args)
 
 
 def make_architecture(options=None):
@@ -146,10 +450,8 @@ def make_architecture(options=None):
     }
 
     # Override default dictionary with updated one
-    args = update_dictionary(args, options)
-    args.update(create_object(Architecture, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(Architecture, args)
 
 
 def make_content_view(options=None):
@@ -186,10 +488,8 @@ def make_content_view(options=None):
     }
 
     # Override default dictionary with updated one
-    args = update_dictionary(args, options)
-    args.update(create_object(ContentView, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(ContentView, args)
 
 
 def make_gpg_key(options=None):
@@ -228,13 +528,10 @@ def make_gpg_key(options=None):
     # Upload file to server
     ssh.upload_file(local_file=key_filename, remote_file=args['key'])
 
-    args = update_dictionary(args, options)
+    args = update_dictionary(mark_names(args), options)
 
     # gpg create returns a dict inside a list
-    new_obj = create_object(GPGKey, args)
-    args.update(new_obj)
-
-    return args
+    return create_object(GPGKey, args)
 
 
 def make_model(options=None):
@@ -257,10 +554,8 @@ def make_model(options=None):
     }
 
     # Override default dictionary with updated one
-    args = update_dictionary(args, options)
-    args.update(create_object(Model, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(Model, args)
 
 
 def make_partition_table(options=None):
@@ -302,10 +597,8 @@ def make_partition_table(options=None):
     # Upload file to server
     ssh.upload_file(local_file=layout, remote_file=args['file'])
 
-    args = update_dictionary(args, options)
-    args.update(create_object(PartitionTable, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(PartitionTable, args)
 
 
 def make_product(options=None):
@@ -323,6 +616,22 @@ def make_product(options=None):
         -h, --help                    print help
     """
 
+    return create_object(Product, _product_args(options))
+
+
+def make_products(count, options=None):
+    """
+    Creates ``count`` products at once, see make_product and
+    create_objects.
+    """
+
+    return create_objects(
+        Product, [_product_args(options) for _ in range(count)])
+
+
+def _product_args(options=None):
+    """Returns the arguments of a new product, see make_product"""
+
     # Organization ID is a required field.
     if not options or not options.get('organization-id', None):
         raise Exception("Please provide a valid ORG ID.")
@@ -336,10 +645,7 @@ def make_product(options=None):
         'sync-plan-id': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Product, args))
-
-    return args
+    return update_dictionary(mark_names(args), options)
 
 
 def make_proxy(options=None):
@@ -358,10 +664,8 @@ def make_proxy(options=None):
                                  generate_string('numeric', 4)),
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Proxy, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(Proxy, args)
 
 
 def make_repository(options=None):
@@ -387,6 +691,22 @@ def make_repository(options=None):
         --url URL                     repository source url
     """
 
+    return create_object(Repository, _repository_args(options))
+
+
+def make_repositories(count, options=None):
+    """
+    Creates ``count`` repositories at once, see make_repository and
+    create_objects.
+    """
+
+    return create_objects(
+        Repository, [_repository_args(options) for _ in range(count)])
+
+
+def _repository_args(options=None):
+    """Returns the arguments of a new repository, see make_repository"""
+
     # Product ID is a required field.
     if not options or not options.get('product-id', None):
         raise Exception("Please provide a valid Product ID.")
@@ -406,10 +726,7 @@ def make_repository(options=None):
         'organization-label': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Repository, args))
-
-    return args
+    return update_dictionary(mark_names(args), options)
 
 
 def make_subnet(options=None):
@@ -451,10 +768,8 @@ def make_subnet(options=None):
         'dns-id': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Subnet, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(Subnet, args)
 
 
 def make_sync_plan(options=None):
@@ -488,10 +803,8 @@ def make_sync_plan(options=None):
         'interval': random.choice(SYNC_INTERVAL.values()),
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(SyncPlan, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(SyncPlan, args)
 
 
 def make_content_host(options=None):
@@ -522,6 +835,22 @@ def make_content_host(options=None):
         -h, --help                    print help
     """
 
+    return create_object(ContentHost, _content_host_args(options))
+
+
+def make_content_hosts(count, options=None):
+    """
+    Creates ``count`` content hosts at once, see make_content_host and
+    create_objects.
+    """
+
+    return create_objects(
+        ContentHost, [_content_host_args(options) for _ in range(count)])
+
+
+def _content_host_args(options=None):
+    """Returns the arguments of a new content host, see make_content_host"""
+
     # Organization ID is a required field.
     if not options:
         raise Exception("Please provide required parameters")
@@ -557,10 +886,7 @@ def make_content_host(options=None):
         'service-level': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(ContentHost, args))
-
-    return args
+    return update_dictionary(mark_names(args), options)
 
 
 def make_host_collection(options=None):
@@ -594,10 +920,8 @@ def make_host_collection(options=None):
         'system-ids': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(HostCollection, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(HostCollection, args)
 
 
 def make_user(options=None):
@@ -628,10 +952,8 @@ def make_user(options=None):
         'auth-source-id': 1,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(User, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(User, args)
 
 
 def make_compute_resource(options=None):
@@ -668,14 +990,12 @@ def make_compute_resource(options=None):
         'server': None
     }
 
-    args = update_dictionary(args, options)
+    args = update_dictionary(mark_names(args), options)
     if args['provider'] is None:
         options['provider'] = FOREMAN_PROVIDERS['libvirt']
         if args['url'] is None:
             options['url'] = "qemu+tcp://localhost:16509/system"
-    args.update(create_object(ComputeResource, args))
-
-    return args
+    return create_object(ComputeResource, args)
 
 
 def make_org(options=None):
@@ -689,6 +1009,22 @@ def make_org(options=None):
         --description DESCRIPTION     description
     """
 
+    return create_object(Org, _org_args(options))
+
+
+def make_orgs(count, options=None):
+    """
+    Creates ``count`` organizations at once, see make_org and
+    create_objects.
+    """
+
+    return create_objects(
+        Org, [_org_args(options) for _ in range(count)])
+
+
+def _org_args(options=None):
+    """Returns the arguments of a new organization, see make_org"""
+
     # Assigning default values for attributes
     args = {
         'name': generate_name(6),
@@ -696,10 +1032,7 @@ def make_org(options=None):
         'description': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Org, args))
-
-    return args
+    return update_dictionary(mark_names(args), options)
 
 
 def make_os(options=None):
@@ -713,10 +1046,8 @@ def make_os(options=None):
         'minor': random.randint(0, 10),
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(OperatingSys, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(OperatingSys, args)
 
 
 def make_domain(options=None):
@@ -736,10 +1067,8 @@ def make_domain(options=None):
         'description': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Domain, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(Domain, args)
 
 
 def make_hostgroup(options=None):
@@ -775,10 +1104,8 @@ def make_hostgroup(options=None):
         'domain-id': None,
         'puppet-proxy-id': None,
     }
-    args = update_dictionary(args, options)
-    args.update(create_object(HostGroup, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(HostGroup, args)
 
 
 def make_medium(options=None):
@@ -819,10 +1146,8 @@ def make_medium(options=None):
         'operatingsystem-ids': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Medium, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(Medium, args)
 
 
 def make_environment(options=None):
@@ -838,10 +1163,8 @@ def make_environment(options=None):
         'name': generate_name(6),
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Environment, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(Environment, args)
 
 
 def make_lifecycle_environment(options=None):
@@ -874,10 +1197,8 @@ def make_lifecycle_environment(options=None):
         'prior': None,
     }
 
-    args = update_dictionary(args, options)
-    args.update(create_object(LifecycleEnvironment, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(LifecycleEnvironment, args)
 
 
 def make_template(options=None):
@@ -920,7 +1241,5 @@ def make_template(options=None):
     ssh.upload_file(local_file=layout, remote_file=args['file'])
     # End - Special handling for template factory
 
-    args = update_dictionary(args, options)
-    args.update(create_object(Template, args))
-
-    return args
+    args = update_dictionary(mark_names(args), options)
+    return create_object(Template, args)
@@ -34,9 +34,8 @@ class GPGKey(Base):
         Gets information for GPG Key
         """
 
-        cls.command_sub = "info"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'info'), expect_csv=True)
 
         # Need to rebuild the returned object
         # First check for content key
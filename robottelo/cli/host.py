@@ -55,9 +55,8 @@ class Host(Base):
             --name NAME                   resource name
             -h, --help                    print help
         """
-        cls.command_sub = "facts"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'facts'), expect_csv=True)
 
         facts = []
 
@@ -80,9 +79,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = "puppetrun"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'puppetrun'))
 
         return result
 
@@ -100,9 +97,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = "reboot"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'reboot'))
 
         return result
 
@@ -123,9 +118,8 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = "reports"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'reports'), expect_csv=True)
 
         reports = []
 
@@ -148,9 +142,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = "stop"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'stop'))
 
         return result
 
@@ -168,9 +160,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = "status"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'status'))
 
         return result
 
@@ -189,8 +179,6 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = "stop"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'stop'))
 
         return result
@@ -27,6 +27,7 @@ class LifecycleEnvironment(Base):
 
     command_base = "lifecycle-environment"
     command_requires_org = True
+    settles_after_create = True
 
     @classmethod
     def list(cls, options=None, per_page=False):
@@ -44,9 +44,8 @@ class OperatingSys(Base):
         Adds existing architecture to OS.
         """
 
-        cls.command_sub = "add-architecture"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'add-architecture'))
 
         return result
 
@@ -56,9 +55,8 @@ class OperatingSys(Base):
         Adds existing template to OS.
         """
 
-        cls.command_sub = "add-config-template "
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'add-config-template '))
 
         return result
 
@@ -68,9 +66,7 @@ class OperatingSys(Base):
         Adds existing partitioning table to OS.
         """
 
-        cls.command_sub = "add-ptable"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'add-ptable'))
 
         return result
 
@@ -80,9 +76,8 @@ class OperatingSys(Base):
         Removes architecture from OS.
         """
 
-        cls.command_sub = "remove-architecture"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'remove-architecture'))
 
         return result
 
@@ -92,9 +87,8 @@ class OperatingSys(Base):
         Removes template from OS.
         """
 
-        cls.command_sub = "remove-config-template"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'remove-config-template'))
 
         return result
 
@@ -104,8 +98,7 @@ class OperatingSys(Base):
         Removes partitioning table from OS.
         """
 
-        cls.command_sub = "remove-ptable "
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'remove-ptable '))
 
         return result
@@ -44,6 +44,7 @@ class Org(Base):
     """
 
     command_base = "organization"
+    settles_after_create = True
 
     @classmethod
     def add_subnet(cls, options=None):
@@ -51,9 +52,7 @@ class Org(Base):
         Adds existing subnet to an org
         """
 
-        cls.command_sub = "add-subnet"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'add-subnet'))
 
     @classmethod
     def remove_subnet(cls, options=None):
@@ -61,9 +60,7 @@ class Org(Base):
         Removes a subnet from an org
         """
 
-        cls.command_sub = "remove-subnet"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'remove-subnet'))
 
     @classmethod
     def add_domain(cls, options=None):
@@ -71,9 +68,7 @@ class Org(Base):
         Adds a domain to an org
         """
 
-        cls.command_sub = "add-domain"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'add-domain'))
 
     @classmethod
     def remove_domain(cls, options=None):
@@ -81,9 +76,7 @@ class Org(Base):
         Removes a domain from an org
         """
 
-        cls.command_sub = "remove-domain"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'remove-domain'))
 
     @classmethod
     def add_user(cls, options=None):
@@ -91,9 +84,7 @@ class Org(Base):
         Adds an user to an org
         """
 
-        cls.command_sub = "add-user"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'add-user'))
 
     @classmethod
     def remove_user(cls, options=None):
@@ -101,9 +92,7 @@ class Org(Base):
         Removes an user from an org
         """
 
-        cls.command_sub = "remove-user"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'remove-user'))
 
     @classmethod
     def add_hostgroup(cls, options=None):
@@ -111,9 +100,7 @@ class Org(Base):
         Adds a hostgroup to an org
         """
 
-        cls.command_sub = "add-hostgroup"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'add-hostgroup'))
 
     @classmethod
     def remove_hostgroup(cls, options=None):
@@ -121,9 +108,8 @@ class Org(Base):
         Removes a hostgroup from an org
         """
 
-        cls.command_sub = "remove-hostgroup"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'remove-hostgroup'))
 
     @classmethod
     def add_computeresource(cls, options=None):
@@ -131,9 +117,8 @@ class Org(Base):
         Adds a computeresource to an org
         """
 
-        cls.command_sub = "add-compute-resource"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'add-compute-resource'))
 
     @classmethod
     def remove_computeresource(cls, options=None):
@@ -141,9 +126,8 @@ class Org(Base):
         Removes a computeresource from an org
         """
 
-        cls.command_sub = "remove-compute-resource"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'remove-compute-resource'))
 
     @classmethod
     def add_medium(cls, options=None):
@@ -151,9 +135,7 @@ class Org(Base):
         Adds a medium to an org
         """
 
-        cls.command_sub = "add-medium"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'add-medium'))
 
     @classmethod
     def remove_medium(cls, options=None):
@@ -161,9 +143,7 @@ class Org(Base):
         Removes a medium from an org
         """
 
-        cls.command_sub = "remove-medium"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'remove-medium'))
 
     @classmethod
     def add_configtemplate(cls, options=None):
@@ -171,9 +151,8 @@ class Org(Base):
         Adds a configtemplate to an org
         """
 
-        cls.command_sub = "add-config-template"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'add-config-template'))
 
     @classmethod
     def remove_configtemplate(cls, options=None):
@@ -181,9 +160,8 @@ class Org(Base):
         Removes a configtemplate from an org
         """
 
-        cls.command_sub = "remove-config-template"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'remove-config-template'))
 
     @classmethod
     def add_environment(cls, options=None):
@@ -191,9 +169,7 @@ class Org(Base):
         Adds an environment to an org
         """
 
-        cls.command_sub = "add-environment"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'add-environment'))
 
     @classmethod
     def remove_environment(cls, options=None):
@@ -201,9 +177,8 @@ class Org(Base):
         Removes an environment from an org
         """
 
-        cls.command_sub = "remove-environment"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'remove-environment'))
 
     @classmethod
     def add_smartproxy(cls, options=None):
@@ -211,9 +186,7 @@ class Org(Base):
         Adds a smartproxy to an org
         """
 
-        cls.command_sub = "add-smart-proxy"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, u'add-smart-proxy'))
 
     @classmethod
     def remove_smartproxy(cls, options=None):
@@ -221,6 +194,5 @@ class Org(Base):
         Removes a smartproxy from an org
         """
 
-        cls.command_sub = "remove-smart-proxy"
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, u'remove-smart-proxy'))
@@ -0,0 +1,218 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Pools of objects created ahead of the tests needing them.
+
+Most CLI tests start by creating an organization, often a lifecycle
+environment or a product in it too, although few of them need these to be
+brand new. With ``pool.size`` set in the ``[hammer]`` section of
+robottelo.properties, that many sets of objects of each kind are kept
+created in the background, and tests lease them instead of creating their
+own::
+
+    def setUp(self):
+        self.fixtures = pool.lease('product')
+        self.addCleanup(self.fixtures.release)
+        self.product = self.fixtures['product']
+
+A lease is exclusive until released, then its objects go back to the pool
+for the next test. Tests changing the objects themselves (updating or
+deleting them, as opposed to creating other objects in them) or keeping
+them lease them tainted, or taint the lease later: tainted objects never go
+back to the pool, which creates a new set in the background instead.
+
+Leases served from the pool (hits) and leases which had to create their
+objects (misses) are counted in the metrics reported when the run ends.
+Without ``pool.size`` every lease creates its objects right away, like the
+factories do.
+"""
+
+import atexit
+import collections
+import logging
+import threading
+import time
+
+from robottelo.cli.factory import (Reference, make_fixtures,
+                                   make_lifecycle_environment, make_org,
+                                   make_product)
+from robottelo.common import concurrency, conf, ledger, metrics
+
+logger = logging.getLogger("robottelo")
+
+# Fixture specs of the sets of objects of each kind, see make_fixtures
+KINDS = {
+    'org': {
+        'org': (make_org, {}),
+    },
+    'lifecycle_environment': {
+        'org': (make_org, {}),
+        'lifecycle_environment': (make_lifecycle_environment, {
+            u'organization-id': Reference('org')}),
+    },
+    'product': {
+        'org': (make_org, {}),
+        'product': (make_product, {
+            u'organization-id': Reference('org')}),
+    },
+}
+
+_pools = {}
+_pools_lock = threading.Lock()
+_closed = False
+
+
+class Lease(dict):
+    """
+    Objects leased from a pool, by their name in the fixture spec of their
+    kind.
+    """
+
+    def __init__(self, pool, fixtures, tainted=False):
+        super(Lease, self).__init__(fixtures)
+        self.pool = pool
+        self.tainted = tainted
+        self.released = False
+        self._tainted_at_lease = tainted
+
+    def taint(self):
+        """Keeps the objects from going back to the pool"""
+        self.tainted = True
+
+    def release(self):
+        """Gives the objects back to the pool, unless tainted"""
+        if not self.released:
+            self.released = True
+            self.pool.release(self, self._tainted_at_lease)
+
+
+class Pool(object):
+    """
+    Keeps ``size`` sets of objects created from a fixture spec, counting
+    the sets ready and leased untainted.
+    """
+
+    def __init__(self, kind, spec, size):
+        self.kind = kind
+        self.spec = spec
+        self.size = size
+        self._ready = collections.deque()
+        self._pending = 0
+        self._leased = 0
+        self._lock = threading.Lock()
+
+    def create(self, concurrent=True):
+        """Creates a set of objects and records how long it took"""
+        start = time.time()
+        # The objects outlive the tests leasing them
+        with ledger.using(ledger.session):
+            fixtures = make_fixtures(self.spec, concurrent)
+        ledger.promote(fixtures.values())
+        metrics.record('pool.create.%s' % self.kind, time.time() - start)
+        return fixtures
+
+    def lease(self, tainted=False):
+        """
+        Returns a Lease of a ready set of objects, creating one when there
+        is none.
+
+        Leases taken untainted count against the size of the pool until
+        released, tainted ones are replaced right away.
+        """
+        with self._lock:
+            fixtures = self._ready.popleft() if self._ready else None
+            if not tainted:
+                self._leased += 1
+        try:
+            if fixtures is None:
+                if self.size:
+                    metrics.increment('pool.miss.%s' % self.kind)
+                fixtures = self.create()
+            else:
+                metrics.increment('pool.hit.%s' % self.kind)
+        except Exception:
+            self._forget(tainted)
+            raise
+        finally:
+            self.fill()
+        return Lease(self, fixtures, tainted)
+
+    def release(self, lease, tainted_at_lease=False):
+        """Puts the objects of ``lease`` back in the pool, unless tainted"""
+        if lease.tainted:
+            metrics.increment('pool.tainted.%s' % self.kind)
+        elif self.size:
+            with self._lock:
+                self._ready.append(dict(lease))
+        self._forget(tainted_at_lease)
+        self.fill()
+
+    def _forget(self, tainted_at_lease):
+        """Stops counting a lease against the size of the pool"""
+        if not tainted_at_lease:
+            with self._lock:
+                self._leased -= 1
+
+    def fill(self):
+        """Creates sets of objects in the background up to ``size``"""
+        with self._lock:
+            missing = 0
+            if not _closed:
+                missing = self.size - (
+                    len(self._ready) + self._pending + self._leased)
+            self._pending += max(0, missing)
+        for _ in range(missing):
+            concurrency.submit(self._fill)
+
+    def _fill(self):
+        """Creates a set of objects and adds it to the ready ones"""
+        fixtures = None
+        try:
+            fixtures = self.create(concurrent=False)
+        except Exception, e:
+            metrics.increment('pool.errors.%s' % self.kind)
+            logger.warning('Could not fill the %s pool: %s' % (self.kind, e))
+        with self._lock:
+            self._pending -= 1
+            if fixtures is not None:
+                self._ready.append(fixtures)
+
+
+def get_pool(kind):
+    """Returns the pool of objects of ``kind``, one of KINDS"""
+    if kind not in KINDS:
+        raise ValueError(
+            'Unknown kind of pooled objects %s, expected one of %s' %
+            (kind, ', '.join(sorted(KINDS))))
+    with _pools_lock:
+        if kind not in _pools:
+            _pools[kind] = Pool(kind, KINDS[kind], max(0, int(
+                conf.properties.get('hammer.pool.size', 0))))
+    return _pools[kind]
+
+
+def lease(kind, tainted=False):
+    """
+    Leases a set of objects of ``kind``, see Pool.lease, and starts filling
+    its pool.
+    """
+    return get_pool(kind).lease(tainted)
+
+
+def warm(*kinds):
+    """
+    Starts filling the pools of ``kinds``, all of them by default, so the
+    first leases do not wait for the objects to be created.
+    """
+    for kind in kinds or sorted(KINDS):
+        get_pool(kind).fill()
+
+
+def _close():
+    """Stops filling the pools when the run ends"""
+    global _closed
+    _closed = True
+
+
+atexit.register(_close)
@@ -29,6 +29,7 @@ class Product(Base):
 
     command_base = "product"
     command_requires_org = True
+    settles_after_create = True
 
     @classmethod
     def remove_sync_plan(cls, options=None):
@@ -36,9 +37,8 @@ class Product(Base):
         Delete assignment sync plan and product.
         """
 
-        cls.command_sub = "remove_sync_plan"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'remove_sync_plan'))
 
         return result
 
@@ -48,8 +48,6 @@ class Product(Base):
         Assign sync plan to product.
         """
 
-        cls.command_sub = "set_sync_plan"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'set_sync_plan'))
 
         return result
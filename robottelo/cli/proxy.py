@@ -34,8 +34,7 @@ class Proxy(Base):
         Import puppet classes from puppet proxy.
         """
 
-        cls.command_sub = "import-classes"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'import-classes'))
 
         return result
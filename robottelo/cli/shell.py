@@ -0,0 +1,257 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Persistent ``hammer shell`` backend for cli hammer commands.
+
+Spawning ``hammer`` for every command pays the Ruby interpreter start, gem
+loading and API authentication each time. This backend keeps long-lived
+``hammer shell`` sessions open, one pool per credential set, and feeds them
+the commands instead.
+
+``hammer shell`` does not report when a command finished nor its exit
+status, and its Readline prompt redraws are unusable over a pipe. So the
+session is started through a small Ruby bootstrap that replaces
+``Readline.readline``: before reading the next command it writes a frame
+marker, carrying the exit status of the previous command, to both stdout
+and stderr. Everything before the markers is the output of that command.
+
+Enable it by setting ``backend=shell`` in the ``[hammer]`` section of
+robottelo.properties.
+"""
+
+import logging
+import select
+import threading
+import time
+import uuid
+
+from robottelo.common import conf, ssh
+
+# Ruby bootstrap run in place of the hammer executable. The frame token is
+# passed through the ROBOTTELO_TOKEN environment variable. The shell runs
+# every line through the class ``run`` of a HammerCLI::AbstractCommand
+# subclass, which returns the value of the instance ``run`` (called for
+# each nested subcommand, the outermost returning last) or exits on usage
+# errors, so both are hooked to keep the exit status of the line.
+BOOTSTRAP = (
+    '$stdout.sync = true; $stderr.sync = true; '
+    'require "readline"; '
+    'module Readline; '
+    'def self.readline(prompt = "", add_history = false); '
+    'unless $robottelo_hooked; '
+    '$robottelo_hooked = true; '
+    'HammerCLI::AbstractCommand.send('
+    ':alias_method, :robottelo_run, :run); '
+    'HammerCLI::AbstractCommand.send(:define_method, :run) do |*args| '
+    '$robottelo_status = robottelo_run(*args); '
+    'end; '
+    'HammerCLI::AbstractCommand.singleton_class.send('
+    ':alias_method, :robottelo_run, :run); '
+    'HammerCLI::AbstractCommand.define_singleton_method(:run) do |*args| '
+    'begin; robottelo_run(*args); '
+    'rescue SystemExit => e; $robottelo_status = e.status; raise; end; '
+    'end; '
+    'end; '
+    'status = $robottelo_status.is_a?(Integer) ? $robottelo_status : 0; '
+    '$robottelo_status = nil; '
+    '$stdout.write("\\n#{ENV["ROBOTTELO_TOKEN"]} #{status}\\n"); '
+    '$stderr.write("\\n#{ENV["ROBOTTELO_TOKEN"]}\\n"); '
+    'line = $stdin.gets; '
+    'line && line.chomp; '
+    'end; '
+    'end; '
+    'load Gem.bin_path("hammer_cli", "hammer")'
+)
+
+
+class HammerShellError(Exception):
+    """
+    Exception for hammer shell sessions that exited unexpectedly
+    """
+    pass
+
+
+class HammerShellSession(object):
+    """
+    A long-lived ``hammer shell`` process running over its own ssh
+    connection.
+    """
+
+    def __init__(self, user, password, output=None, hostname=None,
+                 timeout=60):
+        self.token = uuid.uuid4().hex
+        self._stdout = ''
+        self._stderr = ''
+        self.client = ssh._get_connection(hostname)
+        self.channel = self.client.get_transport().open_session()
+
+        # Output adapter for all commands, e.g. csv or json
+        output = u' --output %s' % output if output else u''
+        cmd = (u"LANG=%s ROBOTTELO_TOKEN=%s ruby -e '%s' -- "
+               u"-u %s -p %s%s shell") % (
+            conf.properties['main.locale'], self.token, BOOTSTRAP,
+            user, password, output)
+        self.channel.exec_command(cmd.encode('utf-8'))
+
+        # Skip the banner printed before the first command is read
+        try:
+            self._read_frame(timeout)
+        except Exception:
+            self.close()
+            raise
+
+    def execute(self, command, timeout=60):
+        """
+        Runs one hammer command (without the leading ``hammer``) and returns
+        a tuple ``(stdout, stderr, return_code)`` with its raw output.
+        """
+        self.channel.sendall(command.rstrip('\n') + '\n')
+        return self._read_frame(timeout)
+
+    def is_alive(self):
+        """Tells whether the session can still run commands"""
+        return not (self.channel.closed or self.channel.eof_received or
+                    self.channel.exit_status_ready())
+
+    def close(self):
+        """Ends the session and closes its connection"""
+        try:
+            self.channel.close()
+        finally:
+            self.client.close()
+
+    def _read_frame(self, timeout):
+        """
+        Reads both streams up to the next frame markers and returns the
+        output before them along with the exit status carried on stdout.
+        """
+        stdout_marker = '\n%s ' % self.token
+        stderr_marker = '\n%s\n' % self.token
+        deadline = time.time() + timeout
+        stdout = stderr = status = None
+
+        while stdout is None or stderr is None:
+            if stdout is None:
+                index = self._stdout.find(stdout_marker)
+                end = self._stdout.find(
+                    '\n', index + len(stdout_marker))
+                if index != -1 and end != -1:
+                    stdout = self._stdout[:index]
+                    status = int(self._stdout[index + len(stdout_marker):end])
+                    self._stdout = self._stdout[end + 1:]
+                    continue
+            if stderr is None:
+                index = self._stderr.find(stderr_marker)
+                if index != -1:
+                    stderr = self._stderr[:index]
+                    self._stderr = self._stderr[index + len(stderr_marker):]
+                    continue
+
+            if self.channel.recv_ready():
+                self._stdout += self.channel.recv(ssh.BUFFER_SIZE)
+            elif self.channel.recv_stderr_ready():
+                self._stderr += self.channel.recv_stderr(ssh.BUFFER_SIZE)
+            elif not self.is_alive():
+                raise HammerShellError(
+                    'hammer shell exited: %s' % self._stderr.strip())
+            else:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise ssh.CommandTimeOut('Command timeout exceeded')
+                select.select([self.channel], [], [], remaining)
+
+        return stdout, stderr, status
+
+
+class HammerShellPool(ssh.SSHConnectionPool):
+    """
+    Bounded pool of hammer shell sessions sharing one credential set.
+    """
+
+    def __init__(self, user, password, output, size=2, timeout=60):
+        super(HammerShellPool, self).__init__(
+            conf.properties['main.server.hostname'], None, None,
+            size=size, timeout=timeout)
+        self.user = user
+        self.password = password
+        self.output = output
+
+    def _connect(self):
+        return HammerShellSession(
+            self.user, self.password, self.output, self.hostname,
+            self.timeout)
+
+    @staticmethod
+    def is_healthy(session):
+        return session.is_alive()
+
+
+# Session pools, one per (user, password, output) triple
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_session_pool(user, password, output=None):
+    """
+    Returns the shared session pool for the credential set and output
+    adapter
+    """
+    key = (user, password, output)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = HammerShellPool(
+                user, password, output,
+                size=conf.properties.get('hammer.shell.sessions', 2))
+            _pools[key] = pool
+    return pool
+
+
+def execute(command, user, password, expect_csv=False, timeout=None,
+            idempotent=False, expect_json=False):
+    """
+    Runs the hammer command on a pooled shell session and returns a
+    SSHCommandResult, just like running it through ``ssh.command``.
+
+    Commands flagged ``idempotent`` are run again on a new session when the
+    session or its connection dies while they are running.
+    """
+    if timeout is None:
+        timeout = 60
+
+    logger = logging.getLogger('robottelo')
+    logger.debug(">>> hammer shell: %s" % command)
+
+    start = time.time()
+    if expect_json:
+        output = 'json'
+    elif expect_csv:
+        output = 'csv'
+    else:
+        output = None
+    pool = get_session_pool(user, password, output)
+    while True:
+        session = pool.checkout(timeout)
+        try:
+            stdout, stderr, return_code = session.execute(
+                command.encode('utf-8'), timeout)
+        except ssh.CommandTimeOut:
+            # The session state is unknown, never hand it out again
+            pool.discard(session)
+            raise
+        except (HammerShellError,) + ssh.CONNECTION_ERRORS, e:
+            pool.discard(session)
+            if not idempotent:
+                raise
+            idempotent = False
+            logger.info("hammer shell lost (%s), running it again" % e)
+            continue
+        pool.checkin(session)
+        break
+
+    logger.debug(
+        "<<< exit status %s after %.3fs" % (return_code, time.time() - start))
+
+    return ssh.command_result(
+        stdout, stderr, return_code, expect_csv, expect_json=expect_json)
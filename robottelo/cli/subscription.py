@@ -21,9 +21,7 @@ class Subscription(Base):
         Upload a subscription manifest
         """
 
-        cls.command_sub = "upload"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(cls._construct_command(options, u'upload'))
 
         return result
 
@@ -33,9 +31,8 @@ class Subscription(Base):
         Deletes a subscription manifest
         """
 
-        cls.command_sub = "delete-manifest"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'delete-manifest'))
 
         return result
 
@@ -45,8 +42,7 @@ class Subscription(Base):
         Refreshes a subscription manifest
         """
 
-        cls.command_sub = "refresh-manifest"
-
-        result = cls.execute(cls._construct_command(options))
+        result = cls.execute(
+            cls._construct_command(options, u'refresh-manifest'))
 
         return result
@@ -27,25 +27,4 @@ class SyncPlan(Base):
 
     command_base = "sync-plan"
     command_requires_org = True
-
-    @classmethod
-    def create(cls, options=None):
-        cls.command_requires_org = False
-
-        try:
-            result = super(SyncPlan, cls).create(options)
-        finally:
-            cls.command_requires_org = True
-
-        return result
-
-    @classmethod
-    def info(cls, options=None):
-        cls.command_requires_org = False
-
-        try:
-            result = super(SyncPlan, cls).info(options)
-        finally:
-            cls.command_requires_org = True
-
-        return result
+    command_org_optional = (u'info',)
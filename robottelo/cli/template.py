@@ -37,9 +37,8 @@ class Template(Base):
         Returns list of types of templates.
         """
 
-        cls.command_sub = "kinds"
-
-        result = cls.execute(cls._construct_command(options), expect_csv=True)
+        result = cls.execute(
+            cls._construct_command(options, u'kinds'), expect_csv=True)
 
         kinds = []
 
@@ -0,0 +1,50 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Helpers for timing code and summarizing the measurements
+"""
+
+import time
+
+
+def measure(func, repeat=10, *args, **kwargs):
+    """
+    Calls ``func`` ``repeat`` times with the given arguments and returns
+    the list of wall times, in seconds, of each call.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.time()
+        func(*args, **kwargs)
+        durations.append(time.time() - start)
+    return durations
+
+
+def percentile(values, percent):
+    """Returns the ``percent`` percentile of a non-empty list of values"""
+    ordered = sorted(values)
+    index = int(round((len(ordered) - 1) * percent / 100.0))
+    return ordered[index]
+
+
+def summarize(durations):
+    """Returns count, min, max, mean, median and p95 of the durations"""
+    return {
+        'count': len(durations),
+        'min': min(durations),
+        'max': max(durations),
+        'mean': sum(durations) / len(durations),
+        'median': percentile(durations, 50),
+        'p95': percentile(durations, 95),
+    }
+
+
+def format_summary(name, summary):
+    """Formats a summary as a single report line, times in milliseconds"""
+    return (
+        u'%-30s n=%-5d min=%8.1f median=%8.1f mean=%8.1f p95=%8.1f '
+        u'max=%8.1f' % (
+            name, summary['count'], summary['min'] * 1000,
+            summary['median'] * 1000, summary['mean'] * 1000,
+            summary['p95'] * 1000, summary['max'] * 1000))
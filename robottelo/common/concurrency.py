@@ -0,0 +1,89 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Shared executor for running remote commands concurrently.
+
+Commands run through ``submit`` return futures right away, so independent
+commands can overlap instead of running one after the other. The executor
+has as many workers as the ssh connection pools have connections
+(``main.server.ssh.pool_size``): more workers would only wait for a free
+connection.
+
+Work submitted from a worker of the executor runs right away in that
+worker: waiting for it there could wait forever, once every worker waits
+for work queued behind it.
+"""
+
+import sys
+import threading
+
+from robottelo.common import conf
+
+try:
+    from concurrent import futures
+except ImportError:
+    print "Please install futures."
+    sys.exit(-1)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+# Tells the threads of the executor apart
+_local = threading.local()
+
+
+def get_workers():
+    """Returns the number of workers of the shared executor"""
+    return max(1, int(conf.properties.get('main.server.ssh.pool_size', 4)))
+
+
+def get_executor():
+    """Returns the shared executor, creating it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = futures.ThreadPoolExecutor(get_workers())
+    return _executor
+
+
+def _run(func, args, kwargs):
+    """Runs a function submitted to the executor, in one of its workers"""
+    _local.worker = True
+    return func(*args, **kwargs)
+
+
+def submit(func, *args, **kwargs):
+    """
+    Schedules ``func(*args, **kwargs)`` on the shared executor and returns
+    its future. Called from a worker of the executor, the function runs
+    before returning its (done) future.
+    """
+    if getattr(_local, 'worker', False):
+        future = futures.Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException:
+            future.set_exception_info(*sys.exc_info()[1:])
+        return future
+    return get_executor().submit(_run, func, args, kwargs)
+
+
+def gather(fs, timeout=None):
+    """
+    Waits for all futures and returns their results in the same order.
+
+    The first failure (in order) is raised once all futures are done, so no
+    command is left running behind the caller's back.
+    """
+    fs = list(fs)
+    done, not_done = futures.wait(fs, timeout)
+    if not_done:
+        raise futures.TimeoutError(
+            '%d of %d futures unfinished' % (len(not_done), len(fs)))
+    return [future.result() for future in fs]
+
+
+def as_completed(fs, timeout=None):
+    """Yields the futures as they complete, like concurrent.futures"""
+    return futures.as_completed(fs, timeout)
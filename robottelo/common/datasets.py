@@ -0,0 +1,169 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Seeded data sets for data driven tests.
+
+The values given to the ``@data`` decorator are generated when the test
+modules are imported, so every run used to pay for generating them during
+collection and got different values, which made failures hard to replay.
+
+A data set is generated from a seed derived from the run seed and its name,
+so the same seed always gives the same values. Set ``data.seed`` in the
+``[main]`` section of robottelo.properties to replay a run, the seed of
+every run is logged. With a configured seed the data sets are also cached on
+disk, under ``data.cache_dir`` (``.datasets`` in the project root by
+default), and later runs load them instead of generating them again.
+
+The bytecode of the generator given to a data set, e.g. a lambda written in
+the test module, is part of the cache key, so editing it generates the data
+set again. Bump ``VERSION`` when the helpers the generators call change the
+data they produce.
+"""
+
+import cPickle
+import hashlib
+import logging
+import os
+import random
+import re
+import threading
+import types
+
+from contextlib import contextmanager
+from robottelo.common import conf
+
+# Version of the data generators, part of the cache keys
+VERSION = 2
+
+# Properties changing what the generators produce, part of the cache keys
+PROPERTIES = ('main.matrix',)
+
+_seed = None
+_datasets = {}
+_lock = threading.Lock()
+
+
+def get_seed():
+    """
+    Returns the seed of the run, ``main.data.seed`` or a random one chosen
+    once per process.
+    """
+    global _seed
+    with _lock:
+        if _seed is None:
+            seed = conf.properties.get('main.data.seed')
+            if seed:
+                _seed = int(seed)
+            else:
+                _seed = random.SystemRandom().randint(0, 2 ** 31)
+            logging.getLogger('robottelo').info(
+                'Test data seed: %d, set data.seed=%d in the [main] section '
+                'of robottelo.properties to replay it' % (_seed, _seed))
+    return _seed
+
+
+@contextmanager
+def seeded(seed):
+    """
+    Seeds the random module, which all the data generators use, for the
+    duration of the block and restores its state afterwards.
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+def _cache_dir():
+    """Returns the directory of the data set cache"""
+    return conf.properties.get('main.data.cache_dir') or os.path.join(
+        conf.get_root_path(), '.datasets')
+
+
+def _code_digest(code):
+    """
+    Returns a digest of the bytecode, names and constants of a code object,
+    nested code objects (e.g. of lambdas) included.
+    """
+    parts = [code.co_code, code.co_names]
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            const = _code_digest(const)
+        parts.append(const)
+    return hashlib.md5(repr(parts)).hexdigest()
+
+
+def _key(name, seed, generator, args, kwargs):
+    """Returns the cache key of a data set"""
+    code = getattr(generator, '__code__', None)
+    parts = [name, seed, VERSION, args, sorted(kwargs.items()),
+             _code_digest(code) if code is not None else None]
+    parts.extend(conf.properties.get(prop) for prop in PROPERTIES)
+    return hashlib.md5(repr(parts)).hexdigest()
+
+
+def load(name, generator, args=(), kwargs=None):
+    """
+    Returns the data set ``name``, the list of values returned by
+    ``generator(*args, **kwargs)`` when run with the seed of the data set.
+
+    The name must be unique to the data set, e.g. the test it is given to:
+    data sets with the same name and arguments get the same values.
+    """
+    args = tuple(args)
+    kwargs = kwargs or {}
+    seed = get_seed()
+    key = _key(name, seed, generator, args, kwargs)
+    if key in _datasets:
+        return _datasets[key]
+
+    cached = bool(conf.properties.get('main.data.seed'))
+    path = os.path.join(
+        _cache_dir(), '%s-%s.pickle' % (re.sub(r'\W', '_', name), key))
+    values = None
+    if cached and os.path.exists(path):
+        try:
+            with open(path, 'rb') as handle:
+                values = cPickle.load(handle)
+        except Exception, e:
+            logging.getLogger('robottelo').warning(
+                'Ignoring the cached data set %s: %s' % (path, e))
+
+    if values is None:
+        dataset_seed = int(
+            hashlib.md5('%s:%s' % (seed, name)).hexdigest()[:8], 16)
+        with seeded(dataset_seed):
+            values = list(generator(*args, **kwargs))
+        if cached:
+            _save(path, values)
+
+    _datasets[key] = values
+    return values
+
+
+def _save(path, values):
+    """
+    Writes the data set to the cache, atomically so concurrent test
+    processes never read a partial file.
+    """
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            # Created by another test process in the meantime
+            pass
+    temporary = '%s.%d' % (path, os.getpid())
+    try:
+        with open(temporary, 'wb') as handle:
+            cPickle.dump(values, handle, cPickle.HIGHEST_PROTOCOL)
+        os.rename(temporary, path)
+    except (cPickle.PicklingError, TypeError, IOError, OSError), e:
+        # The data set is still served from memory
+        logging.getLogger('robottelo').warning(
+            'Can not cache the data set %s: %s' % (path, e))
+        if os.path.exists(temporary):
+            os.remove(temporary)
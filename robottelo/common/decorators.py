@@ -18,7 +18,7 @@ else:
 
 
 from ddt import data as ddt_data
-from robottelo.common import conf
+from robottelo.common import conf, datasets
 from robottelo.common.constants import NOT_IMPLEMENTED
 from xml.parsers.expat import ExpatError
 from xmlrpclib import Fault
@@ -48,6 +48,39 @@ def data(*values):
     return wrapper
 
 
+# Number of data sets named after each test, see data_set
+_data_set_names = {}
+
+
+def data_set(generator, *args, **kwargs):
+    """
+    Like data, with the values of ``generator(*args, **kwargs)`` taken from
+    a seeded data set named after the decorated test, so a run can be
+    replayed and its values are cached, see robottelo.common.datasets::
+
+        @data_set(generate_strings_list, len1=256)
+        def test_name(self, name):
+
+    Values written out in the test module are wrapped in a lambda, so they
+    are generated with the seed of the data set too::
+
+        @data_set(lambda: (
+            {u'name': generate_string('alpha', 15)},
+            {u'name': generate_string('utf8', 15)},
+        ))
+        def test_name(self, data):
+    """
+    def wrapper(func):
+        name = '%s.%s' % (func.__module__, func.__name__)
+        # Tests of different classes may share their module and name
+        count = _data_set_names.get(name, 0) + 1
+        _data_set_names[name] = count
+        if count > 1:
+            name = '%s-%d' % (name, count)
+        return data(*datasets.load(name, generator, args, kwargs))(func)
+    return wrapper
+
+
 def stubbed(func):
     """Skips test since they're not yet implemented"""
     return unittest.skip(NOT_IMPLEMENTED)(func)
@@ -5,15 +5,17 @@
 Several helper methods and functions.
 """
 
+import collections
+import csv
 import os
 import random
 import re
 import string
 import time
 import bugzilla
+import json
 import logging
 
-from itertools import izip
 from robottelo.common.constants import HTML_TAGS
 from urllib2 import urlopen, Request, URLError
 from xml.parsers.expat import ExpatError
@@ -34,11 +36,12 @@ def generate_name(minimum=4, maximum=8):
     if maximum < minimum:
         maximum = minimum
 
-    rand = random.SystemRandom()
+    # Drawn from the random module so seeded data sets are reproducible,
+    # see robottelo.common.datasets
     pool1 = string.ascii_lowercase + string.digits
 
     name = u''.join(
-        rand.choice(pool1) for x in range(random.randint(minimum, maximum)))
+        random.choice(pool1) for x in range(random.randint(minimum, maximum)))
 
     return unicode(name)
 
@@ -145,69 +148,72 @@ class STR:
     utf8 = "utf8"
 
 
-def generate_string(str_type, length):
-    '''
-    This function will allow creation of a wide variety of string types,
-    of arbitrary length.  Presently the unicode strings are CJK-only but
-    should suffice for the purposes of most multibyte testing.
-    '''
-    # approximate range of CJK Unified Ideographs
-    # It does not include extensions: '4E00- 9FFF'
-    # (note: big block of unused -- possibly reserved -- characters
-    # at the end of range above.  Code below does not include these
-    # as they are, in the end, invalid unicode for now)
-    # Latin 1 range: '00C0-00F0'
-    # (note: includes some mathematical symbol, which sort of wreaks
-    # havoc with using full range.  See range broken outto avoid these,
-    # below)
+def _characters(*ranges):
+    """Returns the characters of the ``(first, stop)`` code point ranges"""
+    return u''.join(
+        unichr(code) for first, stop in ranges for code in xrange(first, stop))
+
+
+# Characters each string type is made of, built once.
+# The latin1 ranges ('00C0-00FF') leave out some mathematical symbols,
+# which sort of wreak havoc with using the full range. The utf8 strings are
+# CJK-only, taken from the CJK Unified Ideographs ('4E00-9FFF') without
+# extensions nor the big block of unused -- possibly reserved -- characters
+# at its end, as they are, in the end, invalid unicode for now.
+STRING_CHARACTERS = {
+    'alphanumeric': unicode(string.ascii_letters + string.digits),
+    'alpha': unicode(string.ascii_letters),
+    'numeric': unicode(string.digits),
+    'latin1': _characters((0x00C0, 0x00D6), (0x00D8, 0x00F6),
+                          (0x00F8, 0x00FF)),
+    'utf8': _characters((0x4E00, 0x9FCC)),
+}
+
+
+def generate_strings(str_type, length, count):
+    """
+    Generates ``count`` strings of the given type and length at once, see
+    generate_string.
 
+    All the characters are drawn in a single pass over the precomputed
+    character tables, so generating many strings is much faster than
+    calling generate_string for each.
+    """
     # First lowercase the selected str type
     str_type = str_type.lower()
 
-    if str_type == "alphanumeric":
-        output_string = u''.join(
-            random.choice(
-                string.ascii_letters + string.digits
-            ) for i in range(length))
-    elif str_type == "alpha":
-        output_string = u''.join(
-            random.choice(string.ascii_letters) for i in range(length)
-        )
-    elif str_type == "numeric":
-        output_string = u''.join(
-            random.choice(string.digits) for i in range(length)
-        )
-    elif str_type == "latin1":
-        range0 = range1 = range2 = []
-        range0 = ['00C0', '00D6']
-        range1 = ['00D8', '00F6']
-        range2 = ['00F8', '00FF']
-        output_array = []
-        for i in range(int(range0[0], 16), int(range0[1], 16)):
-            output_array.append(i)
-        for i in range(int(range1[0], 16), int(range1[1], 16)):
-            output_array.append(i)
-        for i in range(int(range2[0], 16), int(range2[1], 16)):
-            output_array.append(i)
-        output_string = u''.join(
-            unichr(random.choice(output_array)) for x in xrange(length))
-    elif str_type == "utf8":
-        cjk_range = []
-        cjk_range = ['4E00', '9FCC']
-        output_array = []
-        for i in range(int(cjk_range[0], 16), int(cjk_range[1], 16)):
-            output_array.append(i)
-        output_string = u''.join(
-            unichr(random.choice(output_array)) for x in xrange(length))
-    elif str_type == "html":
-        html_tag = random.choice(HTML_TAGS).lower()
-        output_string = u'<%s>%s</%s>' % (
-            html_tag, generate_string("alpha", length), html_tag)
-    else:
+    if str_type == "html":
+        return [
+            u'<%s>%s</%s>' % (tag, text, tag)
+            for tag, text in zip(
+                [random.choice(HTML_TAGS).lower() for _ in xrange(count)],
+                generate_strings("alpha", length, count))
+        ]
+
+    characters = STRING_CHARACTERS.get(str_type)
+    if characters is None:
         raise Exception(
             'Unexpected output type, valid types are \"alpha\", \
             \"alphanumeric\", \"html\", \"latin1\", \"numeric\" or \"utf8\".')
-    return unicode(output_string)
+
+    if length <= 0:
+        return [u''] * count
+
+    size = len(characters)
+    rand = random.random
+    text = u''.join([
+        characters[int(rand() * size)] for _ in xrange(length * count)])
+    return [text[start:start + length]
+            for start in xrange(0, len(text), length)]
+
+
+def generate_string(str_type, length):
+    '''
+    This function will allow creation of a wide variety of string types,
+    of arbitrary length.  Presently the unicode strings are CJK-only but
+    should suffice for the purposes of most multibyte testing.
+    '''
+    return generate_strings(str_type, length, 1)[0]
 
 
 def generate_strings_list(len1=8):
@@ -227,23 +233,165 @@ def generate_strings_list(len1=8):
     return str_list
 
 
-def csv_to_dictionary(data):
+class CSVRow(object):
+    """
+    A row of Hammer CLI CSV output with read access like a dictionary.
+
+    All rows of an output share the same header keys and index, a row only
+    holds its values, so large outputs take much less memory than with a
+    dictionary per row. Assigning a key missing from the header stores it
+    aside.
+    """
+    __slots__ = ('_keys', '_index', '_values', '_extra')
+
+    def __init__(self, keys, index, values):
+        self._keys = keys
+        self._index = index
+        # Like zipping the keys and values, extra values are dropped
+        self._values = values[:len(keys)]
+        self._extra = None
+
+    def __getitem__(self, key):
+        position = self._index.get(key)
+        if position is not None and position < len(self._values):
+            return self._values[position]
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        position = self._index.get(key)
+        if position is not None and position < len(self._values):
+            self._values[position] = value
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def get(self, key, default=None):
+        """Returns the value of ``key``, ``default`` if it is missing"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        """Returns the keys of the row"""
+        keys = list(self._keys[:len(self._values)])
+        if self._extra is not None:
+            keys.extend(key for key in self._extra if key not in keys)
+        return keys
+
+    def values(self):
+        """Returns the values of the row"""
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        """Returns the ``(key, value)`` pairs of the row"""
+        return [(key, self[key]) for key in self.keys()]
+
+    def copy(self):
+        """Returns the row as a new dictionary"""
+        return dict(self.items())
+
+    iterkeys = __iter__
+
+    def itervalues(self):
+        return iter(self.values())
+
+    def iteritems(self):
+        return iter(self.items())
+
+    has_key = __contains__
+
+
+collections.Mapping.register(CSVRow)
+
+
+def iter_csv_rows(lines):
     """
-    Converts CSV data from Hammer CLI and returns a python dictionary.
+    Parses CSV data from Hammer CLI, given as an iterable of lines without
+    line endings, and yields its records as CSVRow objects, one by one.
+
+    The data is parsed as RFC 4180 CSV, so quoted fields may contain commas,
+    quotes (doubled) and line breaks.
     """
+    # The csv module only reads byte strings, each record is decoded in one
+    # go, joined with a NUL the module never lets through
+    reader = csv.reader(
+        line.encode('utf-8') + '\n' if isinstance(line, unicode)
+        else line + '\n'
+        for line in lines)
+
+    for headers in reader:
+        if headers:
+            break
+    else:
+        return
+
+    keys = tuple(
+        header.decode('utf-8').replace(' ', '-').lower()
+        for header in headers)
+    index = dict((key, position) for position, key in enumerate(keys))
 
-    records = []
+    for values in reader:
+        if values:
+            yield CSVRow(
+                keys, index, unicode('\0'.join(values), 'utf-8').split(u'\0'))
 
-    items = data
-    headers = items.pop(0)
-    dic_values = [item.split(',') for item in items if len(item) > 0]
 
-    dic_keys = [x.replace(' ', '-').lower() for x in headers.split(',')]
+def csv_to_dictionary(data):
+    """
+    Converts CSV data from Hammer CLI and returns a list of its records,
+    see iter_csv_rows.
+    """
+    return list(iter_csv_rows(data))
 
-    for value in dic_values:
-        records.append(dict(izip(dic_keys, value)))
 
-    return records
+def json_to_dictionary(data):
+    """
+    Converts JSON output from Hammer CLI to python dictionaries (or a list
+    of them), with keys named like csv_to_dictionary and info_dictionary do.
+    Values keep their JSON types.
+    @raise ValueError: if ``data`` is not a JSON document.
+    """
+    return _normalize_json_keys(json.loads(data))
+
+
+def _normalize_json_keys(value):
+    """Lowercases and dashes the keys of all objects in a JSON value"""
+    if isinstance(value, dict):
+        return dict(
+            (key.replace(' ', '-').lower(), _normalize_json_keys(val))
+            for key, val in value.iteritems())
+    if isinstance(value, list):
+        return [_normalize_json_keys(item) for item in value]
+    return value
 
 
 def escape_search(term):
@@ -260,6 +408,33 @@ def sleep_for_seconds(guaranteed_sleep=1):
     time.sleep(random.uniform(guaranteed_sleep, guaranteed_sleep + 1))
 
 
+class WaitTimeOut(Exception):
+    """
+    Exception for conditions not met in time by wait_for
+    """
+    pass
+
+
+def wait_for(predicate, timeout=60, delay=0.1, max_delay=5):
+    """
+    Calls ``predicate`` until it returns a true value and returns the
+    seconds it took. The first call is immediate, then the delay between
+    calls starts at ``delay`` and doubles up to ``max_delay``.
+    @raise WaitTimeOut: if ``predicate`` is still false after ``timeout``
+    seconds.
+    """
+    start = time.time()
+    deadline = start + timeout
+    while not predicate():
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise WaitTimeOut(
+                'Condition not met after %.1f seconds' % timeout)
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+    return time.time() - start
+
+
 def update_dictionary(default, updates):
     """
     Updates default dictionary with elements from
@@ -280,84 +455,131 @@ def update_dictionary(default, updates):
     return default
 
 
+# Patterns used by info_dictionary
+INFO_NUMBERED_VALUE = re.compile(r'\d+\)\s+(.+)$')
+INFO_WHOLE_VALUE = re.compile(r'(.*)$')
+INFO_NUMBERED_KEY = re.compile(r'(\d+)\)')
+INFO_NUMBER = re.compile(r'\d+\)')
+
+# Normalized info_dictionary keys by raw key, so every key is built once
+# and all dictionaries share the same key objects
+_info_keys = {}
+
+
+def _info_key(raw_key):
+    """Returns the info_dictionary key for a raw, left stripped, key"""
+    key = _info_keys.get(raw_key)
+    if key is None:
+        if len(_info_keys) > 10000:
+            _info_keys.clear()
+        key = _info_keys[raw_key] = raw_key.replace(' ', '-').lower()
+    return key
+
+
 def info_dictionary(result):
     """
     Function for converting result to dictionary, from info function in base..
+
+    Output is parsed in a single pass. Top level ``Key: value`` lines become
+    items, ``Key:`` lines start a group of indented sub-properties which is
+    a dictionary, a list of dictionaries when numbered or a list of values
+    for lines without a key:
+
+        Name:     org1
+        Locations:
+         1) loc1
+        Content:
+         1) Repo Name: repo1
+            URL:       /custom/url1
     """
     # info dictionary
     r = {}
     sub_prop = None  # stores name of the last group of sub-properties
-    sub_num = None  # is not None when list of properties
+    sub = None  # container of the sub-properties, a dict or a list
+    numbered = False  # True when list of properties
 
     for line in result.stdout:
         # skip empty lines
         if line == '':
             continue
-        if line.startswith(' '):  # sub-properties are indented
-            # values are separated by ':' or '=>'
-            if line.find(':') != -1:
-                key, value = line.lstrip().split(":", 1)
-            elif line.find('=>') != -1:
-                key, value = line.lstrip().split(" =>", 1)
-            else:
-                key = value = None
-
-            if key is None and value is None:
-                # Parse single attribute collection properties
-                # Template
-                #  1) template1
-                #  2) template2
-                #
-                # or
-                # Template
-                #  template1
-                #  template2
-                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
-
-                if match is None:
-                    match = re.match(r'(.*)$', line.lstrip())
 
+        if line[0] != ' ':
+            numbered = False  # new property implies no sub property
+            key, value = line.lstrip().split(':', 1)
+            key = _info_key(key.lstrip())
+            value = value.lstrip()
+            if value == '':  # 'key:' no value, new sub-property
+                sub_prop = key
+                sub = r[key] = {}
+            else:  # 'key: value' line
+                r[key] = value
+                # may have replaced the sub-properties container
+                sub = None
+            continue
+
+        # sub-properties are indented
+        stripped = line.lstrip()
+        # values are separated by ':' or '=>'
+        if ':' in line:
+            key, value = stripped.split(':', 1)
+        elif '=>' in line:
+            key, value = stripped.split(' =>', 1)
+        else:
+            # Parse single attribute collection properties
+            # Template
+            #  1) template1
+            #  2) template2
+            #
+            # or
+            # Template
+            #  template1
+            #  template2
+            match = None
+            if stripped[:1].isdigit():
+                match = INFO_NUMBERED_VALUE.match(stripped)
+            if match is not None:
                 value = match.group(1)
+            elif '\n' in stripped:
+                value = INFO_WHOLE_VALUE.match(stripped).group(1)
+            else:
+                value = stripped
 
-                if isinstance(r[sub_prop], dict):
-                    r[sub_prop] = []
+            if sub is None:
+                sub = r[sub_prop]
+            if type(sub) is dict:
+                sub = r[sub_prop] = []
+            sub.append(value)
+            continue
 
-                r[sub_prop].append(value)
-            else:
-                # some properties have many numbered values
-                # Example:
-                # Content:
-                #  1) Repo Name: repo1
-                #     URL:       /custom/4f84fc90-9ffa-...
-                #  2) Repo Name: puppet1
-                #     URL:       /custom/4f84fc90-9ffa-...
-                starts_with_number = re.match(r'(\d+)\)', key)
-                if starts_with_number:
-                    sub_num = int(starts_with_number.group(1))
-                    # no. 1) we need to change dict() to list()
-                    if sub_num == 1:
-                        r[sub_prop] = []
-                    # remove number from key
-                    key = re.sub(r'\d+\)', '', key)
-                    # append empty dict to array
-                    r[sub_prop].append({})
-
-                key = key.lstrip().replace(' ', '-').lower()
-
-                # add value to dictionary
-                if sub_num is not None:
-                    r[sub_prop][-1][key] = value.lstrip()
-                else:
-                    r[sub_prop][key] = value.lstrip()
+        # some properties have many numbered values
+        # Example:
+        # Content:
+        #  1) Repo Name: repo1
+        #     URL:       /custom/4f84fc90-9ffa-...
+        #  2) Repo Name: puppet1
+        #     URL:       /custom/4f84fc90-9ffa-...
+        if key[:1].isdigit():
+            match = INFO_NUMBERED_KEY.match(key)
+            if match is not None:
+                numbered = True
+                # no. 1) we need to change dict() to list()
+                if int(match.group(1)) == 1:
+                    sub = r[sub_prop] = []
+                elif sub is None:
+                    sub = r[sub_prop]
+                # remove number from key
+                key = INFO_NUMBER.sub('', key)
+                # append empty dict to array
+                sub.append({})
+
+        if sub is None:
+            sub = r[sub_prop]
+
+        # add value to dictionary
+        if numbered:
+            sub[-1][_info_key(key.lstrip())] = value.lstrip()
         else:
-            sub_num = None  # new property implies no sub property
-            key, value = line.lstrip().split(":", 1)
-            key = key.lstrip().replace(' ', '-').lower()
-            if value.lstrip() == '':  # 'key:' no value, new sub-property
-                sub_prop = key
-                r[sub_prop] = {}
-            else:  # 'key: value' line
-                r[key] = value.lstrip()
+            sub[_info_key(key.lstrip())] = value.lstrip()
 
     # update result
     result.stdout = r
@@ -0,0 +1,321 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Ledger of the entities created by the tests, deleted once they are done.
+
+The factories record every entity they create (robottelo.cli.factory for
+the CLI, ApiCrud.record_create for the API), along with how to delete it
+and the entities it depends on, e.g. the organization of a product. The
+entities are recorded in the innermost open scope: the session, the test
+class or the test. Closing a scope deletes its entities, the entities
+depending on others first, as many at the same time as the shared executor
+has workers.
+
+Cleaning up is enabled with ``cleanup`` in the ``[main]`` section of
+robottelo.properties, set to the finest scope to clean up after: ``test``,
+``class`` or ``session``. The base test classes open and close the scopes.
+Objects a test class keeps for its other tests, in class attributes, are
+cleaned up with the class rather than with the test creating them.
+
+Entities the tests delete themselves are dropped from the ledger, see
+forget. The time cleaning up takes and the entities which could not be
+deleted are reported with the other metrics at the end of the run.
+
+With ``cleanup.ledger_file`` set in the ``[main]`` section, the entities
+are also written to that file as they are created and deleted, whether
+cleaning up is enabled or not, so robottelo.common.orphans can delete
+those left behind by interrupted runs.
+"""
+
+import atexit
+import json
+import logging
+import threading
+import time
+
+from contextlib import contextmanager
+from robottelo.common import concurrency, conf, metrics
+
+# Scopes from the coarsest to the finest
+SCOPES = ('session', 'class', 'test')
+
+logger = logging.getLogger("robottelo")
+
+_lock = threading.Lock()
+_file_lock = threading.Lock()
+_local = threading.local()
+
+
+class Entry(object):
+    """
+    A recorded entity: its name for reports, the function deleting it and
+    the entries of the entities it depends on.
+    """
+
+    def __init__(self, name, delete, dependencies=(), obj=None, key=None,
+                 ref=None):
+        self.name = name
+        self.delete = delete
+        self.dependencies = list(dependencies)
+        self.obj = obj
+        self.key = key
+        self.ref = ref
+        self.scope = None
+
+    def __repr__(self):
+        return '<Entry %s>' % self.name
+
+
+class Scope(object):
+    """The entries recorded while a session, class or test ran"""
+
+    def __init__(self, name):
+        self.name = name
+        self.entries = []
+
+    def __repr__(self):
+        return '<Scope %s: %d entries>' % (self.name, len(self.entries))
+
+
+session = Scope('session')
+_scopes = [session]
+_keys = {}
+_objects = {}
+
+
+def enabled(scope_name='session'):
+    """Tells whether the entities are cleaned up after ``scope_name``"""
+    granularity = conf.properties.get('main.cleanup')
+    if granularity not in SCOPES:
+        return False
+    return SCOPES.index(scope_name) <= SCOPES.index(granularity)
+
+
+def recording():
+    """
+    Tells whether the new entities are recorded, for cleaning up or in the
+    ledger file.
+    """
+    return enabled() or bool(conf.properties.get('main.cleanup.ledger_file'))
+
+
+def record(name, delete, dependencies=(), obj=None, key=None, ref=None):
+    """
+    Records a new entity in the current scope and returns its entry, or
+    None when nothing is recorded.
+
+    ``key`` identifies the entity for find, e.g. ``('cli', 'Org', u'1')``,
+    and ``obj`` is the object the factory returned for it, see promote.
+    ``ref`` is a dictionary telling how to delete the entity from another
+    process, see robottelo.common.orphans. Entities with both a key and a
+    ref are written to the ledger file.
+
+    Without cleaning up, the entity is only written to the ledger file: the
+    entry is not kept in any scope, and only its key is kept for the entries
+    depending on it.
+    """
+    if not recording():
+        return None
+    entry = Entry(
+        name, delete, [dep for dep in dependencies if dep], obj, key, ref)
+    if not enabled():
+        if key is not None:
+            with _lock:
+                _keys[key] = Entry(name, None, key=key, ref=ref)
+        write(conf.properties.get('main.cleanup.ledger_file'), 'created',
+              entry)
+        return entry
+    with _lock:
+        entry.scope = getattr(_local, 'scope', None) or _scopes[-1]
+        entry.scope.entries.append(entry)
+        if key is not None:
+            _keys[key] = entry
+        if obj is not None:
+            _objects[id(obj)] = entry
+    write(conf.properties.get('main.cleanup.ledger_file'), 'created', entry)
+    return entry
+
+
+def write(path, event, entry):
+    """
+    Appends the ``event`` of ``entry``, ``created`` or ``deleted``, to the
+    ledger file ``path`` as a line of JSON.
+    """
+    if not path or entry.key is None or entry.ref is None:
+        return
+    line = {'event': event, 'key': entry.key}
+    if event == 'created':
+        line.update({
+            'name': entry.name,
+            'ref': entry.ref,
+            'dependencies': [
+                dependency.key for dependency in entry.dependencies
+                if dependency.key is not None],
+        })
+    with _file_lock:
+        with open(path, 'a') as handle:
+            handle.write(json.dumps(line) + '\n')
+
+
+def find(key):
+    """Returns the entry recorded with ``key``, None if there is none"""
+    with _lock:
+        return _keys.get(key)
+
+
+def forget(key):
+    """
+    Drops the entry recorded with ``key``, of an entity the tests deleted
+    themselves, so it is not deleted again, and writes its deletion to the
+    ledger file. Returns the entry, None if there is none.
+    """
+    with _lock:
+        entry = _keys.pop(key, None)
+        if entry is None:
+            return None
+        if entry.scope is not None:
+            entry.scope.entries.remove(entry)
+            entry.scope = None
+        if entry.obj is not None:
+            _objects.pop(id(entry.obj), None)
+    write(conf.properties.get('main.cleanup.ledger_file'), 'deleted', entry)
+    return entry
+
+
+def open_scope(scope_name):
+    """
+    Opens a scope, where the entities created from now on are recorded.
+    Returns None when there is no cleaning up after ``scope_name``.
+    """
+    if scope_name == 'session' or not enabled(scope_name):
+        return None
+    scope = Scope(scope_name)
+    with _lock:
+        _scopes.append(scope)
+    return scope
+
+
+def close_scope(scope, keep=()):
+    """
+    Closes a scope opened by open_scope and deletes its entities, except
+    the objects of ``keep`` (and the entities they depend on), which are
+    moved to the enclosing scope. Returns the entries which could not be
+    deleted.
+    """
+    if scope is None or scope not in _scopes:
+        return []
+    with _lock:
+        index = _scopes.index(scope)
+        del _scopes[index]
+        parent = _scopes[index - 1]
+    promote(keep, parent)
+    return cleanup(scope)
+
+
+def promote(objects, scope=None):
+    """
+    Moves the entries of the objects and of the entities they depend on to
+    ``scope``, the session by default, unless they are there already.
+    """
+    scope = scope or session
+    with _lock:
+        pending = [
+            _objects[id(obj)] for obj in objects if id(obj) in _objects]
+        while pending:
+            entry = pending.pop()
+            if entry.scope is scope or entry.scope is None:
+                continue
+            if SCOPES.index(entry.scope.name) < SCOPES.index(scope.name):
+                # Already in a scope lasting longer
+                continue
+            entry.scope.entries.remove(entry)
+            entry.scope = scope
+            scope.entries.append(entry)
+            pending.extend(entry.dependencies)
+
+
+@contextmanager
+def using(scope):
+    """
+    Records the entities created in the current thread in ``scope`` within
+    the block, whatever the current scope is.
+    """
+    previous = getattr(_local, 'scope', None)
+    _local.scope = scope
+    try:
+        yield
+    finally:
+        _local.scope = previous
+
+
+def deletion_levels(entries):
+    """
+    Returns the entries grouped in levels, each entry coming before the
+    entries it depends on. Dependencies on entries outside ``entries`` are
+    ignored.
+    """
+    order = dict((entry, index) for index, entry in enumerate(entries))
+    remaining = set(entries)
+    levels = []
+    while remaining:
+        needed = set(
+            dependency for entry in remaining
+            for dependency in entry.dependencies if dependency is not entry)
+        level = [entry for entry in remaining if entry not in needed]
+        if not level:
+            # Circular dependencies, should not happen
+            level = list(remaining)
+        # In the order they were created, the latest first
+        level.sort(key=order.get, reverse=True)
+        levels.append(level)
+        remaining.difference_update(level)
+    return levels
+
+
+def cleanup(scope):
+    """
+    Deletes the entities of ``scope`` level by level (see deletion_levels),
+    the entities of each level concurrently, and returns the entries which
+    could not be deleted.
+    """
+    with _lock:
+        entries = list(scope.entries)
+        del scope.entries[:]
+        for entry in entries:
+            entry.scope = None
+            if entry.key is not None and _keys.get(entry.key) is entry:
+                del _keys[entry.key]
+            if entry.obj is not None:
+                _objects.pop(id(entry.obj), None)
+    if not entries:
+        return []
+
+    start = time.time()
+    failed = []
+    for level in deletion_levels(entries):
+        futures = [concurrency.submit(entry.delete) for entry in level]
+        for entry, future in zip(level, futures):
+            try:
+                future.result()
+            except Exception, e:
+                failed.append(entry)
+                metrics.increment('cleanup.failed')
+                logger.warning('Could not delete %s: %s' % (entry.name, e))
+            else:
+                metrics.increment('cleanup.deleted')
+                write(
+                    conf.properties.get('main.cleanup.ledger_file'),
+                    'deleted', entry)
+
+    metrics.record('cleanup.%s' % scope.name, time.time() - start)
+    return failed
+
+
+def _close_session():
+    """Deletes the entities left at the end of the run"""
+    if enabled():
+        cleanup(session)
+
+
+atexit.register(_close_session)
@@ -0,0 +1,75 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Process wide counters and timings, reported to the robottelo log when the
+test run ends.
+
+Names are dotted, their last part usually being the entity the metric is
+about, e.g. ``cli.create.Org``.
+"""
+
+import atexit
+import logging
+import threading
+
+from robottelo.common.benchmark import format_summary, summarize
+
+_counters = {}
+_timings = {}
+_lock = threading.Lock()
+
+
+def increment(name, value=1):
+    """Adds ``value`` to the counter ``name``"""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def record(name, seconds):
+    """Records a duration, in seconds, for the timing ``name``"""
+    with _lock:
+        _timings.setdefault(name, []).append(seconds)
+
+
+def counter(name):
+    """Returns the current value of the counter ``name``"""
+    with _lock:
+        return _counters.get(name, 0)
+
+
+def timings(name):
+    """Returns a copy of the durations recorded for the timing ``name``"""
+    with _lock:
+        return list(_timings.get(name, []))
+
+
+def reset():
+    """Forgets all counters and timings"""
+    with _lock:
+        _counters.clear()
+        _timings.clear()
+
+
+def report():
+    """Returns the lines of a report of all counters and timings"""
+    with _lock:
+        counters = sorted(_counters.items())
+        durations = sorted(_timings.items())
+
+    lines = [u'%-30s %d' % (name, value) for name, value in counters]
+    lines.extend(
+        format_summary(name, summarize(values))
+        for name, values in durations)
+    return lines
+
+
+def _log_report():
+    """Logs the report when there is something to report"""
+    lines = report()
+    if lines:
+        logging.getLogger('robottelo').info(
+            'Metrics:\n  %s' % '\n  '.join(lines))
+
+
+atexit.register(_log_report)
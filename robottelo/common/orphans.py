@@ -0,0 +1,272 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Deletes the test data left behind on a server by interrupted runs.
+
+The leftover entities are found either in a ledger file, written by the
+test runs with ``cleanup.ledger_file`` set in the ``[main]`` section of
+robottelo.properties (see robottelo.common.ledger), or by their names
+matching a regular expression given with ``--marker``, among the entities
+of the kinds the cli factories create. The marker defaults to the names
+starting with ``data.name_prefix`` of the ``[main]`` section, which the
+factories give their objects (see robottelo.cli.factory.mark_names). It
+must be specific to the test data: the built-in and default entities
+(PROTECTED), and the entities of the kinds the server seeds (SEEDED), are
+never matched, but any other entity whose name matches is.
+
+Nothing is deleted without ``--delete``, the entities which would be are
+only listed::
+
+    $ python -m robottelo.common.orphans --ledger robottelo-ledger.jsonl
+    $ python -m robottelo.common.orphans --marker '^robottelo_' --delete
+
+Entities are deleted before the entities they depend on, as many at the
+same time as the shared executor has workers. The ledger file is rewritten
+with the entities which could not be deleted, so it must not be collected
+while tests are writing to it.
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import re
+import sys
+
+from robottelo.cli.activationkey import ActivationKey
+from robottelo.cli.architecture import Architecture
+from robottelo.cli.computeresource import ComputeResource
+from robottelo.cli.contenthost import ContentHost
+from robottelo.cli.contentview import ContentView
+from robottelo.cli.domain import Domain
+from robottelo.cli.environment import Environment
+from robottelo.cli.factory import delete_object
+from robottelo.cli.gpgkey import GPGKey
+from robottelo.cli.hostcollection import HostCollection
+from robottelo.cli.hostgroup import HostGroup
+from robottelo.cli.lifecycleenvironment import LifecycleEnvironment
+from robottelo.cli.medium import Medium
+from robottelo.cli.model import Model
+from robottelo.cli.operatingsys import OperatingSys
+from robottelo.cli.org import Org
+from robottelo.cli.partitiontable import PartitionTable
+from robottelo.cli.product import Product
+from robottelo.cli.proxy import Proxy
+from robottelo.cli.repository import Repository
+from robottelo.cli.subnet import Subnet
+from robottelo.cli.syncplan import SyncPlan
+from robottelo.cli.template import Template
+from robottelo.cli.user import User
+from robottelo.common import conf, ledger
+from robottelo.common.constants import DEFAULT_ORG, ENVIRONMENT
+
+logger = logging.getLogger("robottelo")
+
+# Kinds of entities, the entities depending on others first, with whether
+# they are listed per organization
+KINDS = (
+    (ContentHost, True),
+    (ActivationKey, True),
+    (HostCollection, True),
+    (ContentView, True),
+    (Repository, True),
+    (Product, True),
+    (SyncPlan, True),
+    (GPGKey, True),
+    (LifecycleEnvironment, True),
+    (HostGroup, False),
+    (Subnet, False),
+    (Domain, False),
+    (Medium, False),
+    (PartitionTable, False),
+    (Template, False),
+    (OperatingSys, False),
+    (Architecture, False),
+    (Model, False),
+    (ComputeResource, False),
+    (Environment, False),
+    (Proxy, False),
+    (User, False),
+    (Org, False),
+)
+
+CLI_CLASSES = dict((cli.__name__, cli) for cli, _ in KINDS)
+
+# Names of the built-in and default entities, by kind, never deleted
+PROTECTED = {
+    'ContentView': (u'Default Organization View',),
+    'LifecycleEnvironment': (ENVIRONMENT,),
+    'Org': (u'Default Organization', DEFAULT_ORG),
+    'User': (u'admin', conf.properties.get('foreman.admin.username')),
+}
+
+# Kinds of entities the server is seeded with or manages itself, e.g. the
+# architectures, operating systems or puppet environments of content views,
+# only deleted through the ledger file
+SEEDED = (
+    Architecture, Domain, Environment, Medium, OperatingSys, PartitionTable,
+    Proxy, Subnet, Template)
+
+
+def read_ledger(path):
+    """
+    Returns the entries of the entities created and not deleted according
+    to the ledger file ``path``, with their dependencies, in the order they
+    were created.
+    """
+    created = {}
+    order = {}
+    with open(path) as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            key = tuple(event['key'])
+            if event['event'] == 'created':
+                created[key] = event
+                order.setdefault(key, len(order))
+            else:
+                created.pop(key, None)
+
+    entries = {}
+    for key, event in created.items():
+        entries[key] = ledger.Entry(
+            event['name'], _delete(event['ref']), key=key, ref=event['ref'])
+    for key, entry in entries.items():
+        entry.dependencies = [
+            entries[tuple(dependency)]
+            for dependency in created[key]['dependencies']
+            if tuple(dependency) in entries]
+    return sorted(entries.values(), key=lambda entry: order[entry.key])
+
+
+def _delete(ref):
+    """Returns a function deleting the entity ``ref`` refers to"""
+    if 'cli' in ref:
+        return lambda: delete_object(CLI_CLASSES[ref['cli']], ref['options'])
+
+    module, name = ref['api'].split(':')
+    api = getattr(importlib.import_module(module), name)
+
+    def delete():
+        response = api.delete(ref['id'], **dict(ref['path_args']))
+        if not response.ok:
+            raise Exception(
+                'Failed to delete %s %s: %s %s' % (
+                    name, ref['id'], response.status_code,
+                    response.content))
+    return delete
+
+
+def write_ledger(path, entries):
+    """Rewrites the ledger file ``path`` with the entries only"""
+    temporary = '%s.%d' % (path, os.getpid())
+    open(temporary, 'w').close()
+    for entry in entries:
+        ledger.write(temporary, 'created', entry)
+    os.rename(temporary, path)
+
+
+def find_marked(marker):
+    """
+    Returns the entries of the entities whose names match the regular
+    expression ``marker``, by kind, the entities depending on others first.
+    """
+    pattern = re.compile(marker)
+    result = Org.list()
+    if result.return_code != 0:
+        raise Exception(
+            'Could not list the organizations: %s' % result.stderr)
+    org_ids = [org['id'] for org in result.stdout]
+    kinds = [(cli, per_org) for cli, per_org in KINDS if cli not in SEEDED]
+
+    listings = []
+    for cli, per_org in kinds:
+        options_list = [{u'organization-id': org_id} for org_id in org_ids]
+        if not per_org:
+            options_list = [{}]
+        listings.append([
+            (options, cli.list_async(options)) for options in options_list])
+
+    found = []
+    for (cli, _), listing in zip(kinds, listings):
+        protected = PROTECTED.get(cli.__name__, ())
+        entries = []
+        for list_options, future in listing:
+            result = future.result()
+            if result.return_code != 0:
+                logger.warning(
+                    'Could not list %s %s: %s' %
+                    (cli.__name__, list_options, result.stderr))
+                continue
+            for row in result.stdout:
+                # Users are named after their login
+                name = row.get('login') or row.get('name') or u''
+                if (name in protected or row.get('name') in protected or
+                        not pattern.search(name)):
+                    continue
+                options = {u'id': row['id']}
+                if cli._requires_org(u'delete'):
+                    options.update(list_options)
+                ref = {'cli': cli.__name__, 'options': options}
+                entries.append(ledger.Entry(
+                    u'%s %s (%s)' % (cli.__name__, row['id'], name),
+                    _delete(ref), key=('cli', cli.__name__, row['id']),
+                    ref=ref))
+        found.append(entries)
+    return found
+
+
+def collect(entries, delete=False):
+    """
+    Lists the entities of the entries and with ``delete`` deletes them, see
+    ledger.cleanup. Returns the entries which could not be deleted.
+    """
+    for entry in entries:
+        logger.info('%s %s' % ('Deleting' if delete else 'Found', entry.name))
+    if not delete:
+        return []
+    scope = ledger.Scope('orphans')
+    scope.entries.extend(entries)
+    return ledger.cleanup(scope)
+
+
+def main(argv=None):
+    """Deletes the entities of a ledger file or matching a marker"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        '--ledger', default=conf.properties.get('main.cleanup.ledger_file'),
+        help='ledger file of the test runs, default: %(default)s')
+    prefix = conf.properties.get('main.data.name_prefix')
+    parser.add_argument(
+        '--marker', default='^' + re.escape(prefix) if prefix else None,
+        help='regular expression matching the names of the test data only, '
+             'default: %(default)s')
+    parser.add_argument(
+        '--delete', action='store_true',
+        help='delete the entities, otherwise they are only listed')
+    args = parser.parse_args(argv)
+    if not args.ledger and not args.marker:
+        parser.error('Either a ledger file or a marker is required')
+    if args.marker is not None and re.search(args.marker, u''):
+        parser.error('The marker must not match empty names')
+
+    failed = []
+    if args.ledger and os.path.exists(args.ledger):
+        failed_entries = collect(read_ledger(args.ledger), args.delete)
+        if args.delete:
+            write_ledger(args.ledger, failed_entries)
+        failed.extend(failed_entries)
+    if args.marker:
+        for entries in find_marked(args.marker):
+            failed.extend(collect(entries, args.delete))
+
+    if failed:
+        logger.error('Could not delete %d entities' % len(failed))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,10 +2,11 @@
 """Records class definition with its options and metaclass"""
 
 import copy
+import operator
 import random
-import itertools
 
 from robottelo.common import conf
+from robottelo.common.records.covering import covering_array
 from robottelo.common.records.fields import Field
 from robottelo.common.records.fields import evaluate_choice
 
@@ -20,6 +21,32 @@ def create_choice(enum, fields):
     return d
 
 
+def _enumerated_choice(names, choices, index, matrix):
+    """Returns the field values of the record ``index`` of an enumeration.
+
+    With ``matrix`` the records are every combination of the choices, the
+    index being decoded like a number whose digits are the positions in
+    each list of choices, the last changing the fastest. Otherwise the
+    records set a single field, each choice of each field in turn.
+    >>> _enumerated_choice(["a", "b"], [[1, 2], [3, 4, 5]], 4, True)
+    {'a': 2, 'b': 4}
+    >>> _enumerated_choice(["a", "b"], [[1, 2], [3, 4, 5]], 4, False)
+    {'b': 5}
+    """
+    if matrix:
+        chosen = []
+        for values in reversed(choices):
+            index, position = divmod(index, len(values))
+            chosen.append(values[position])
+        return dict(zip(names, reversed(chosen)))
+
+    for name, values in zip(names, choices):
+        if index < len(values):
+            return {name: values[index]}
+        index -= len(values)
+    raise IndexError('record index out of range')
+
+
 class FieldsOpts(object):
     """
     Fields class for the Options meta information in Records
@@ -198,7 +225,10 @@ class Record(object):
         I.e, most of the time, we might have tests with MATRIX=False,
         that results in sum(len(choices) for choices in choice_types),
         while with MATRIX=True it results in
-        product(len(choices) for choices in choice_types)
+        product(len(choices) for choices in choice_types).
+        With MATRIX="pairwise" (or main.matrix=pairwise) every pair of items
+        of any two choice fields is represented, which takes far fewer
+        records than every combination, see covering.covering_array.
         >>> from robottelo.common.records.base import Record
         >>> from robottelo.common.records import ChoiceField
         >>> class test(Record):
@@ -211,6 +241,8 @@ class Record(object):
         12
         >>> len(test.enumerate(MATRIX=True))
         81
+        >>> len(test.enumerate(MATRIX="pairwise"))
+        10
 
         Now for some more concrete examples:
         >>> from robottelo.common.records.base import Record
@@ -233,10 +265,36 @@ class Record(object):
         [('n1', 'preset'), ('n2', 'preset')]
         """
 
+        return list(cls.iter_enumerate(*args, **kwargs))
+
+    @classmethod
+    def iter_enumerate(cls, *args, **kwargs):
+        """Like enumerate, but yields the records one by one, creating
+        each only when it is needed.
+
+        The records are picked by their index in the enumeration, so
+        sampling never builds the combinations nor the records left out.
+        Besides MATRIX=0, which picks a single record at random,
+        SAMPLE=n yields n distinct records picked at random.
+        >>> from robottelo.common.records.base import Record
+        >>> from robottelo.common.records import ChoiceField
+        >>> class test(Record):
+        ...      name = ChoiceField(["n1","n2","n3"])
+        ...      desc = ChoiceField(["d1","d2","d3"])
+        ...
+        >>> records = test.iter_enumerate(MATRIX=2)
+        >>> [(t.name,t.desc) for t, _ in zip(records, range(4))]
+        [('n1', 'd1'), ('n1', 'd2'), ('n1', 'd3'), ('n2', 'd1')]
+        >>> len(list(test.iter_enumerate(MATRIX=2, SAMPLE=5)))
+        5
+        """
+
         conf.properties.setdefault("main.matrix", 1)
         matrix_conf = conf.properties["main.matrix"]
         matrix = kwargs.pop("MATRIX") if "MATRIX" in kwargs else matrix_conf
-        matrix = int(matrix)
+        pairwise = str(matrix).lower() == "pairwise"
+        matrix = 2 if pairwise else int(matrix)
+        sample = kwargs.pop("SAMPLE", None)
 
         fnames = [f.name for f in iter(cls._meta.fields)]
         fields = dict(zip(fnames, args))
@@ -258,28 +316,36 @@ class Record(object):
             (not isinstance(v, Field) or not v.enumerable)
             )
 
-        e2 = []
-
-        if matrix > 1:
-            e2 = [
-                dict(zip(enumerated.keys(), y))
-                for y in [x for x in itertools.product(*enumerated.values())]
-                ]
+        names = enumerated.keys()
+        choices = [list(enumerated[name]) for name in names]
+        sizes = [len(values) for values in choices]
+
+        if pairwise:
+            # Every pair of choices of any two fields
+            rows = covering_array(sizes)
+            total = len(rows)
+        elif matrix > 1:
+            # Every combination, in the order of itertools.product
+            total = reduce(operator.mul, sizes, 1)
         else:
-            e2 = [
-                {k: v} for k, v in
-                itertools.chain(*[
-                    [(k, v) for v in vx]
-                    for k, vx in enumerated.items()])
-                ]
+            # Every choice once, the other fields being left to generate
+            total = sum(sizes)
 
         if matrix == 0:
-            chosen = [random.choice(
-                [cls(**create_choice(enum, fields)) for enum in e2]
-                )]
-            return chosen
+            indices = [random.choice(xrange(total))]
+        elif sample is not None:
+            indices = random.sample(xrange(total), min(int(sample), total))
         else:
-            return [cls(**create_choice(enum, fields)) for enum in e2]
+            indices = xrange(total)
+
+        for index in indices:
+            if pairwise:
+                enum = dict(zip(names, [
+                    values[position]
+                    for values, position in zip(choices, rows[index])]))
+            else:
+                enum = _enumerated_choice(names, choices, index, matrix > 1)
+            yield cls(**create_choice(enum, fields))
 
     def __init__(self, *args, **kwargs):
         """Constructs record based on its definition.
@@ -0,0 +1,119 @@
+"""
+Covering arrays for enumerating records
+
+A covering array of strength t is a list of rows, one value per parameter,
+such that every combination of values of any t parameters appears in at
+least one row. With t=2 (pairwise) it takes a few dozen rows where the
+full product of six parameters of six values takes 46656.
+
+The arrays are built with the IPOG strategy (Lei et al., "IPOG: A General
+Strategy for T-Way Software Testing"): start with the full product of the
+first t parameters, then add the parameters one by one, first extending
+the existing rows with the values covering the most missing combinations
+(horizontal growth), then adding rows for the combinations still missing
+(vertical growth). The construction is deterministic, so the same
+parameters always give the same rows.
+"""
+
+import itertools
+
+
+def covering_array(sizes, strength=2):
+    """
+    Returns the rows of a covering array for parameters taking ``sizes``
+    values each: lists of value indices, one per parameter, in the order
+    of ``sizes``.
+
+    >>> covering_array([2, 2])
+    [[0, 0], [0, 1], [1, 0], [1, 1]]
+    >>> len(covering_array([2, 2, 2, 2]))
+    6
+    >>> covering_array([])
+    [[]]
+    """
+    if not sizes:
+        # The empty row covers the combinations of no parameters
+        return [[]]
+    if 0 in sizes:
+        return []
+    strength = min(strength, len(sizes))
+
+    # Larger parameters first give smaller arrays
+    order = sorted(range(len(sizes)), key=lambda index: -sizes[index])
+    ordered = [sizes[index] for index in order]
+
+    rows = [list(values) for values in itertools.product(
+        *[range(size) for size in ordered[:strength]])]
+
+    for column in range(strength, len(ordered)):
+        missing = _missing(ordered, column, strength)
+        _grow_horizontally(rows, ordered[column], column, missing)
+        _grow_vertically(rows, column, missing)
+
+    # Back to the order of sizes, unset values taking the first value of
+    # their parameter
+    positions = [order.index(index) for index in range(len(sizes))]
+    return [
+        [row[position] or 0 for position in positions]
+        for row in rows]
+
+
+def _missing(sizes, column, strength):
+    """
+    Returns the set of the combinations involving ``column`` and
+    ``strength - 1`` of the previous parameters, as ``(columns, values)``
+    tuples, ``column`` being the last of ``columns``.
+    """
+    missing = set()
+    for columns in itertools.combinations(range(column), strength - 1):
+        for values in itertools.product(
+                *[range(sizes[index]) for index in columns + (column,)]):
+            missing.add((columns + (column,), values))
+    return missing
+
+
+def _covered(row, columns):
+    """Returns the values of the row at ``columns``, None if any is unset"""
+    values = tuple(row[index] for index in columns)
+    return None if None in values else values
+
+
+def _grow_horizontally(rows, size, column, missing):
+    """
+    Sets the value of ``column`` of every row, choosing for each the value
+    covering the most missing combinations.
+    """
+    combinations = set(columns for columns, _ in missing)
+
+    for row in rows:
+        best_value, best_covered = 0, None
+        for value in range(size):
+            row.append(value)
+            covered = set()
+            for columns in combinations:
+                values = _covered(row, columns)
+                if values is not None and (columns, values) in missing:
+                    covered.add((columns, values))
+            row.pop()
+            if best_covered is None or len(covered) > len(best_covered):
+                best_value, best_covered = value, covered
+        row.append(best_value)
+        missing.difference_update(best_covered)
+
+
+def _grow_vertically(rows, column, missing):
+    """
+    Covers the combinations still missing, setting the unset values of
+    rows added by a previous vertical growth or adding new rows.
+    """
+    width = column + 1
+    for columns, values in sorted(missing):
+        for row in rows:
+            if all(row[index] in (None, value)
+                   for index, value in zip(columns, values)):
+                break
+        else:
+            row = [None] * width
+            rows.append(row)
+        for index, value in zip(columns, values):
+            row[index] = value
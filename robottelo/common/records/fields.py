@@ -12,13 +12,13 @@ generated. Once you've created an instance of an IntegerField, subsequent
 object creations will follow the same range determined previously.
 """
 
-import rstr
 import collections
 
 from random import randint, choice
 from robottelo.common.helpers import (
     generate_mac, generate_string, generate_ipaddr, generate_email_address)
 from robottelo.common.helpers import STR
+from robottelo.common.records.xeger import compile_xeger
 
 
 def evaluate_choice(chosen):
@@ -128,8 +128,9 @@ class StringField(Field):
         * xeger: generates a random string based on a regex specified on the
           format field attribute. The default value is r'{record_name}_\d\d\d'.
           The {record_name} is a placeholder that will be replaced by the
-          record class name. This str_type uses the rstr.xeger method which
-          allows users to create a random string from a regular expression.
+          record class name. This str_type generates the string like the
+          rstr.xeger method, which creates a random string from a regular
+          expression, parsing the regular expression only once.
           For example, to generate a Canadian postal code, define the format
           as  r'[A-Z]\d[A-Z] \d[A-Z]\d' which would generate u'R6M 1W5'
         * alphanumeric: randomly generates alphanumeric strings
@@ -151,6 +152,10 @@ class StringField(Field):
         self.format = format
         self.maxlen = maxlen
         self.str_type = str_type
+        # Compiled generator of the format and the pattern it was compiled
+        # from, see compile_xeger
+        self._xeger = None
+        self._xeger_pattern = None
 
     def _parse_field_format(self, fmt):
         """Replaces the expected placeholders with its value"""
@@ -158,9 +163,13 @@ class StringField(Field):
 
     def generate(self):
         if self.str_type == 'xeger':
-            if '{' in self.format:
-                self.format = self._parse_field_format(self.format)
-            return rstr.xeger(self.format)[:self.maxlen]
+            pattern = self.format
+            if '{' in pattern:
+                pattern = self._parse_field_format(pattern)
+            if pattern != self._xeger_pattern:
+                self._xeger = compile_xeger(pattern)
+                self._xeger_pattern = pattern
+            return self._xeger()[:self.maxlen]
         else:
             return generate_string(self.str_type, self.maxlen)
 
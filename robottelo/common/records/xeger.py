@@ -0,0 +1,162 @@
+"""
+Compiled random string generators for regular expressions
+
+rstr.xeger parses its regular expression every time it is called. Records
+generate their string fields with it on every instantiation, so the
+patterns are compiled here once into a tree of generator functions, which
+are kept in a LRU cache shared by all the fields using the same pattern.
+
+The generators draw from the random module exactly like rstr.xeger does,
+so both give the same strings for the same random state.
+"""
+
+import random
+import string
+import sre_parse
+import threading
+
+from collections import OrderedDict
+from rstr.rstr_base import ALPHABETS
+from rstr.xeger import STAR_PLUS_LIMIT
+
+# Number of compiled patterns kept in the cache
+CACHE_SIZE = 128
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+_CATEGORIES = {
+    'category_digit': ALPHABETS['digits'],
+    'category_not_digit': ALPHABETS['nondigits'],
+    'category_space': ALPHABETS['whitespace'],
+    'category_not_space': ALPHABETS['nonwhitespace'],
+    'category_word': ALPHABETS['word'],
+    'category_not_word': ALPHABETS['nonword'],
+}
+
+# Characters matched by "." (except new lines)
+_ANY = [char for char in string.printable if char != '\n']
+
+
+def compile_xeger(pattern):
+    """
+    Returns a function generating random strings matching ``pattern``, from
+    the cache when it was compiled already.
+    """
+    with _cache_lock:
+        generator = _cache.pop(pattern, None)
+        if generator is None:
+            generator = _compile(pattern)
+            if len(_cache) >= CACHE_SIZE:
+                _cache.popitem(last=False)
+        # Most recently used last
+        _cache[pattern] = generator
+    return generator
+
+
+def xeger(pattern):
+    """Generates a random string matching ``pattern``, like rstr.xeger"""
+    return compile_xeger(pattern)()
+
+
+def _compile(pattern):
+    """Compiles ``pattern`` into a random string generator"""
+    parts = _compile_sequence(sre_parse.parse(pattern))
+
+    def generate():
+        # Values of the groups, for back references
+        groups = {}
+        return ''.join([part(groups) for part in parts])
+    return generate
+
+
+def _compile_sequence(states):
+    """Compiles the parsed states into a list of generators"""
+    return [_compile_state(opcode, value) for opcode, value in states]
+
+
+def _join(parts, groups):
+    """Generates and joins the strings of several generators"""
+    return ''.join([part(groups) for part in parts])
+
+
+def _constant(value):
+    """Returns a generator of ``value``"""
+    return lambda groups: value
+
+
+def _compile_state(opcode, value):
+    """Compiles a parsed state into a generator"""
+    opcode = str(opcode).lower()
+
+    if opcode == 'literal':
+        return _constant(unichr(value))
+    if opcode == 'not_literal':
+        candidates = string.printable.replace(unichr(value), '')
+        return lambda groups: random.choice(candidates)
+    if opcode in ('at', 'assert_not'):
+        return _constant('')
+    if opcode == 'in':
+        candidates = _in_candidates(value)
+        return lambda groups: random.choice(candidates)
+    if opcode == 'any':
+        return lambda groups: random.choice(_ANY)
+    if opcode == 'category':
+        # Only in "in" states, see _in_candidates
+        return _constant(_CATEGORIES[value])
+    if opcode == 'branch':
+        branches = [_compile_sequence(branch) for branch in value[1]]
+        return lambda groups: _join(random.choice(branches), groups)
+    if opcode == 'subpattern':
+        return _compile_group(value[0], _compile_sequence(value[-1]))
+    if opcode == 'assert':
+        parts = _compile_sequence(value[1])
+        return lambda groups: _join(parts, groups)
+    if opcode == 'groupref':
+        return lambda groups: groups[value]
+    if opcode in ('min_repeat', 'max_repeat'):
+        start, end, states = value
+        return _compile_repeat(
+            start, min(end, STAR_PLUS_LIMIT), _compile_sequence(states))
+    raise ValueError('Unsupported regular expression: %s' % opcode)
+
+
+def _compile_group(group, parts):
+    """Compiles a group, remembering its value when it is numbered"""
+    def generate(groups):
+        result = _join(parts, groups)
+        if group:
+            groups[group] = result
+        return result
+    return generate
+
+
+def _compile_repeat(start, end, parts):
+    """Compiles a repeat of ``start`` to ``end`` times"""
+    def generate(groups):
+        return ''.join([
+            _join(parts, groups)
+            for _ in xrange(random.randint(start, end))])
+    return generate
+
+
+def _in_candidates(states):
+    """Returns the list of characters matched by a "in" state"""
+    candidates = []
+    for opcode, value in states:
+        opcode = str(opcode).lower()
+        if opcode == 'negate':
+            candidates.append(False)
+        elif opcode == 'literal':
+            candidates.append(unichr(value))
+        elif opcode == 'range':
+            candidates.extend(
+                unichr(code) for code in range(value[0], value[1] + 1))
+        elif opcode == 'category':
+            candidates.extend(_CATEGORIES[value])
+        else:
+            raise ValueError('Unsupported regular expression: %s' % opcode)
+
+    if candidates and candidates[0] is False:
+        return list(set(string.printable).difference(candidates[1:]))
+    return candidates
@@ -1,17 +1,20 @@
 """
-Utility module to handle the shared ssh connection
+Utility module to handle the shared ssh connection pools
 """
 
+import codecs
 import logging
 import re
 import socket
 import sys
+import threading
 import time
+import uuid
 
+from contextlib import contextmanager
 from robottelo.common import conf
-from robottelo.common.constants import SSH_CHANNEL_READY_TIMEOUT
-from robottelo.common.helpers import csv_to_dictionary
-from robottelo.common.helpers import sleep_for_seconds
+from robottelo.common.helpers import (
+    csv_to_dictionary, iter_csv_rows, json_to_dictionary)
 from select import select
 
 try:
@@ -21,6 +24,24 @@ except ImportError:
     sys.exit(-1)
 
 
+# Maximum number of bytes read from a channel at once
+BUFFER_SIZE = 65536
+
+# Script step of command_batch: runs a command in a subshell and marks the
+# end of its output on both streams
+BATCH_STEP = (
+    "(\n%(cmd)s\n)\n"
+    "printf '\\n%(token)s %(index)d %%d\\n' $?\n"
+    "printf '\\n%(token)s %(index)d\\n' >&2"
+)
+
+# Escape codes for colors displayed in the output
+COLOR_CODES = re.compile(r'\x1b\[\d\d?m')
+
+# Rails traffic information logged by hammer in verbose mode
+LOG_LINE = re.compile(r'\[ ?[A-Z]+ \d{4}-\d\d-\d\d ')
+
+
 class CommandTimeOut(Exception):
     """
     Exception for Paramiko timeouts
@@ -28,36 +49,132 @@ class CommandTimeOut(Exception):
     pass
 
 
+class ConnectionPoolTimeOut(Exception):
+    """
+    Exception for timeouts waiting for a free pooled connection
+    """
+    pass
+
+
+class CommandBatchError(Exception):
+    """
+    Exception for batch scripts whose output can not be split per command
+    """
+    pass
+
+
+class ConnectionLost(Exception):
+    """
+    Exception for ssh connections dropped while a command was running
+    """
+    pass
+
+
+# Errors raised by paramiko when the connection to the server is gone
+CONNECTION_ERRORS = (socket.error, paramiko.SSHException, EOFError)
+
+
 class SSHCommandResult(object):
     """
     Structure that returns in all ssh commands results.
+
+    Results of remote commands keep the raw output: it is decoded, cleaned
+    into ``lines`` and parsed into ``stdout`` on first access only, each
+    stage being cached, so callers only checking ``return_code`` do not pay
+    for it. ``rows`` iterates over CSV rows without building the list.
     """
 
     def __init__(self, stdout=None, stderr=None,
-                 return_code=0, transform_csv=False):
-        self.stdout = stdout
+                 return_code=0, transform_csv=False,
+                 wait_time=0.0, transfer_time=0.0, transform_json=False,
+                 raw_stdout=None):
+        self._raw_stdout = raw_stdout
+        self._lines = stdout
+        self._stdout = None
+        self._parsed = False
         self.stderr = stderr
         self.return_code = return_code
         self.transform_csv = transform_csv
+        self.transform_json = transform_json
+        # Seconds spent waiting for the remote side and receiving output
+        self.wait_time = wait_time
+        self.transfer_time = transfer_time
+
+    @property
+    def lines(self):
+        """
+        The output lines, stripped of Rails traffic information and color
+        codes.
+        """
+        if self._raw_stdout is not None:
+            raw = self._raw_stdout
+            self._lines = list(_clean_lines(
+                raw.decode('utf-8').split(u'\n'),
+                structured=self.transform_csv or self.transform_json
+            )) if raw else []
+            self._raw_stdout = None
+        return self._lines
+
+    @property
+    def stdout(self):
+        if not self._parsed:
+            self._stdout = self._parse(self.lines)
+            self._parsed = True
+        return self._stdout
+
+    @stdout.setter
+    def stdout(self, value):
+        self._stdout = value
+        self._parsed = True
+
+    def _parse(self, lines):
+        """Parses the output lines as CSV or JSON when expected"""
         #  Does not make sense to return suspicious CSV if ($? <> 0)
-        if transform_csv and self.return_code == 0:
-            self.stdout = csv_to_dictionary(stdout) if stdout else {}
-
-
-def _get_connection(timeout=10):
+        if self.return_code != 0:
+            return lines
+        if self.transform_csv:
+            return csv_to_dictionary(lines) if lines else {}
+        if self.transform_json:
+            # Raises ValueError when the output is not JSON
+            return json_to_dictionary(u'\n'.join(lines or []))
+        return lines
+
+    def rows(self):
+        """
+        Iterates over the CSV rows, parsing them one by one unless
+        ``stdout`` was accessed already.
+        """
+        if not self._parsed and self.transform_csv and \
+                self.return_code == 0:
+            return iter_csv_rows(self.lines or [])
+        return iter(self.stdout)
+
+
+def _get_connection(hostname=None, username=None, key_filename=None,
+                    timeout=10):
     """
     Constructs a ssh connection to the host provided in config.
     """
     # Hide base logger from paramiko
     logging.getLogger("paramiko").setLevel(logging.ERROR)
 
+    if hostname is None:
+        hostname = conf.properties['main.server.hostname']
+    if username is None:
+        username = conf.properties['main.server.ssh.username']
+    if key_filename is None:
+        key_filename = conf.properties['main.server.ssh.key_private']
+
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-    host = conf.properties['main.server.hostname']
-    root = conf.properties['main.server.ssh.username']
-    key_filename = conf.properties['main.server.ssh.key_private']
     client.connect(
-        host, username=root, key_filename=key_filename, timeout=timeout)
+        hostname, username=username, key_filename=key_filename,
+        timeout=timeout)
+    # Keepalives stop idle connections from being dropped by firewalls and
+    # make a dead server show up as an inactive transport
+    keepalive = int(conf.properties.get('main.server.ssh.keepalive', 30))
+    if keepalive > 0:
+        client.get_transport().set_keepalive(keepalive)
     logging.getLogger('robottelo').info(
         "Paramiko instance prepared (and would be reused): %s"
         % hex(id(client))
@@ -65,8 +182,144 @@ def _get_connection(timeout=10):
     return client
 
 
-# Define the shared ssh connection
-connection = _get_connection()
+class SSHConnectionPool(object):
+    """
+    Bounded, thread-safe pool of ssh connections to a single host.
+
+    Connections are opened on demand up to ``size`` and handed out with
+    ``checkout``. A connection must be given back with ``checkin`` (or
+    ``discard`` when it is broken); the ``connection`` context manager
+    takes care of that. Idle connections are health checked before being
+    handed out again and replaced when their transport is gone.
+    """
+
+    def __init__(self, hostname, username, key_filename, size=4,
+                 timeout=10):
+        self.hostname = hostname
+        self.username = username
+        self.key_filename = key_filename
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self._idle = []
+        self._opened = 0
+        self._cond = threading.Condition(threading.Lock())
+
+    def _connect(self):
+        """Opens a new connection to the pool's host"""
+        return _get_connection(
+            self.hostname, self.username, self.key_filename, self.timeout)
+
+    @staticmethod
+    def is_healthy(client):
+        """Tells whether the connection transport is still usable"""
+        transport = client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def checkout(self, timeout=None):
+        """
+        Returns a healthy connection, opening a new one if the pool is not
+        full, otherwise waits up to ``timeout`` seconds for one to be
+        returned.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while True:
+                while self._idle:
+                    client = self._idle.pop()
+                    if self.is_healthy(client):
+                        return client
+                    self._close(client)
+                if self._opened < self.size:
+                    self._opened += 1
+                    break
+                if deadline is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise ConnectionPoolTimeOut(
+                            'No free ssh connection to %s after %ss' %
+                            (self.hostname, timeout))
+                    self._cond.wait(remaining)
+
+        # Connect outside of the lock so other threads are not held back
+        try:
+            return self._connect()
+        except Exception:
+            with self._cond:
+                self._opened -= 1
+                self._cond.notify()
+            raise
+
+    def checkin(self, client):
+        """Gives a connection back to the pool"""
+        if not self.is_healthy(client):
+            self.discard(client)
+            return
+        with self._cond:
+            self._idle.append(client)
+            self._cond.notify()
+
+    def discard(self, client):
+        """Closes a connection and frees its slot in the pool"""
+        with self._cond:
+            self._close(client)
+            self._cond.notify()
+
+    def close(self):
+        """Closes all idle connections"""
+        with self._cond:
+            while self._idle:
+                self._close(self._idle.pop())
+            self._cond.notify_all()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        Context manager that checks out a connection and returns it to the
+        pool when done.
+        """
+        client = self.checkout(timeout)
+        try:
+            yield client
+        finally:
+            self.checkin(client)
+
+    def _close(self, client):
+        """Closes the client. Must be called holding the pool lock."""
+        self._opened -= 1
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+# Connection pools, one per (hostname, username, key) triple
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(hostname=None, username=None, key_filename=None):
+    """
+    Returns the shared connection pool for the host. Defaults to
+    main.server.hostname and the ssh credentials provided in config.
+    """
+    if hostname is None:
+        hostname = conf.properties['main.server.hostname']
+    if username is None:
+        username = conf.properties['main.server.ssh.username']
+    if key_filename is None:
+        key_filename = conf.properties['main.server.ssh.key_private']
+
+    key = (hostname, username, key_filename)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SSHConnectionPool(
+                hostname, username, key_filename,
+                size=conf.properties.get('main.server.ssh.pool_size', 4))
+            _pools[key] = pool
+    return pool
 
 
 def upload_file(local_file, remote_file=None):
@@ -81,17 +334,213 @@ def upload_file(local_file, remote_file=None):
         remote_file = local_file
 
     if not remote:
-        sftp = connection.open_sftp()
-        sftp.put(local_file, remote_file)
-        sftp.close()
+        with get_connection_pool().connection() as connection:
+            sftp = connection.open_sftp()
+            sftp.put(local_file, remote_file)
+            sftp.close()
     # TODO: Upload file to sauce labs via VPN tunnel in the else part.
 
 
-def command(cmd, hostname=None, expect_csv=False, timeout=None):
+def _open_channel(pool, timeout):
     """
-    Executes SSH command(s) on remote hostname.
+    Checks out a connection from ``pool`` and opens a session channel on it,
+    returning a ``(client, channel)`` tuple. Connections found dead at this
+    point, e.g. after the server's sshd was restarted, are discarded and
+    replaced by new ones, which is always safe since nothing was sent yet.
+    """
+    # Every idle connection may be dead, plus the one opened afterwards
+    for attempt in range(pool.size + 1):
+        client = pool.checkout(timeout)
+        try:
+            return client, client.get_transport().open_session()
+        except CONNECTION_ERRORS, e:
+            pool.discard(client)
+            if attempt == pool.size:
+                raise
+            logging.getLogger('robottelo').info(
+                "ssh connection to %s lost (%s), reconnecting"
+                % (pool.hostname, e))
+
+
+def _check_connection(client, channel):
+    """
+    Raises ConnectionLost when ``channel`` was closed because the connection
+    dropped rather than because its command exited.
+    """
+    if channel.exit_status == -1 and not \
+            SSHConnectionPool.is_healthy(client):
+        raise ConnectionLost('ssh connection lost while running the command')
+
+
+def _iter_channel(channel, timeout, timings):
+    """
+    Yields ``(stream, chunk)`` tuples with the output of the command running
+    on ``channel`` as soon as it arrives, ``stream`` being either ``stdout``
+    or ``stderr``. Stops once the command finished and all of its output was
+    read; its exit status is then ready on the channel.
+
+    Readiness is detected by selecting on the channel, so no time is spent
+    sleeping. The seconds spent waiting for the remote side and receiving
+    data are added to the ``wait`` and ``transfer`` keys of ``timings``.
+    """
+    deadline = time.time() + timeout
+
+    while True:
+        if channel.recv_ready():
+            started = time.time()
+            chunk = channel.recv(BUFFER_SIZE)
+            timings['transfer'] += time.time() - started
+            yield 'stdout', chunk
+            continue
+        if channel.recv_stderr_ready():
+            started = time.time()
+            chunk = channel.recv_stderr(BUFFER_SIZE)
+            timings['transfer'] += time.time() - started
+            yield 'stderr', chunk
+            continue
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise CommandTimeOut('Command timeout exceeded')
+
+        started = time.time()
+        if channel.eof_received or channel.closed:
+            # The last output may have arrived along with the EOF, after
+            # the checks above: read it before giving up on the channel
+            if channel.recv_ready() or channel.recv_stderr_ready():
+                continue
+            # All output was read, the exit status is on its way (if it
+            # has not arrived yet)
+            channel.status_event.wait(remaining)
+            timings['wait'] += time.time() - started
+            if not channel.exit_status_ready():
+                raise CommandTimeOut('Command timeout exceeded')
+            return
+        select([channel], [], [], remaining)
+        timings['wait'] += time.time() - started
+
+
+class _LineDecoder(object):
+    """
+    Incrementally decodes utf-8 output chunks into lines, keeping only the
+    trailing incomplete line between chunks.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._partial = u''
+
+    def feed(self, chunk):
+        """Returns the lines completed by ``chunk``"""
+        lines = (self._partial + self._decoder.decode(chunk)).split(u'\n')
+        self._partial = lines.pop()
+        return lines
+
+    def flush(self):
+        """Returns the last line when the output does not end with one"""
+        line = self._partial + self._decoder.decode('', True)
+        self._partial = u''
+        return [line] if line else []
+
+
+def _clean_lines(lines, structured=False):
+    """
+    Strips Rails traffic information and color escape codes from output
+    lines. ``structured`` (CSV or JSON) output keeps its quotes and lines
+    starting with "[" that are not log lines.
+    """
+    for line in lines:
+        if structured:
+            if not LOG_LINE.match(line):
+                yield COLOR_CODES.sub(u'', line)
+        elif not line.startswith(u'['):
+            # Empty fields are returned as "" which gives us u'""'
+            yield COLOR_CODES.sub(u'', line.replace(u'""', u''))
+
+
+class SSHCommandStream(object):
+    """
+    Iterable over the stdout lines of a command, yielded while the command
+    is still running so large outputs can be processed row by row without
+    being held in memory.
+
+    ``return_code`` and ``stderr`` are set once all lines were read. Leaving
+    the iteration early closes the channel. With ``expect_csv`` the lines
+    are meant for iter_csv_rows and keep their quotes.
+    """
+
+    def __init__(self, cmd, hostname=None, timeout=None, expect_csv=False):
+        self.cmd = cmd
+        self.hostname = hostname
+        self.timeout = 60 if timeout is None else timeout
+        self.expect_csv = expect_csv
+        self.return_code = None
+        self.stderr = None
+
+    def __iter__(self):
+        logger = logging.getLogger('robottelo')
+        logger.debug(">>> %s" % self.cmd)
+
+        timings = {'wait': 0.0, 'transfer': 0.0}
+        decoder = _LineDecoder()
+        stderr = []
+        pool = get_connection_pool(self.hostname)
+        client, channel = _open_channel(pool, self.timeout)
+        try:
+            channel.settimeout(self.timeout)
+            channel.exec_command(self.cmd)
+            for stream, chunk in _iter_channel(
+                    channel, self.timeout, timings):
+                if stream == 'stdout':
+                    for line in _clean_lines(
+                            decoder.feed(chunk), self.expect_csv):
+                        yield line
+                else:
+                    stderr.append(chunk)
+            _check_connection(client, channel)
+            for line in _clean_lines(decoder.flush(), self.expect_csv):
+                yield line
+            self.return_code = channel.recv_exit_status()
+        except socket.timeout:
+            raise CommandTimeOut('SSH channel timeout exceeded.')
+        except CONNECTION_ERRORS, e:
+            raise ConnectionLost(
+                'ssh connection lost while running the command: %s' % e)
+        finally:
+            channel.close()
+            pool.checkin(client)
+
+        logger.debug(
+            "<<< exit status %s (waiting %.3fs, transferring %.3fs)"
+            % (self.return_code, timings['wait'], timings['transfer']))
+
+        if self.return_code == 0:
+            self.stderr = []
+        else:
+            self.stderr = COLOR_CODES.sub('', ''.join(stderr))
+            logger.debug("<<< %s" % self.stderr)
+
+
+def command_stream(cmd, hostname=None, timeout=None, expect_csv=False):
+    """
+    Executes SSH command(s) on remote hostname and returns a
+    SSHCommandStream iterable over its stdout lines.
     Defaults to main.server.hostname.
     """
+    return SSHCommandStream(cmd, hostname, timeout, expect_csv)
+
+
+def _run(cmd, hostname=None, timeout=None, line_callback=None,
+         idempotent=False):
+    """
+    Runs the command on a pooled connection and returns a tuple
+    ``(stdout, stderr, return_code, timings)`` with its raw output.
+
+    When the connection drops while the command is running, the command is
+    run once more on a new connection if it is ``idempotent``, otherwise
+    ConnectionLost is raised since it may have had effects already.
+    ``line_callback`` then receives the lines of both attempts.
+    """
 
     # Set a default timeout of 60 seconds
     if timeout is None:
@@ -99,73 +548,174 @@ def command(cmd, hostname=None, expect_csv=False, timeout=None):
 
     # Start the timer
     start = time.time()
-    # Variable to hold results returned from the command
-    stdout = stderr = errorcode = None
-
-    # Remove escape code for colors displayed in the output
-    regex = re.compile(r'\x1b\[\d\d?m')
 
     logger = logging.getLogger('robottelo')
     logger.debug(">>> %s" % cmd)
 
-    hostname = hostname or conf.properties['main.server.hostname']
-
-    channel = connection.get_transport().open_session()
-    channel.settimeout(timeout)
-    channel.exec_command(cmd)
-
-    sleep_counter = 0
+    pool = get_connection_pool(hostname)
     while True:
         try:
-            rlist, wlist, elist = select([channel], [], [], float(timeout))
-            while (not channel.recv_ready() and
-                   not channel.recv_stderr_ready() and
-                   sleep_counter < SSH_CHANNEL_READY_TIMEOUT * 10):
-                        sleep_for_seconds(0.1)
-                        sleep_counter += 1
-            if rlist is not None and len(rlist) > 0:
-                if channel.exit_status_ready():
-                    stdout = channel.recv(1048576)
-                    stderr = channel.recv_stderr(1048576)
-                    errorcode = channel.recv_exit_status()
-                    break
-            elif elist is not None and len(elist) > 0:
-                if channel.recv_stderr_ready():
-                    stdout = channel.recv(1048576)
-                    stderr = channel.recv_stderr(1048576)
-                    break
+            stdout, stderr, errorcode, timings = _run_once(
+                pool, cmd, timeout, line_callback)
+            break
+        except ConnectionLost, e:
+            if not idempotent:
+                raise
+            # Retry only once, a connection dropping twice in a row is
+            # not going to get better
+            idempotent = False
+            logger.info("%s, running it again" % e)
+
+    logger.debug(
+        "<<< exit status %s after %.3fs (waiting %.3fs, transferring %.3fs)"
+        % (errorcode, time.time() - start, timings['wait'],
+           timings['transfer']))
+
+    return stdout, stderr, errorcode, timings
+
+
+def _run_once(pool, cmd, timeout, line_callback=None):
+    """
+    Runs the command once on a connection of ``pool``, see _run.
+    """
+    logger = logging.getLogger('robottelo')
 
-            if time.time() - start > timeout:
-                logger.debug("Command timeout exceeded.")
-                raise CommandTimeOut('Command timeout exceeded')
-        except socket.timeout:
-            logger.debug("SSH channel timeout exceeded.")
-            raise CommandTimeOut('SSH channel timeout exceeded.')
+    timings = {'wait': 0.0, 'transfer': 0.0}
+    decoder = _LineDecoder() if line_callback is not None else None
+    stdout = []
+    stderr = []
+    client, channel = _open_channel(pool, timeout)
+    try:
+        channel.settimeout(timeout)
+        channel.exec_command(cmd)
+        for stream, chunk in _iter_channel(channel, timeout, timings):
+            if stream == 'stderr':
+                stderr.append(chunk)
+                continue
+            stdout.append(chunk)
+            if decoder is not None:
+                for line in _clean_lines(decoder.feed(chunk)):
+                    line_callback(line)
+        _check_connection(client, channel)
+        errorcode = channel.recv_exit_status()
+    except CommandTimeOut:
+        logger.debug("Command timeout exceeded.")
+        raise
+    except socket.timeout:
+        logger.debug("SSH channel timeout exceeded.")
+        raise CommandTimeOut('SSH channel timeout exceeded.')
+    except CONNECTION_ERRORS, e:
+        raise ConnectionLost(
+            'ssh connection lost while running the command: %s' % e)
+    finally:
+        channel.close()
+        pool.checkin(client)
+
+    if decoder is not None:
+        for line in _clean_lines(decoder.flush()):
+            line_callback(line)
+
+    return ''.join(stdout), ''.join(stderr), errorcode, timings
+
+
+def command(cmd, hostname=None, expect_csv=False, timeout=None,
+            line_callback=None, idempotent=False, expect_json=False):
+    """
+    Executes SSH command(s) on remote hostname.
+    Defaults to main.server.hostname.
 
-    # For output we don't really want to see all of Rails traffic
-    # information, so strip it out.
+    With ``expect_json`` the output is decoded as JSON, ValueError is
+    raised if it is not.
 
-    if stdout:
-        # Empty fields are returned as "" which gives us u'""'
-        stdout = stdout.replace('""', '')
-        stdout = stdout.decode('utf-8')
-        stdout = u"".join(stdout).split("\n")
-        output = [
-            regex.sub('', line) for line in stdout if not line.startswith("[")
-            ]
-    else:
-        output = []
+    When ``line_callback`` is given it is called with every stdout line as
+    soon as it is received, while the command is still running.
+
+    Commands flagged ``idempotent`` are run again on a new connection when
+    the connection drops while they are running.
+    """
+    stdout, stderr, errorcode, timings = _run(
+        cmd, hostname, timeout, line_callback, idempotent)
+
+    return command_result(
+        stdout, stderr, errorcode, expect_csv,
+        wait_time=timings['wait'], transfer_time=timings['transfer'],
+        expect_json=expect_json)
+
+
+def command_batch(cmds, hostname=None, expect_csv=False, timeout=None):
+    """
+    Executes several SSH commands on remote hostname in one round trip and
+    returns one SSHCommandResult per command.
+    Defaults to main.server.hostname.
+
+    The commands run one after the other in a single remote script, each in
+    its own subshell and followed by a marker carrying its exit status,
+    which is used to split the output back per command. ``expect_csv`` may
+    be a single boolean or a list with one boolean per command.
+    """
+    if isinstance(expect_csv, bool):
+        expect_csv = [expect_csv] * len(cmds)
+    if not cmds:
+        return []
+
+    token = uuid.uuid4().hex
+    script = '\n'.join(
+        BATCH_STEP % {'cmd': cmd, 'token': token, 'index': index}
+        for index, cmd in enumerate(cmds))
+
+    stdout, stderr, errorcode, timings = _run(script, hostname, timeout)
+
+    return [
+        command_result(out, err, code, csv)
+        for (out, err, code), csv in zip(
+            _split_batch_output(stdout, stderr, token, len(cmds)),
+            expect_csv)
+        ]
+
+
+def _split_batch_output(stdout, stderr, token, count):
+    """
+    Splits the output of a command_batch script at its markers and returns
+    a list of ``(stdout, stderr, return_code)`` tuples, one per command.
+    """
+    stdout_parts = re.split(r'\n%s (\d+) (\d+)\n' % token, stdout)
+    stderr_parts = re.split(r'\n%s (\d+)\n' % token, stderr)
+
+    # Each marker contributes its output plus the captured groups
+    if len(stdout_parts) != count * 3 + 1 or \
+            len(stderr_parts) != count * 2 + 1:
+        raise CommandBatchError(
+            'Expected the output of %d commands, the remote script ended '
+            'early: %s' % (count, stderr_parts[-1].strip()))
+
+    return [
+        (stdout_parts[index * 3], stderr_parts[index * 2],
+         int(stdout_parts[index * 3 + 2]))
+        for index in range(count)
+        ]
+
+
+def command_result(stdout, stderr, errorcode, expect_csv=False,
+                   wait_time=0.0, transfer_time=0.0, expect_json=False):
+    """
+    Builds the SSHCommandResult for the raw output of a command. The output
+    is kept as is until the result's ``stdout`` is accessed.
+    """
+    logger = logging.getLogger('robottelo')
 
     # Ignore stderr if errorcode == 0. This is necessary since
     # we're running Foreman in verbose mode which generates a lot
     # of output return as stderr.
     errors = [] if errorcode == 0 else stderr
 
-    if output:
-        logger.debug("<<<\n%s" % '\n'.join(output[:-1]))
+    if stdout:
+        # Formatted by the logging handlers only when debug is enabled
+        logger.debug("<<<\n%s", stdout)
     if errors:
-        errors = regex.sub('', "".join(errors))
+        errors = COLOR_CODES.sub('', "".join(errors))
         logger.debug("<<< %s" % errors)
 
     return SSHCommandResult(
-        output, errors, errorcode, expect_csv)
+        None, errors, errorcode, expect_csv,
+        wait_time=wait_time, transfer_time=transfer_time,
+        transform_json=expect_json, raw_stdout=stdout or '')
@@ -7,6 +7,8 @@ Base class for all cli tests
 
 import logging
 import sys
+
+from robottelo.common import ledger
 if sys.hexversion >= 0x2070000:
     import unittest
 else:
@@ -137,5 +139,20 @@ class BaseAPI(unittest.TestCase):
     def assertIntersects(self, first, other, msg=None):
         assert_intersects(first, other, msg)
 
+    @classmethod
+    def setUpClass(cls):
+        # Records created by the tests of the class, see ledger
+        cls.ledger_scope = ledger.open_scope('class')
+
+    @classmethod
+    def tearDownClass(cls):
+        ledger.close_scope(cls.ledger_scope)
+
     def setUp(self):
         self.logger = logging.getLogger("robottelo")
+
+        # Records kept in class attributes are there for the other tests
+        scope = ledger.open_scope('test')
+        if scope is not None:
+            self.addCleanup(
+                lambda: ledger.close_scope(scope, vars(type(self)).values()))
@@ -3,7 +3,7 @@
 
 from ddt import ddt
 from robottelo.api.apicrud import ApiCrud
-from robottelo.common.decorators import bzbug, data, redminebug
+from robottelo.common.decorators import data_set, bzbug, redminebug
 from robottelo.records.activation_key import ActivationKey
 from robottelo.records.host_collection import HostCollectionDefOrg
 from tests.foreman.api.baseapi import BaseAPI
@@ -16,7 +16,7 @@ class ActivationKeys(BaseAPI):
     # Positive Create
 
     @redminebug('4793')
-    @data(*ActivationKey.enumerate())
+    @data_set(ActivationKey.enumerate)
     def test_positive_create_1(self, test_data):
         """
         @feature: ActivationKey
@@ -27,7 +27,7 @@ class ActivationKeys(BaseAPI):
         self.assertIntersects(test_data, result)
 
     @redminebug('4793')
-    @data(*ActivationKey.enumerate())
+    @data_set(ActivationKey.enumerate)
     def test_update(self, test_data):
         """
         @feature: ActivationKey
@@ -43,7 +43,7 @@ class ActivationKeys(BaseAPI):
         self.assertEquals(ak_u.description, ak_cr.description)
 
     @bzbug('1099533')
-    @data(*ActivationKey.enumerate())
+    @data_set(ActivationKey.enumerate)
     def test_host_collections(self, test_data):
         """
         @test: Verify, that you can add host collections
@@ -6,7 +6,7 @@ Test class for Host/System Unification
 Feature details:http://people.redhat.com/~dcleal/apiv2/apidoc.html"""
 from ddt import ddt
 from robottelo.api.apicrud import ApiCrud, ApiException
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data, data_set, bzbug
 from robottelo.records.environment import EnvironmentKatello
 from robottelo.records.content_view_definition import ContentViewDefinition
 from robottelo.common.decorators import stubbed
@@ -17,7 +17,7 @@ from tests.foreman.api.baseapi import BaseAPI
 @ddt
 class TestContentView(BaseAPI):
 
-    @data(*ContentViewDefinition.enumerate(label="", description=""))
+    @data_set(ContentViewDefinition.enumerate, label="", description="")
     def test_cv_create_api(self, data):
         # variations (subject to change):
         # ascii string, alphanumeric, latin-1, utf8, etc.
@@ -31,7 +31,7 @@ class TestContentView(BaseAPI):
         result = ApiCrud.record_create(depends)
         self.assertIntersects(data, result)
 
-    @data(*ContentViewDefinition.enumerate(name=""))
+    @data_set(ContentViewDefinition.enumerate, name="")
     def test_cv_create_api_negative_0(self, data):
         # variations (subject to change):
         # zero length, symbols, html, etc.
@@ -51,7 +51,7 @@ class TestContentView(BaseAPI):
             correctly_failing = True
         self.assertTrue(correctly_failing)
 
-    @data(*ContentViewDefinition.enumerate(name="  "))
+    @data_set(ContentViewDefinition.enumerate, name="  ")
     def test_cv_create_api_negative_1(self, data):
         # variations (subject to change):
         # zero length, symbols, html, etc.
@@ -71,7 +71,7 @@ class TestContentView(BaseAPI):
             correctly_failing = True
         self.assertTrue(correctly_failing)
 
-    @data(*ContentViewDefinition.enumerate(label="", description=""))
+    @data_set(ContentViewDefinition.enumerate, label="", description="")
     def test_cv_create_api_badorg_negative(self, data):
         # Use an invalid org name
         """
@@ -90,7 +90,7 @@ class TestContentView(BaseAPI):
             correctly_failing = True
         self.assertTrue(correctly_failing)
 
-    @data(*ContentViewDefinition.enumerate(label="", description=""))
+    @data_set(ContentViewDefinition.enumerate, label="", description="")
     def test_cv_edit(self, data):
         """
         @test: edit content views - name, description, etc.
@@ -121,7 +121,7 @@ class TestContentView(BaseAPI):
         @status: Manual
         """
 
-    @data(*ContentViewDefinition.enumerate(description=""))
+    @data_set(ContentViewDefinition.enumerate, description="")
     def test_cv_delete(self, data):
         """
         @test: delete content views
@@ -138,7 +138,7 @@ class TestContentView(BaseAPI):
         ApiCrud.record_remove(t)
         self.assertFalse(ApiCrud.record_exists(t))
 
-    @data(*ContentViewDefinition.enumerate(label="", description=""))
+    @data_set(ContentViewDefinition.enumerate, label="", description="")
     def test_cv_composite_create(self, data):
         # Note: puppet repos cannot/should not be used in this test
         # It shouldn't work - and that is tested in a different case.
@@ -360,7 +360,7 @@ class TestContentView(BaseAPI):
 
     # Content Views: publish
     # katello content definition publish --label=MyView
-    @data(*ContentViewDefinition.enumerate(label="", description=""))
+    @data_set(ContentViewDefinition.enumerate, label="", description="")
     def test_cv_publish_rh(self, data):
         """
         @test: attempt to publish a content view containing RH content
@@ -10,7 +10,7 @@ else:
 from ddt import ddt
 from robottelo.api.apicrud import ApiCrud, ApiException
 from robottelo.common.constants import NOT_IMPLEMENTED
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data, data_set
 from robottelo.common.helpers import generate_string
 from robottelo.records.environment import Environment
 from tests.foreman.api.baseapi import BaseAPI
@@ -20,11 +20,11 @@ from tests.foreman.api.baseapi import BaseAPI
 class TestEnvironment(BaseAPI):
     """Testing /api/environment entrypoint"""
 
-    @data(
+    @data_set(lambda: (
         generate_string('alpha', 8),
         generate_string('numeric', 8),
         generate_string('alphanumeric', 255),
-    )
+    ))
     def test_positive_create(self, name):
         """
         @Feature: Environment - Positive Create
@@ -37,14 +37,14 @@ class TestEnvironment(BaseAPI):
         self.assertEqual(result.name, environment.name)
         self.assertTrue(ApiCrud.record_exists(environment))
 
-    @data(
+    @data_set(lambda: (
         generate_string('alpha', 256),
         generate_string('numeric', 256),
         generate_string('alphanumeric', 256),
         generate_string('utf8', 8),
         generate_string('latin1', 8),
         generate_string('html', 8),
-    )
+    ))
     def test_negative_create(self, name):
         """
         @Feature: Environment - Negative Create
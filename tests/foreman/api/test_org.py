@@ -11,7 +11,7 @@ from ddt import ddt
 from robottelo.common.helpers import STR
 from robottelo.api.apicrud import ApiCrud, ApiException
 from robottelo.common.constants import NOT_IMPLEMENTED
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data, data_set, bzbug
 from robottelo.records.organization import Organization
 from robottelo.common.records.base import NoEnum
 from robottelo.common.records.fields import BasicPositiveField
@@ -24,7 +24,7 @@ class TestOrganization(BaseAPI):
 
     # Positive Create
 
-    @data(*Organization.enumerate(label="", description=""))
+    @data_set(Organization.enumerate, label="", description="")
     def test_positive_create_1(self, test_data):
         """
         @feature: Organizations
@@ -35,7 +35,7 @@ class TestOrganization(BaseAPI):
         test_data.label = result.label
         self.assertIntersects(test_data, result)
 
-    @data(*Organization.enumerate(name="", description=""))
+    @data_set(Organization.enumerate, name="", description="")
     def test_positive_create_2(self, test_data):
         """
         @feature: Organizations
@@ -47,7 +47,7 @@ class TestOrganization(BaseAPI):
         self.assertIntersects(test_data, result)
         self.assertEquals(result.name, result.label)
 
-    @data(*Organization.enumerate(description=""))
+    @data_set(Organization.enumerate, description="")
     def test_positive_create_3(self, test_data):
         """
         @feature: Organizations
@@ -58,7 +58,7 @@ class TestOrganization(BaseAPI):
         self.assertIntersects(test_data, result)
         self.assertNotEqual(result.name, result.label)
 
-    @data(*Organization.enumerate(label=""))
+    @data_set(Organization.enumerate, label="")
     def test_positive_create_4(self, test_data):
         """
         @feature: Organizations
@@ -70,7 +70,7 @@ class TestOrganization(BaseAPI):
         test_data.label = result.label
         self.assertIntersects(test_data, result)
 
-    @data(*Organization.enumerate())
+    @data_set(Organization.enumerate)
     def test_positive_create_5(self, test_data):
         """
         @feature: Organizations
@@ -82,12 +82,10 @@ class TestOrganization(BaseAPI):
 
     # Negative Create
 
-    @data(
-        *Organization.enumerate(
-            name=BasicPositiveField(maxlen=300),
-            label=NoEnum,
-            description=NoEnum)
-    )
+    @data_set(lambda: Organization.enumerate(
+        name=BasicPositiveField(maxlen=300),
+        label=NoEnum,
+        description=NoEnum))
     def test_negative_create_0(self, test_data):
         """
         @feature: Organizations
@@ -103,7 +101,7 @@ class TestOrganization(BaseAPI):
             correctly_failing = True
         self.assertTrue(correctly_failing)
 
-    @data(*Organization.enumerate(name=""))
+    @data_set(Organization.enumerate, name="")
     def test_negative_create_1(self, test_data):
         """
         @feature: Organizations
@@ -119,7 +117,7 @@ class TestOrganization(BaseAPI):
 
         self.assertTrue(correctly_failing)
 
-    @data(*Organization.enumerate(name="   "))
+    @data_set(Organization.enumerate, name="   ")
     def test_negative_create_2(self, test_data):
         """
         @feature: Organizations
@@ -134,7 +132,7 @@ class TestOrganization(BaseAPI):
             correctly_failing = True
         self.assertTrue(correctly_failing)
 
-    @data(*Organization.enumerate())
+    @data_set(Organization.enumerate)
     def test_negative_create_3(self, test_data):
         """
         @feature: Organizations
@@ -153,7 +151,7 @@ class TestOrganization(BaseAPI):
     # Positive Delete
 
     @bzbug('1061658')
-    @data(*Organization.enumerate())
+    @data_set(Organization.enumerate)
     def test_positive_delete_1(self, test_data):
         """
         @feature: Organizations
@@ -169,10 +167,9 @@ class TestOrganization(BaseAPI):
 
     # Positive Update
 
-    @data(*Organization.enumerate(
+    @data_set(lambda: Organization.enumerate(
         label=NoEnum,
-        description=NoEnum)
-    )
+        description=NoEnum))
     def test_positive_update_1(self, test_data):
         """
         @feature: Organizations
@@ -184,10 +181,9 @@ class TestOrganization(BaseAPI):
         org.name = test_data.name
         ApiCrud.record_update(org)
 
-    @data(*Organization.enumerate(
+    @data_set(lambda: Organization.enumerate(
         name=NoEnum,
-        label=NoEnum)
-    )
+        label=NoEnum))
     def test_positive_update_3(self, test_data):
         """
         @feature: Organizations
@@ -201,7 +197,7 @@ class TestOrganization(BaseAPI):
         ApiCrud.record_update(org)
 
     @bzbug('1061658')
-    @data(*Organization.enumerate())
+    @data_set(Organization.enumerate)
     def test_positive_update_4(self, test_data):
         """
         @feature: Organizations
@@ -217,7 +213,7 @@ class TestOrganization(BaseAPI):
 
     # Negative Update
 
-    @data(*Organization.enumerate(
+    @data_set(lambda: Organization.enumerate(
         name=BasicPositiveField(maxlen=300),
         label=NoEnum,
         description=NoEnum
@@ -241,7 +237,7 @@ class TestOrganization(BaseAPI):
 
         self.assertTrue(correctly_failing)
 
-    @data(*Organization.enumerate(
+    @data_set(lambda: Organization.enumerate(
         name=NoEnum,
         label=BasicPositiveField(),
         description=NoEnum
@@ -266,7 +262,7 @@ class TestOrganization(BaseAPI):
 
     # Miscelaneous
 
-    @data(*Organization.enumerate())
+    @data_set(Organization.enumerate)
     def test_list_key_1(self, test_data):
         """
         @feature: Organizations
@@ -278,7 +274,7 @@ class TestOrganization(BaseAPI):
         self.assertTrue(any(org.name == ol.name for ol in orgs))
 
     @bzbug('1072905')
-    @data(*Organization.enumerate())
+    @data_set(Organization.enumerate)
     def test_search_key_1(self, test_data):
         """
         @feature: Organizations
@@ -292,7 +288,7 @@ class TestOrganization(BaseAPI):
         self.assertEqual(org_res.name, test_data.name)
 
     @bzbug('1072905')
-    @data(*Organization.enumerate(exclude=[STR.html]))
+    @data_set(Organization.enumerate, exclude=[STR.html])
     def test_search_name_1(self, test_data):
         """
         @feature: Organizations
@@ -308,7 +304,7 @@ class TestOrganization(BaseAPI):
         name = result.json()["results"][0]["name"]
         self.assertEqual(name, test_data.name)
 
-    @data(*Organization.enumerate())
+    @data_set(Organization.enumerate)
     def test_info_key_1(self, test_data):
         """
         @feature: Organizations
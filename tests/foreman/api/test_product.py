@@ -3,7 +3,7 @@
 
 from ddt import ddt
 from robottelo.api.apicrud import ApiCrud
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data_set
 from robottelo.records.product import CustomProduct
 from tests.foreman.api.baseapi import BaseAPI
 
@@ -14,7 +14,7 @@ class Products(BaseAPI):
 
     # Positive Create
 
-    @data(*CustomProduct.enumerate())
+    @data_set(CustomProduct.enumerate)
     def test_positive_create_1(self, test_data):
         """
         @feature: CustomProduct
@@ -24,7 +24,7 @@ class Products(BaseAPI):
         result = ApiCrud.record_create_recursive(test_data)
         self.assertIntersects(test_data, result)
 
-    @data(*CustomProduct.enumerate())
+    @data_set(CustomProduct.enumerate)
     def test_update(self, test_data):
         """
         @feature: CustomProduct
@@ -39,7 +39,7 @@ class Products(BaseAPI):
         ak_u = ApiCrud.record_update(ak_cr)
         self.assertEquals(ak_u.description, ak_cr.description)
 
-    @data(*CustomProduct.enumerate())
+    @data_set(CustomProduct.enumerate)
     def test_positive_remove_1(self, test_data):
         """
         @feature: CustomProduct
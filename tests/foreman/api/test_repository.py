@@ -3,7 +3,7 @@
 
 from ddt import ddt
 from robottelo.api.apicrud import ApiCrud
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data_set
 from robottelo.records.repository import CustomRepository
 from tests.foreman.api.baseapi import BaseAPI
 
@@ -14,7 +14,7 @@ class Repository(BaseAPI):
 
     # Positive Create
 
-    @data(*CustomRepository.enumerate())
+    @data_set(CustomRepository.enumerate)
     def test_positive_create_1(self, test_data):
         """
         @feature: CustomYumRepo
@@ -24,7 +24,7 @@ class Repository(BaseAPI):
         result = ApiCrud.record_create_recursive(test_data)
         self.assertIntersects(test_data, result)
 
-    @data(*CustomRepository.enumerate())
+    @data_set(CustomRepository.enumerate)
     def test_positive_remove_1(self, test_data):
         """
         @feature: CustomYumRepo
@@ -36,7 +36,7 @@ class Repository(BaseAPI):
         ApiCrud.record_remove(result)
         self.assertFalse(ApiCrud.record_exists(result))
 
-    @data(*CustomRepository.enumerate())
+    @data_set(CustomRepository.enumerate)
     def test_positive_sync_1(self, test_data):
         """
         @feature: CustomYumRepo
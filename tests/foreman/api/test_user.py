@@ -3,7 +3,7 @@
 
 from ddt import ddt
 from robottelo.api.apicrud import ApiCrud
-from robottelo.common.decorators import data, redminebug
+from robottelo.common.decorators import data_set, redminebug
 from robottelo.records.user import User
 from tests.foreman.api.baseapi import BaseAPI
 
@@ -12,7 +12,7 @@ from tests.foreman.api.baseapi import BaseAPI
 class TestUser(BaseAPI):
     """Testing /api/organization entrypoint"""
 
-    @data(*User.enumerate())
+    @data_set(User.enumerate)
     def test_add_user_1(self, test_data):
         """
         @feature: Organizations
@@ -24,7 +24,7 @@ class TestUser(BaseAPI):
 
         ApiCrud.record_create_recursive(test_data)
 
-    @data(*User.enumerate(admin=True))
+    @data_set(User.enumerate, admin=True)
     def test_add_user_2(self, test_data):
         """
         @feature: Organizations
@@ -38,7 +38,7 @@ class TestUser(BaseAPI):
     @redminebug('4294')
     @redminebug('4295')
     @redminebug('4296')
-    @data(*User.enumerate())
+    @data_set(User.enumerate)
     def test_remove_user_1(self, test_data):
         """
         @feature: Organizations
@@ -57,7 +57,7 @@ class TestUser(BaseAPI):
     @redminebug('4294')
     @redminebug('4295')
     @redminebug('4296')
-    @data(*User.enumerate(admin=True))
+    @data_set(User.enumerate, admin=True)
     def test_remove_user_3(self, test_data):
         """
         @feature: Organizations
@@ -0,0 +1,45 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Compares the per-command latency of the hammer backends.
+
+Runs the same read-only hammer commands through the ``process`` backend
+(a new hammer process per command) and the ``shell`` backend (long-lived
+hammer shell sessions) against the configured server::
+
+    $ python -m tests.foreman.benchmarks.bench_cli_backends [repeat]
+"""
+
+import sys
+
+from robottelo.cli.architecture import Architecture
+from robottelo.cli.org import Org
+from robottelo.common import conf
+from robottelo.common.benchmark import format_summary, measure, summarize
+
+COMMANDS = (
+    ('architecture list', lambda: Architecture.list()),
+    ('organization list', lambda: Org.list()),
+    ('architecture info', lambda: Architecture.info({u'id': 1})),
+)
+
+
+def main(repeat=20):
+    """Prints a latency summary of every command on every backend"""
+    original = conf.properties.get('hammer.backend', 'process')
+    try:
+        for backend in ('process', 'shell'):
+            conf.properties['hammer.backend'] = backend
+            # Warm up, the shell backend starts its session here
+            for _, command in COMMANDS:
+                command()
+            for name, command in COMMANDS:
+                summary = summarize(measure(command, repeat))
+                print format_summary(u'%s: %s' % (backend, name), summary)
+    finally:
+        conf.properties['hammer.backend'] = original
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -1,2 +1,9 @@
 # -*- encoding: utf-8 -*-
 # vim: ts=4 sw=4 expandtab ai
+
+from robottelo.cli import pool
+
+
+def setup_package():
+    """Starts creating the pooled objects, when the pools are enabled"""
+    pool.warm()
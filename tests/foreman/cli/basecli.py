@@ -12,7 +12,7 @@ if sys.hexversion >= 0x2070000:
 else:
     import unittest2 as unittest
 
-from robottelo.common import conf
+from robottelo.common import conf, ledger
 from robottelo.cli.metatest import MetaCLITest
 
 
@@ -39,6 +39,17 @@ class BaseCLI(unittest.TestCase):
         logging.getLogger("paramiko").setLevel(logging.ERROR)
         cls.logger = logging.getLogger("robottelo")
 
+        # Objects created by the tests of the class, see ledger
+        cls.ledger_scope = ledger.open_scope('class')
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Delete the objects created by the tests of the class.
+        """
+
+        ledger.close_scope(cls.ledger_scope)
+
     def setUp(self):
         """
         Log test class and method name before each test.
@@ -46,6 +57,12 @@ class BaseCLI(unittest.TestCase):
         self.logger.debug("Running test %s/%s", type(self).__name__,
                           self._testMethodName)
 
+        # Objects kept in class attributes are there for the other tests
+        scope = ledger.open_scope('test')
+        if scope is not None:
+            self.addCleanup(
+                lambda: ledger.close_scope(scope, vars(type(self)).values()))
+
 
 class MetaCLI(BaseCLI):
 
@@ -8,14 +8,15 @@ Test class for Activation key CLI
 from ddt import ddt
 from nose.plugins.attrib import attr
 
+from robottelo.cli import pool
 from robottelo.cli.activationkey import ActivationKey
 from robottelo.cli.lifecycleenvironment import LifecycleEnvironment
 from robottelo.cli.factory import (
     make_activation_key,
     make_lifecycle_environment,
-    make_org, make_product
+    make_product
 )
-from robottelo.common.decorators import data, stubbed
+from robottelo.common.decorators import data_set, stubbed
 from robottelo.common.helpers import generate_string
 
 from tests.foreman.cli.basecli import BaseCLI
@@ -41,7 +42,8 @@ class TestActivationKey(BaseCLI):
         super(TestActivationKey, self).setUp()
 
         if TestActivationKey.org is None:
-            TestActivationKey.org = make_org()
+            TestActivationKey.org = pool.lease(
+                'org', tainted=True)['org']
         if TestActivationKey.env1 is None:
             TestActivationKey.env1 = make_lifecycle_environment(
                 {u'organization-id': TestActivationKey.org['id']})
@@ -93,14 +95,14 @@ class TestActivationKey(BaseCLI):
         # Return the activation key dictionary
         return ackey
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'activation-key')
     def test_positive_create_activation_key_1(self, test_data):
         """
@@ -120,14 +122,14 @@ class TestActivationKey(BaseCLI):
              (new_ackey['name'], test_data['name']))
         )
 
-    @data(
+    @data_set(lambda: (
         {'description': generate_string('alpha', 15)},
         {'description': generate_string('alphanumeric', 15)},
         {'description': generate_string('numeric', 15)},
         {'description': generate_string('latin1', 15)},
         {'description': generate_string('utf8', 15)},
         {'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'activation-key')
     def test_positive_create_activation_key_2(self, test_data):
         """
@@ -148,14 +150,14 @@ class TestActivationKey(BaseCLI):
              (new_ackey['description'], test_data['description']))
         )
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'activation-key')
     def test_positive_create_associate_environ_1(self, test_data):
         """
@@ -178,14 +180,14 @@ class TestActivationKey(BaseCLI):
              (new_ackey['lifecycle-environment'], self.library['name']))
         )
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'activation-key')
     def test_positive_create_associate_environ_2(self, test_data):
         """
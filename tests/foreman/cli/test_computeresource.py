@@ -34,7 +34,7 @@ class TestComputeResource(BaseCLI):
 
     @classmethod
     def setUpClass(cls):
-        BaseCLI.setUpClass()
+        super(TestComputeResource, cls).setUpClass()
         cls.compute_res_updates = make_compute_resource({
             'provider': FOREMAN_PROVIDERS['libvirt'],
             'url': "qemu+tcp://%s:16509/system" %
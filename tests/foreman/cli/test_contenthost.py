@@ -9,13 +9,13 @@ Test class for Content-Host CLI
 
 from ddt import ddt
 from nose.plugins.attrib import attr
+from robottelo.cli import pool
 from robottelo.cli.factory import (
-    make_org, make_content_view, make_lifecycle_environment,
-    make_content_host)
+    make_content_view, make_lifecycle_environment, make_content_host)
 from robottelo.cli.contenthost import ContentHost
 from robottelo.cli.contentview import ContentView
 from robottelo.cli.lifecycleenvironment import LifecycleEnvironment
-from robottelo.common.decorators import bzbug, data
+from robottelo.common.decorators import bzbug, data_set
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -39,7 +39,8 @@ class TestContentHost(BaseCLI):
         super(TestContentHost, self).setUp()
 
         if TestContentHost.NEW_ORG is None:
-            TestContentHost.NEW_ORG = make_org()
+            TestContentHost.NEW_ORG = pool.lease(
+                'org', tainted=True)['org']
         if TestContentHost.NEW_LIFECYCLE is None:
             TestContentHost.NEW_LIFECYCLE = make_lifecycle_environment(
                 {u'organization-id': TestContentHost.NEW_ORG['id']}
@@ -57,14 +58,14 @@ class TestContentHost(BaseCLI):
             )
             TestContentHost.DEFAULT_CV = cv_result.stdout
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'content-host')
     def test_positive_create_1(self, test_data):
         """
@@ -85,14 +86,14 @@ class TestContentHost(BaseCLI):
             "Names don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'description': generate_string('alpha', 15)},
         {u'description': generate_string('alphanumeric', 15)},
         {u'description': generate_string('numeric', 15)},
         {u'description': generate_string('latin1', 15)},
         {u'description': generate_string('utf8', 15)},
         {u'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'content-host')
     def test_positive_create_2(self, test_data):
         """
@@ -248,14 +249,14 @@ class TestContentHost(BaseCLI):
             "Content Views don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 300)},
         {u'name': generate_string('alphanumeric', 300)},
         {u'name': generate_string('numeric', 300)},
         {u'name': generate_string('latin1', 300)},
         {u'name': generate_string('utf8', 300)},
         {u'name': generate_string('html', 300)},
-    )
+    ))
     @attr('cli', 'content-host')
     def test_negative_create_1(self, test_data):
         """
@@ -271,14 +272,14 @@ class TestContentHost(BaseCLI):
                 u'content-view-id': self.DEFAULT_CV['id'],
                 u'environment-id': self.LIBRARY['id']})
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'content-host')
     def test_positive_update_1(self, test_data):
         """
@@ -335,14 +336,14 @@ class TestContentHost(BaseCLI):
             "Names should not match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'description': generate_string('alpha', 15)},
         {u'description': generate_string('alphanumeric', 15)},
         {u'description': generate_string('numeric', 15)},
         {u'description': generate_string('latin1', 15)},
         {u'description': generate_string('utf8', 15)},
         {u'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'content-host')
     def test_positive_update_2(self, test_data):
         """
@@ -400,14 +401,14 @@ class TestContentHost(BaseCLI):
             "Descriptions should not match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'content-host')
     def test_positive_delete_1(self, test_data):
         """
@@ -10,13 +10,13 @@ import unittest
 from ddt import ddt
 from robottelo.cli.contentview import ContentView
 from robottelo.cli.factory import (
-    make_content_view, make_org, make_repository, make_product,
-    make_lifecycle_environment, make_user)
+    Reference, make_content_view, make_fixtures, make_org, make_repository,
+    make_product, make_lifecycle_environment, make_user)
 from robottelo.cli.org import Org
 from robottelo.cli.puppetmodule import PuppetModule
 from robottelo.cli.repository import Repository
 from robottelo.common.constants import NOT_IMPLEMENTED
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data_set, bzbug
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -85,19 +85,23 @@ class TestContentView(BaseCLI):
         super(TestContentView, self).setUp()
 
         if TestContentView.org is None:
-            TestContentView.org = make_org()
-        if TestContentView.env1 is None:
-            TestContentView.env1 = make_lifecycle_environment(
-                {u'organization-id': TestContentView.org['id']})
-        if TestContentView.env2 is None:
-            TestContentView.env2 = make_lifecycle_environment(
-                {u'organization-id': TestContentView.org['id'],
-                 u'prior': TestContentView.env1['label']})
-        if TestContentView.product is None:
-            TestContentView.product = make_product(
-                {u'organization-id': TestContentView.org['id']})
-
-    @data(*positive_create_data())
+            # The environments and the product are created concurrently
+            fixtures = make_fixtures({
+                'org': (make_org, {}),
+                'env1': (make_lifecycle_environment, {
+                    u'organization-id': Reference('org')}),
+                'env2': (make_lifecycle_environment, {
+                    u'organization-id': Reference('org'),
+                    u'prior': Reference('env1', 'label')}),
+                'product': (make_product, {
+                    u'organization-id': Reference('org')}),
+            })
+            TestContentView.org = fixtures['org']
+            TestContentView.env1 = fixtures['env1']
+            TestContentView.env2 = fixtures['env2']
+            TestContentView.product = fixtures['product']
+
+    @data_set(positive_create_data)
     def test_cv_create_cli(self, test_data):
         # variations (subject to change):
         # ascii string, alphanumeric, latin-1, utf8, etc.
@@ -120,7 +124,7 @@ class TestContentView(BaseCLI):
         self.assertEqual(result.return_code, 0, "Failed to find object")
         self.assertEqual(con_view['name'], result.stdout['name'])
 
-    @data(*negative_create_data())
+    @data_set(negative_create_data)
     def test_cv_create_cli_negative(self, test_data):
         # variations (subject to change):
         # zero length, symbols, html, etc.
@@ -1485,7 +1489,7 @@ class TestContentView(BaseCLI):
     # ROLES TESTING
     # All this stuff is speculative at best.
 
-    @data(*positive_create_data())
+    @data_set(positive_create_data)
     def test_cv_roles_admin_user_negative(self, test_data):
         # Note:
         # Obviously all of this stuff should work with 'admin' user
@@ -1542,7 +1546,7 @@ class TestContentView(BaseCLI):
             len(result.stderr), 0,
             "There should have been an exception here")
 
-    @data(*positive_create_data())
+    @data_set(positive_create_data)
     @bzbug("1092111")
     def test_cv_roles_readonly_user(self, test_data):
         # Note:
@@ -1589,7 +1593,7 @@ class TestContentView(BaseCLI):
         self.assertEqual(result.return_code, 0, "Failed to find object")
         self.assertEqual(con_view['name'], result.stdout['name'])
 
-    @data(*positive_create_data())
+    @data_set(positive_create_data)
     @bzbug("1092111")
     def test_cv_roles_readonly_user_negative(self, test_data):
         # Note:
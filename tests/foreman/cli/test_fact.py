@@ -8,7 +8,7 @@ Test class for Fact  CLI
 from ddt import ddt
 from nose.plugins.attrib import attr
 from robottelo.cli.fact import Fact
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data, data_set
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -46,12 +46,12 @@ class TestFact(BaseCLI):
 
         self.assertEqual(stdout[0]['fact'], fact)
 
-    @data(
+    @data_set(lambda: (
         generate_string("alpha", 10),
         generate_string("alpha", 10),
         generate_string("alpha", 10),
         generate_string("alpha", 10),
-    )
+    ))
     @attr('cli', 'fact')
     def test_list_fail(self, fact):
         """
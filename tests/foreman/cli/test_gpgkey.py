@@ -11,7 +11,7 @@ from robottelo.cli.gpgkey import GPGKey
 from robottelo.cli.org import Org
 from robottelo.common import ssh
 from robottelo.common.constants import VALID_GPG_KEY_FILE
-from robottelo.common.decorators import data, redminebug, stubbed
+from robottelo.common.decorators import data_set, redminebug, stubbed
 from robottelo.common.helpers import (generate_name, generate_string,
                                       get_data_file)
 from tempfile import mkstemp
@@ -60,7 +60,7 @@ class TestGPGKey(BaseCLI):
         Create a shared organization for all tests to avoid generating hundreds
         of organizations
         """
-        BaseCLI.setUpClass()
+        super(TestGPGKey, cls).setUpClass()
         cls.org = cls.create_org()
 
     @classmethod
@@ -192,7 +192,7 @@ class TestGPGKey(BaseCLI):
 
     # Positive Create
 
-    @data(*positive_create_data())
+    @data_set(positive_create_data)
     def test_positive_create_1(self, data):
         """
         @test: Create gpg key with valid name and valid gpg key via file import
@@ -227,7 +227,7 @@ class TestGPGKey(BaseCLI):
         self.assertEqual(
             new_obj[self.search_key], result.stdout[self.search_key])
 
-    @data(*positive_create_data())
+    @data_set(positive_create_data)
     def test_positive_create_2(self, data):
         """
         @test: Create gpg key with valid name and valid gpg key via file import
@@ -259,7 +259,7 @@ class TestGPGKey(BaseCLI):
 
     # Negative Create
 
-    @data(*positive_create_data())
+    @data_set(positive_create_data)
     def test_negative_create_1(self, data):
         """
         @test: Create gpg key with valid name and valid gpg key via file import
@@ -301,7 +301,7 @@ class TestGPGKey(BaseCLI):
         self.assertGreater(
             len(new_obj.stderr), 0, "Should have raised an exception")
 
-    @data(*positive_create_data())
+    @data_set(positive_create_data)
     def test_negative_create_2(self, data):
         """
         @test: Create gpg key with valid name and no gpg key
@@ -320,7 +320,7 @@ class TestGPGKey(BaseCLI):
         self.assertGreater(
             len(new_obj.stderr), 0, "Should have raised an exception")
 
-    @data(*negative_create_data())
+    @data_set(negative_create_data)
     def test_negative_create_3(self, data):
         """
         @test: Create gpg key with invalid name and valid gpg key via
@@ -7,9 +7,10 @@ Test class for Host Collection CLI
 
 from ddt import ddt
 from nose.plugins.attrib import attr
-from robottelo.cli.factory import make_org, make_host_collection
+from robottelo.cli import pool
+from robottelo.cli.factory import make_host_collection
 from robottelo.cli.hostcollection import HostCollection
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data, data_set, bzbug
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -30,7 +31,8 @@ class TestHostCollection(BaseCLI):
         super(TestHostCollection, self).setUp()
 
         if TestHostCollection.org is None:
-            TestHostCollection.org = make_org()
+            TestHostCollection.org = pool.lease(
+                'org', tainted=True)['org']
 
     def _new_host_collection(self, options=None):
         """
@@ -62,14 +64,14 @@ class TestHostCollection(BaseCLI):
         # Return the host collection dictionary
         return group
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'hostcollection')
     def test_positive_create_1(self, test_data):
         """
@@ -86,14 +88,14 @@ class TestHostCollection(BaseCLI):
             "Names don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {'description': generate_string('alpha', 15)},
         {'description': generate_string('alphanumeric', 15)},
         {'description': generate_string('numeric', 15)},
         {'description': generate_string('latin1', 15)},
         {'description': generate_string('utf8', 15)},
         {'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'hostcollection')
     def test_positive_create_2(self, test_data):
         """
@@ -130,14 +132,14 @@ class TestHostCollection(BaseCLI):
              (new_host_col['max-content-hosts'], str(test_data)))
         )
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 300)},
         {'name': generate_string('alphanumeric', 300)},
         {'name': generate_string('numeric', 300)},
         {'name': generate_string('latin1', 300)},
         {'name': generate_string('utf8', 300)},
         {'name': generate_string('html', 300)},
-    )
+    ))
     @attr('cli', 'hostcollection')
     def test_negative_create_1(self, test_data):
         """
@@ -150,14 +152,14 @@ class TestHostCollection(BaseCLI):
             self._new_host_collection({'name': test_data['name']})
 
     @bzbug('1084240')
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'hostcollection')
     def test_positive_update_1(self, test_data):
         """
@@ -220,14 +222,14 @@ class TestHostCollection(BaseCLI):
         )
 
     @bzbug('1084240')
-    @data(
+    @data_set(lambda: (
         {'description': generate_string('alpha', 15)},
         {'description': generate_string('alphanumeric', 15)},
         {'description': generate_string('numeric', 15)},
         {'description': generate_string('latin1', 15)},
         {'description': generate_string('utf8', 15)},
         {'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'hostcollection')
     def test_positive_update_2(self, test_data):
         """
@@ -341,14 +343,14 @@ class TestHostCollection(BaseCLI):
             "Limits don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'hostcollection')
     def test_positive_delete_1(self, test_data):
         """
@@ -6,9 +6,10 @@ Test class for Host CLI
 """
 
 from ddt import ddt
-from robottelo.cli.factory import make_lifecycle_environment, make_org
+from robottelo.cli import pool
+from robottelo.cli.factory import make_lifecycle_environment
 from robottelo.cli.lifecycleenvironment import LifecycleEnvironment
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data_set, bzbug
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -29,7 +30,8 @@ class TestLifeCycleEnvironment(BaseCLI):
         super(TestLifeCycleEnvironment, self).setUp()
 
         if TestLifeCycleEnvironment.org is None:
-            TestLifeCycleEnvironment.org = make_org()
+            TestLifeCycleEnvironment.org = pool.lease(
+                'org', tainted=True)['org']
 
     # Issues validation
 
@@ -104,14 +106,14 @@ class TestLifeCycleEnvironment(BaseCLI):
     # CRUD
 
     @bzbug('1099655')
-    @data(
+    @data_set(lambda: (
         {'name': generate_string("alpha", 15)},
         {'name': generate_string("alphanumeric", 15)},
         {'name': generate_string("numeric", 15)},
         {'name': generate_string("latin1", 15)},
         {'name': generate_string("utf8", 15)},
         {'name': generate_string("html", 15)},
-    )
+    ))
     def test_positive_create_1(self, test_data):
         """
         @Test: Create lifecycle environment with valid name, prior to Library
@@ -152,14 +154,14 @@ class TestLifeCycleEnvironment(BaseCLI):
         )
 
     @bzbug('1099655')
-    @data(
+    @data_set(lambda: (
         {'name': generate_string("alpha", 15)},
         {'name': generate_string("alphanumeric", 15)},
         {'name': generate_string("numeric", 15)},
         {'name': generate_string("latin1", 15)},
         {'name': generate_string("utf8", 15)},
         {'name': generate_string("html", 15)},
-    )
+    ))
     def test_positive_create_2(self, test_data):
         """
         @Test: Create lifecycle environment with valid name and description,
@@ -207,14 +209,14 @@ class TestLifeCycleEnvironment(BaseCLI):
         )
 
     @bzbug('1099655')
-    @data(
+    @data_set(lambda: (
         {'name': generate_string("alpha", 15)},
         {'name': generate_string("alphanumeric", 15)},
         {'name': generate_string("numeric", 15)},
         {'name': generate_string("latin1", 15)},
         {'name': generate_string("utf8", 15)},
         {'name': generate_string("html", 15)},
-    )
+    ))
     def test_positive_delete_1(self, test_data):
         """
         @Test: Create lifecycle environment with valid name, prior to Library
@@ -280,14 +282,14 @@ class TestLifeCycleEnvironment(BaseCLI):
 
     @bzbug('1095937')
     @bzbug('1099655')
-    @data(
+    @data_set(lambda: (
         {'name': generate_string("alpha", 15)},
         {'name': generate_string("alphanumeric", 15)},
         {'name': generate_string("numeric", 15)},
         {'name': generate_string("latin1", 15)},
         {'name': generate_string("utf8", 15)},
         {'name': generate_string("html", 15)},
-    )
+    ))
     def test_positive_update_1(self, test_data):
         """
         @Test: Create lifecycle environment then update its name
@@ -346,14 +348,14 @@ class TestLifeCycleEnvironment(BaseCLI):
 
     @bzbug('1095937')
     @bzbug('1099655')
-    @data(
+    @data_set(lambda: (
         {'description': generate_string("alpha", 15)},
         {'description': generate_string("alphanumeric", 15)},
         {'description': generate_string("numeric", 15)},
         {'description': generate_string("latin1", 15)},
         {'description': generate_string("utf8", 15)},
         {'description': generate_string("html", 15)},
-    )
+    ))
     def test_positive_update_2(self, test_data):
         """
         @Test: Create lifecycle environment then update its description
@@ -8,7 +8,7 @@ Test class for Medium  CLI
 from ddt import ddt
 from robottelo.cli.factory import make_medium
 from robottelo.cli.medium import Medium
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data_set
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -31,12 +31,14 @@ class TestMedium(BaseCLI):
     factory = make_medium
     factory_obj = Medium
 
-    @data({'name': generate_string("latin1", 10)},
-          {'name': generate_string("utf8", 10)},
-          {'name': generate_string("alpha", 10)},
-          {'name': generate_string("alphanumeric", 10)},
-          {'name': generate_string("numeric", 10)},
-          {'name': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'name': generate_string("latin1", 10)},
+        {'name': generate_string("utf8", 10)},
+        {'name': generate_string("alpha", 10)},
+        {'name': generate_string("alphanumeric", 10)},
+        {'name': generate_string("numeric", 10)},
+        {'name': generate_string("html", 10)},
+    ))
     def test_positive_create_1(self, test_data):
         """
         @Feature: Medium - Positive Create
@@ -57,12 +59,14 @@ class TestMedium(BaseCLI):
         self.assertEqual(new_obj['name'],
                          result.stdout['name'])
 
-    @data({'name': generate_string("latin1", 10)},
-          {'name': generate_string("utf8", 10)},
-          {'name': generate_string("alpha", 10)},
-          {'name': generate_string("alphanumeric", 10)},
-          {'name': generate_string("numeric", 10)},
-          {'name': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'name': generate_string("latin1", 10)},
+        {'name': generate_string("utf8", 10)},
+        {'name': generate_string("alpha", 10)},
+        {'name': generate_string("alphanumeric", 10)},
+        {'name': generate_string("numeric", 10)},
+        {'name': generate_string("html", 10)},
+    ))
     def test_positive_delete_1(self, test_data):
         """
         @Feature: Medium - Positive Delete
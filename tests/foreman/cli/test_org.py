@@ -19,7 +19,7 @@ from robottelo.cli.factory import (
 from robottelo.cli.lifecycleenvironment import LifecycleEnvironment
 from robottelo.cli.org import Org
 from robottelo.common.constants import NOT_IMPLEMENTED
-from robottelo.common.decorators import data, bzbug, redminebug
+from robottelo.common.decorators import data, data_set, bzbug, redminebug
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -122,7 +122,7 @@ class TestOrg(BaseCLI):
     # Tests for issues
 
     # This test also covers the redmine bug 4443
-    @data(*positive_create_data_1())
+    @data_set(positive_create_data_1)
     def test_redmine_4486(self, test_data):
         """
         @test: Can search for an organization by name
@@ -159,7 +159,7 @@ class TestOrg(BaseCLI):
             len(return_value.stderr), 0, "There should not be an error here")
 
     @bzbug('1079587')
-    @data(*positive_create_data_1())
+    @data_set(positive_create_data_1)
     def test_bugzilla_1079587(self, test_data):
         """
         @test: Search for an organization by label
@@ -465,7 +465,7 @@ class TestOrg(BaseCLI):
 
     # CRUD
 
-    @data(*positive_create_data_1())
+    @data_set(positive_create_data_1)
     def test_positive_create_1(self, test_data):
         """
         @test: Create organization with valid name only
@@ -484,7 +484,7 @@ class TestOrg(BaseCLI):
             len(result.stdout), 0, "Failed to fetch organization")
         self.assertEqual(new_obj['name'], result.stdout['name'])
 
-    @data(*positive_create_data_2())
+    @data_set(positive_create_data_2)
     def test_positive_create_2(self, test_data):
         """
         @test: Create organization with valid matching name and label only
@@ -506,7 +506,7 @@ class TestOrg(BaseCLI):
         self.assertEqual(result.stdout['name'], result.stdout['label'])
         self.assertEqual(new_obj['name'], result.stdout['name'])
 
-    @data(*positive_name_label_data())
+    @data_set(positive_name_label_data)
     def test_positive_create_3(self, test_data):
         """
         @test: Create organization with valid unmatching name and label only
@@ -529,7 +529,7 @@ class TestOrg(BaseCLI):
         self.assertEqual(new_obj['name'],
                          result.stdout['name'])
 
-    @data(*positive_name_desc_data())
+    @data_set(positive_name_desc_data)
     def test_positive_create_4(self, test_data):
         """
         @test: Create organization with valid name and description only
@@ -553,7 +553,7 @@ class TestOrg(BaseCLI):
         self.assertEqual(new_obj['name'],
                          result.stdout['name'])
 
-    @data(*positive_name_desc_data())
+    @data_set(positive_name_desc_data)
     def test_positive_create_5(self, test_data):
         """
         @test: Create organization with valid name, label and description
@@ -879,18 +879,20 @@ class TestOrg(BaseCLI):
 
     # Negative Create
 
-    @data({'label': generate_string('alpha', 10),
-           'name': generate_string('alpha', 300)},
-          {'label': generate_string('alpha', 10),
-           'name': generate_string('numeric', 300)},
-          {'label': generate_string('alpha', 10),
-           'name': generate_string('alphanumeric', 300)},
-          {'label': generate_string('alpha', 10),
-           'name': generate_string('utf8', 300)},
-          {'label': generate_string('alpha', 10),
-           'name': generate_string('latin1', 300)},
-          {'label': generate_string('alpha', 10),
-           'name': generate_string('html', 300)})
+    @data_set(lambda: (
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('alpha', 300)},
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('numeric', 300)},
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('alphanumeric', 300)},
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('utf8', 300)},
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('latin1', 300)},
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('html', 300)},
+    ))
     def test_negative_create_0(self, test_data):
         """
         @test: Create organization with valid label and description, name is
@@ -903,9 +905,11 @@ class TestOrg(BaseCLI):
         self.assertTrue(result.stderr)
         self.assertNotEqual(result.return_code, 0)
 
-    @data(generate_string('alpha', 10),
-          generate_string('numeric', 10),
-          generate_string('alphanumeric', 10))
+    @data_set(lambda: (
+        generate_string('alpha', 10),
+        generate_string('numeric', 10),
+        generate_string('alphanumeric', 10),
+    ))
     def test_negative_create_1(self, test_data):
         """
         @test: Create organization with valid label and description, name is
@@ -918,9 +922,11 @@ class TestOrg(BaseCLI):
         self.assertTrue(result.stderr)
         self.assertNotEqual(result.return_code, 0)
 
-    @data(generate_string('alpha', 10),
-          generate_string('numeric', 10),
-          generate_string('alphanumeric', 10))
+    @data_set(lambda: (
+        generate_string('alpha', 10),
+        generate_string('numeric', 10),
+        generate_string('alphanumeric', 10),
+    ))
     def test_negative_create_2(self, test_data):
         """
         @test: Create organization with valid label and description, name is
@@ -934,9 +940,11 @@ class TestOrg(BaseCLI):
             len(result.stderr), 0, "There should be an exception here.")
         self.assertNotEqual(result.return_code, 0)
 
-    @data(generate_string('alpha', 10),
-          generate_string('numeric', 10),
-          generate_string('alphanumeric', 10))
+    @data_set(lambda: (
+        generate_string('alpha', 10),
+        generate_string('numeric', 10),
+        generate_string('alphanumeric', 10),
+    ))
     def test_negative_create_3(self, test_data):
         """
         @test: Create organization with valid values, then create a new one
@@ -956,7 +964,7 @@ class TestOrg(BaseCLI):
 
     # Positive Delete
 
-    @data(*positive_name_desc_label_data())
+    @data_set(positive_name_desc_label_data)
     def test_positive_delete_1(self, test_data):
         """
         @test: Create organization with valid values then delete it
@@ -988,7 +996,7 @@ class TestOrg(BaseCLI):
         self.assertEqual(
             len(result.stdout), 0, "Output should be blank.")
 
-    @data(*positive_name_desc_label_data())
+    @data_set(positive_name_desc_label_data)
     def test_positive_delete_2(self, test_data):
         """
         @test: Create organization with valid values then delete it
@@ -1020,7 +1028,7 @@ class TestOrg(BaseCLI):
         self.assertEqual(
             len(result.stdout), 0, "Output should be blank.")
 
-    @data(*positive_name_desc_label_data())
+    @data_set(positive_name_desc_label_data)
     def test_positive_delete_3(self, test_data):
         """
         @test: Create organization with valid values then delete it
@@ -1057,12 +1065,14 @@ class TestOrg(BaseCLI):
     # Positive Update
 
     @bzbug('1076541')
-    @data({'name': generate_string("latin1", 10)},
-          {'name': generate_string("utf8", 10)},
-          {'name': generate_string("alpha", 10)},
-          {'name': generate_string("alphanumeric", 10)},
-          {'name': generate_string("numeric", 10)},
-          {'name': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'name': generate_string("latin1", 10)},
+        {'name': generate_string("utf8", 10)},
+        {'name': generate_string("alpha", 10)},
+        {'name': generate_string("alphanumeric", 10)},
+        {'name': generate_string("numeric", 10)},
+        {'name': generate_string("html", 10)},
+    ))
     def test_positive_update_1(self, test_data):
         """
         @test: Create organization with valid values then update its name
@@ -1095,12 +1105,14 @@ class TestOrg(BaseCLI):
             "Org name was not updated"
         )
 
-    @data({'description': generate_string("latin1", 10)},
-          {'description': generate_string("utf8", 10)},
-          {'description': generate_string("alpha", 10)},
-          {'description': generate_string("alphanumeric", 10)},
-          {'description': generate_string("numeric", 10)},
-          {'description': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'description': generate_string("latin1", 10)},
+        {'description': generate_string("utf8", 10)},
+        {'description': generate_string("alpha", 10)},
+        {'description': generate_string("alphanumeric", 10)},
+        {'description': generate_string("numeric", 10)},
+        {'description': generate_string("html", 10)},
+    ))
     def test_positive_update_3(self, test_data):
         """
         @test: Create organization with valid values then update its
@@ -1134,18 +1146,20 @@ class TestOrg(BaseCLI):
         )
 
     @bzbug('1076541')
-    @data({'description': generate_string("latin1", 10),
-           'name': generate_string("latin1", 10)},
-          {'description': generate_string("utf8", 10),
-           'name': generate_string("utf8", 10)},
-          {'description': generate_string("alpha", 10),
-           'name': generate_string("alpha", 10)},
-          {'description': generate_string("alphanumeric", 10),
-           'name': generate_string("alphanumeric", 10)},
-          {'description': generate_string("numeric", 10),
-           'name': generate_string("numeric", 10)},
-          {'description': generate_string("html", 10),
-           'name': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'description': generate_string("latin1", 10),
+         'name': generate_string("latin1", 10)},
+        {'description': generate_string("utf8", 10),
+         'name': generate_string("utf8", 10)},
+        {'description': generate_string("alpha", 10),
+         'name': generate_string("alpha", 10)},
+        {'description': generate_string("alphanumeric", 10),
+         'name': generate_string("alphanumeric", 10)},
+        {'description': generate_string("numeric", 10),
+         'name': generate_string("numeric", 10)},
+        {'description': generate_string("html", 10),
+         'name': generate_string("html", 10)},
+    ))
     def test_positive_update_4(self, test_data):
         """
         @test: Create organization with valid values then update all values
@@ -1188,13 +1202,15 @@ class TestOrg(BaseCLI):
     # Negative Update
 
     @bzbug('1076541')
-    @data({'name': ' '},
-          {'name': generate_string('alpha', 300)},
-          {'name': generate_string('numeric', 300)},
-          {'name': generate_string('alphanumeric', 300)},
-          {'name': generate_string('utf8', 300)},
-          {'name': generate_string('latin1', 300)},
-          {'name': generate_string('html', 300)})
+    @data_set(lambda: (
+        {'name': ' '},
+        {'name': generate_string('alpha', 300)},
+        {'name': generate_string('numeric', 300)},
+        {'name': generate_string('alphanumeric', 300)},
+        {'name': generate_string('utf8', 300)},
+        {'name': generate_string('latin1', 300)},
+        {'name': generate_string('html', 300)},
+    ))
     def test_negative_update_1(self, test_data):
         """
         @test: Create organization then fail to update
@@ -1218,12 +1234,14 @@ class TestOrg(BaseCLI):
         self.assertGreater(len(result.stderr), 0,
                            "There should be error - hammer expects error")
 
-    @data({'description': generate_string('alpha', 3000)},
-          {'description': generate_string('numeric', 3000)},
-          {'description': generate_string('alphanumeric', 3000)},
-          {'description': generate_string('utf8', 3000)},
-          {'description': generate_string('latin1', 3000)},
-          {'description': generate_string('html', 3000)})
+    @data_set(lambda: (
+        {'description': generate_string('alpha', 3000)},
+        {'description': generate_string('numeric', 3000)},
+        {'description': generate_string('alphanumeric', 3000)},
+        {'description': generate_string('utf8', 3000)},
+        {'description': generate_string('latin1', 3000)},
+        {'description': generate_string('html', 3000)},
+    ))
     def test_negative_update_3(self, test_data):
         """
         @test: Create organization then fail to update description
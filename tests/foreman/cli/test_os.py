@@ -13,77 +13,100 @@ from robottelo.cli.factory import make_architecture
 from robottelo.cli.factory import make_os
 from robottelo.cli.factory import make_partition_table
 from robottelo.cli.factory import make_template
-from robottelo.common.decorators import data, bzbug, redminebug
+from robottelo.common.decorators import data_set, bzbug, redminebug
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
 
-POSITIVE_CREATE_DATA = (
-    {'name': generate_string("latin1", 10)},
-    {'name': generate_string("utf8", 10)},
-    {'name': generate_string("alpha", 10)},
-    {'name': generate_string("alphanumeric", 10)},
-    {'name': generate_string("numeric", 10)},
-    {'name': generate_string("html", 10)},
-)
-
-NEGATIVE_CREATE_DATA = (
-    {'name': generate_string("latin1", 300)},
-    {'name': generate_string("utf8", 300)},
-    {'name': generate_string("alpha", 300)},
-    {'name': generate_string("alphanumeric", 300)},
-    {'name': generate_string("numeric", 300)},
-    {'name': generate_string("alphanumeric", 300)},
-    {'name': " "},
-)
-
-POSITIVE_UPDATE_DATA = (
-    ({'name': generate_string("latin1", 10)},
-     {'name': generate_string("latin1", 10)}),
-    ({'name': generate_string("utf8", 10)},
-     {'name': generate_string("utf8", 10)}),
-    ({'name': generate_string("alpha", 10)},
-     {'name': generate_string("alpha", 10)}),
-    ({'name': generate_string("alphanumeric", 10)},
-     {'name': generate_string("alphanumeric", 10)}),
-    ({'name': generate_string("numeric", 10)},
-     {'name': generate_string("numeric", 10)}),
-    ({'name': generate_string("utf8", 10)},
-     {'name': generate_string("html", 6)}),
-)
-
-NEGATIVE_UPDATE_DATA = (
-    ({'name': generate_string("latin1", 10)},
-     {'name': generate_string("latin1", 300)}),
-    ({'name': generate_string("utf8", 10)},
-     {'name': generate_string("utf8", 300)}),
-    ({'name': generate_string("alpha", 10)},
-     {'name': generate_string("alpha", 300)}),
-    ({'name': generate_string("alphanumeric", 10)},
-     {'name': generate_string("alphanumeric", 300)}),
-    ({'name': generate_string("numeric", 10)},
-     {'name': generate_string("numeric", 300)}),
-    ({'name': generate_string("utf8", 10)},
-     {'name': " "}),
-    ({'name': generate_string("utf8", 10)},
-     {'name': generate_string("html", 300)}),
-)
-
-POSITIVE_DELETE_DATA = (
-    {'name': generate_string("latin1", 10)},
-    {'name': generate_string("utf8", 10)},
-    {'name': generate_string("alpha", 10)},
-    {'name': generate_string("alphanumeric", 10)},
-    {'name': generate_string("numeric", 10)},
-)
-
-NEGATIVE_DELETE_DATA = (
-    {'id': generate_string("alpha", 10)},
-    {'id': None},
-    {'id': ""},
-    {},
-    {'id': -1},
-)
+def positive_create_data():
+    """Random data for positive creation"""
+
+    return (
+        {'name': generate_string("latin1", 10)},
+        {'name': generate_string("utf8", 10)},
+        {'name': generate_string("alpha", 10)},
+        {'name': generate_string("alphanumeric", 10)},
+        {'name': generate_string("numeric", 10)},
+        {'name': generate_string("html", 10)},
+    )
+
+
+def negative_create_data():
+    """Random data for negative creation"""
+
+    return (
+        {'name': generate_string("latin1", 300)},
+        {'name': generate_string("utf8", 300)},
+        {'name': generate_string("alpha", 300)},
+        {'name': generate_string("alphanumeric", 300)},
+        {'name': generate_string("numeric", 300)},
+        {'name': generate_string("alphanumeric", 300)},
+        {'name': " "},
+    )
+
+
+def positive_update_data():
+    """Random data for positive update"""
+
+    return (
+        ({'name': generate_string("latin1", 10)},
+         {'name': generate_string("latin1", 10)}),
+        ({'name': generate_string("utf8", 10)},
+         {'name': generate_string("utf8", 10)}),
+        ({'name': generate_string("alpha", 10)},
+         {'name': generate_string("alpha", 10)}),
+        ({'name': generate_string("alphanumeric", 10)},
+         {'name': generate_string("alphanumeric", 10)}),
+        ({'name': generate_string("numeric", 10)},
+         {'name': generate_string("numeric", 10)}),
+        ({'name': generate_string("utf8", 10)},
+         {'name': generate_string("html", 6)}),
+    )
+
+
+def negative_update_data():
+    """Random data for negative update"""
+
+    return (
+        ({'name': generate_string("latin1", 10)},
+         {'name': generate_string("latin1", 300)}),
+        ({'name': generate_string("utf8", 10)},
+         {'name': generate_string("utf8", 300)}),
+        ({'name': generate_string("alpha", 10)},
+         {'name': generate_string("alpha", 300)}),
+        ({'name': generate_string("alphanumeric", 10)},
+         {'name': generate_string("alphanumeric", 300)}),
+        ({'name': generate_string("numeric", 10)},
+         {'name': generate_string("numeric", 300)}),
+        ({'name': generate_string("utf8", 10)},
+         {'name': " "}),
+        ({'name': generate_string("utf8", 10)},
+         {'name': generate_string("html", 300)}),
+    )
+
+
+def positive_delete_data():
+    """Random data for positive delete"""
+
+    return (
+        {'name': generate_string("latin1", 10)},
+        {'name': generate_string("utf8", 10)},
+        {'name': generate_string("alpha", 10)},
+        {'name': generate_string("alphanumeric", 10)},
+        {'name': generate_string("numeric", 10)},
+    )
+
+
+def negative_delete_data():
+    """Random data for negative delete"""
+
+    return (
+        {'id': generate_string("alpha", 10)},
+        {'id': None},
+        {'id': ""},
+        {},
+        {'id': -1},
+    )
 
 
 @ddt
@@ -175,7 +198,7 @@ class TestOperatingSystem(BaseCLI):
         self.assertEqual(str(result['major']), os_info.stdout['major-version'])
         self.assertEqual(str(result['minor']), os_info.stdout['minor-version'])
 
-    @data(*POSITIVE_CREATE_DATA)
+    @data_set(positive_create_data)
     def test_positive_create_1(self, test_data):
         """
         @test: Create Operating System for all variations of name
@@ -194,7 +217,7 @@ class TestOperatingSystem(BaseCLI):
             len(result.stderr), 0, "There should not be an exception here")
         self.assertEqual(result.stdout['name'], new_obj['name'])
 
-    @data(*NEGATIVE_CREATE_DATA)
+    @data_set(negative_create_data)
     def test_negative_create_1(self, test_data):
         """
         @test: Create Operating System using invalid names
@@ -205,7 +228,7 @@ class TestOperatingSystem(BaseCLI):
         with self.assertRaises(Exception):
             make_os(test_data)
 
-    @data(*POSITIVE_UPDATE_DATA)
+    @data_set(positive_update_data)
     def test_positive_update_1(self, test_data):
         """
         @test: Positive update of system name
@@ -242,7 +265,7 @@ class TestOperatingSystem(BaseCLI):
         # There should be some attributes changed now
         self.assertNotEqual(new_obj, result.stdout, "Object should be updated")
 
-    @data(*NEGATIVE_UPDATE_DATA)
+    @data_set(negative_update_data)
     def test_negative_update_1(self, test_data):
         """
         @test: Negative update of system name
@@ -283,7 +306,7 @@ class TestOperatingSystem(BaseCLI):
             result.stdout['name'],
             "Name should not be updated")
 
-    @data(*POSITIVE_DELETE_DATA)
+    @data_set(positive_delete_data)
     def test_positive_delete_1(self, test_data):
         """
         @test: Successfully deletes Operating System
@@ -312,7 +335,7 @@ class TestOperatingSystem(BaseCLI):
             len(result.stderr), 0, "Should have gotten an error")
         self.assertEqual(result.stdout, {}, "Should not get any output")
 
-    @data(*NEGATIVE_DELETE_DATA)
+    @data_set(negative_delete_data)
     def test_negative_delete_1(self, test_data):
         """
         @test: Not delete Operating System for invalid data
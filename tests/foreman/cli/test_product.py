@@ -6,11 +6,11 @@ Test class for Product CLI
 """
 
 from ddt import ddt
-from robottelo.cli.factory import (make_gpg_key, make_org, make_product,
-                                   make_sync_plan)
+from robottelo.cli import pool
+from robottelo.cli.factory import make_gpg_key, make_product, make_sync_plan
 from robottelo.cli.product import Product
 from nose.plugins.attrib import attr
-from robottelo.common.decorators import bzbug, data
+from robottelo.common.decorators import bzbug, data_set
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -31,17 +31,18 @@ class TestProduct(BaseCLI):
         super(TestProduct, self).setUp()
 
         if TestProduct.org is None:
-            TestProduct.org = make_org()
+            TestProduct.org = pool.lease(
+                'org', tainted=True)['org']
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_create_1(self, test_name):
         """
@@ -74,7 +75,7 @@ class TestProduct(BaseCLI):
         )
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15),
          u'label': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15),
@@ -87,7 +88,7 @@ class TestProduct(BaseCLI):
          u'label': generate_string('alphanumeric', 15)},
         {u'name': generate_string('html', 15),
          u'label': generate_string('numeric', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_create_2(self, test_name):
         """
@@ -121,7 +122,7 @@ class TestProduct(BaseCLI):
         )
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15),
          u'description': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15),
@@ -134,7 +135,7 @@ class TestProduct(BaseCLI):
          u'description': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15),
          u'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_create_3(self, test_name):
         """
@@ -170,14 +171,14 @@ class TestProduct(BaseCLI):
         )
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_create_4(self, test_name):
         """
@@ -215,14 +216,14 @@ class TestProduct(BaseCLI):
             "GPG Keys don't match")
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_create_5(self, test_name):
         """
@@ -257,14 +258,14 @@ class TestProduct(BaseCLI):
             new_sync_plan['id'],
             "Sync plans don't match")
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 300)},
         {u'name': generate_string('alphanumeric', 300)},
         {u'name': generate_string('numeric', 300)},
         {u'name': generate_string('latin1', 300)},
         {u'name': generate_string('utf8', 300)},
         {u'name': generate_string('html', 300)},
-    )
+    ))
     @attr('cli', 'product')
     def test_negative_create_1(self, test_name):
         """
@@ -281,14 +282,14 @@ class TestProduct(BaseCLI):
                 }
             )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('latin1', 15),
          u'label': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15),
          u'label': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15),
          u'label': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_negative_create_2(self, test_name):
         """
@@ -307,14 +308,14 @@ class TestProduct(BaseCLI):
             )
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'description': generate_string('alpha', 15)},
         {u'description': generate_string('alphanumeric', 15)},
         {u'description': generate_string('numeric', 15)},
         {u'description': generate_string('latin1', 15)},
         {u'description': generate_string('utf8', 15)},
         {u'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_update_1(self, test_data):
         """
@@ -367,14 +368,14 @@ class TestProduct(BaseCLI):
         )
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_update_2(self, test_name):
         """
@@ -461,14 +462,14 @@ class TestProduct(BaseCLI):
             "GPG Keys should not match")
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_update_3(self, test_name):
         """
@@ -556,14 +557,14 @@ class TestProduct(BaseCLI):
             "Sync plans should not match")
 
     @bzbug('1096320')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'product')
     def test_positive_delete_1(self, test_name):
         """
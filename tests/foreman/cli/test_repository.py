@@ -6,10 +6,11 @@ Test class for Repository CLI
 """
 
 from ddt import ddt
-from robottelo.cli.factory import (make_gpg_key, make_org, make_product,
+from robottelo.cli import pool
+from robottelo.cli.factory import (make_gpg_key, make_product,
                                    make_repository)
 from robottelo.cli.repository import Repository
-from robottelo.common.decorators import data, bzbug, stubbed
+from robottelo.common.decorators import data, data_set, bzbug, stubbed
 from robottelo.common.helpers import generate_string
 from nose.plugins.attrib import attr
 from tests.foreman.cli.basecli import BaseCLI
@@ -32,7 +33,8 @@ class TestRepository(BaseCLI):
         super(TestRepository, self).setUp()
 
         if TestRepository.org is None:
-            TestRepository.org = make_org()
+            TestRepository.org = pool.lease(
+                'org', tainted=True)['org']
         if TestRepository.product is None:
             TestRepository.product = make_product(
                 {u'organization-id': TestRepository.org['id']})
@@ -67,14 +69,14 @@ class TestRepository(BaseCLI):
         # Return the repository dictionary
         return new_repo
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'repository')
     def test_positive_create_1(self, test_data):
         """
@@ -91,14 +93,14 @@ class TestRepository(BaseCLI):
             "Names don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'repository')
     def test_positive_create_2(self, test_data):
         """
@@ -195,14 +197,14 @@ class TestRepository(BaseCLI):
         )
 
     @bzbug('1083236')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'repository')
     def test_positive_create_5(self, test_data):
         """
@@ -239,14 +241,14 @@ class TestRepository(BaseCLI):
         )
 
     @bzbug('1103944')
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'repository')
     def test_positive_create_6(self, test_data):
         """
@@ -338,14 +340,14 @@ class TestRepository(BaseCLI):
             "Publishing methods don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 300)},
         {u'name': generate_string('alphanumeric', 300)},
         {u'name': generate_string('numeric', 300)},
         {u'name': generate_string('latin1', 300)},
         {u'name': generate_string('utf8', 300)},
         {u'name': generate_string('html', 300)},
-    )
+    ))
     @attr('cli', 'repository')
     def test_negative_create_1(self, test_data):
         """
@@ -469,14 +471,14 @@ class TestRepository(BaseCLI):
         @Status: manual
         """
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'repository')
     def test_positive_delete_1(self, test_data):
         """
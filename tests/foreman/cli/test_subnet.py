@@ -9,7 +9,7 @@ from ddt import ddt
 from nose.plugins.attrib import attr
 from robottelo.cli.factory import make_subnet
 from robottelo.cli.subnet import Subnet
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data_set
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -20,14 +20,14 @@ class TestSubnet(BaseCLI):
     Subnet CLI tests.
     """
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'subnet')
     def test_positive_create_1(self, test_name):
         """
@@ -71,14 +71,14 @@ class TestSubnet(BaseCLI):
             total_subnet,
             "Total subnets should have increased")
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'subnet')
     def test_positive_update_1(self, test_name):
         """
@@ -122,14 +122,14 @@ class TestSubnet(BaseCLI):
             result.stdout['name'], new_subnet['name'], "Names should not match"
         )
 
-    @data(
+    @data_set(lambda: (
         {'name': generate_string('alpha', 15)},
         {'name': generate_string('alphanumeric', 15)},
         {'name': generate_string('numeric', 15)},
         {'name': generate_string('latin1', 15)},
         {'name': generate_string('utf8', 15)},
         {'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'subnet')
     def test_positive_delete_1(self, test_name):
         """
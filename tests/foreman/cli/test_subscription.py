@@ -3,9 +3,9 @@ Test class for Subscriptions
 """
 
 from ddt import ddt
+from robottelo.cli import pool
 from robottelo.cli.subscription import Subscription
-from robottelo.cli.factory import (
-    make_org, make_lifecycle_environment)
+from robottelo.cli.factory import make_lifecycle_environment
 from robottelo.common.decorators import bzbug
 from robottelo.common.manifests import manifest
 from robottelo.common.ssh import upload_file
@@ -31,7 +31,8 @@ class TestSubscription(BaseCLI):
         super(TestSubscription, self).setUp()
 
         if TestSubscription.org is None:
-            TestSubscription.org = make_org()
+            TestSubscription.org = pool.lease(
+                'org', tainted=True)['org']
         if TestSubscription.env1 is None:
             TestSubscription.env1 = make_lifecycle_environment(
                 {u'organization-id': TestSubscription.org['id']})
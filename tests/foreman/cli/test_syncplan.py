@@ -8,9 +8,10 @@ Test class for Product CLI
 from datetime import datetime, timedelta
 from ddt import ddt
 from nose.plugins.attrib import attr
-from robottelo.cli.factory import make_org, make_sync_plan
+from robottelo.cli import pool
+from robottelo.cli.factory import make_sync_plan
 from robottelo.cli.syncplan import SyncPlan
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data_set
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -31,7 +32,8 @@ class TestSyncPlan(BaseCLI):
         super(TestSyncPlan, self).setUp()
 
         if TestSyncPlan.org is None:
-            TestSyncPlan.org = make_org()
+            TestSyncPlan.org = pool.lease(
+                'org', tainted=True)['org']
 
     def _make_sync_plan(self, options=None):
         """
@@ -63,14 +65,14 @@ class TestSyncPlan(BaseCLI):
         # Return the sync plan dictionary
         return new_sync_plan
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'syncplan')
     def test_positive_create_1(self, test_data):
         """
@@ -87,14 +89,14 @@ class TestSyncPlan(BaseCLI):
             "Names don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'description': generate_string('alpha', 15)},
         {u'description': generate_string('alphanumeric', 15)},
         {u'description': generate_string('numeric', 15)},
         {u'description': generate_string('latin1', 15)},
         {u'description': generate_string('utf8', 15)},
         {u'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'syncplan')
     def test_positive_create_2(self, test_data):
         """
@@ -112,7 +114,7 @@ class TestSyncPlan(BaseCLI):
             "Descriptions don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15), u'interval': u'hourly'},
         {u'name': generate_string('alphanumeric', 15), u'interval': u'hourly'},
         {u'name': generate_string('numeric', 15), u'interval': u'hourly'},
@@ -131,7 +133,7 @@ class TestSyncPlan(BaseCLI):
         {u'name': generate_string('latin1', 15), u'interval': u'weekly'},
         {u'name': generate_string('utf8', 15), u'interval': u'weekly'},
         {u'name': generate_string('html', 15), u'interval': u'weekly'},
-    )
+    ))
     @attr('cli', 'syncplan')
     def test_positive_create_3(self, test_data):
         """
@@ -155,14 +157,14 @@ class TestSyncPlan(BaseCLI):
             "Intervals don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 300)},
         {u'name': generate_string('alphanumeric', 300)},
         {u'name': generate_string('numeric', 300)},
         {u'name': generate_string('latin1', 300)},
         {u'name': generate_string('utf8', 300)},
         {u'name': generate_string('html', 300)},
-    )
+    ))
     @attr('cli', 'syncplan')
     def test_negative_create_1(self, test_data):
         """
@@ -174,14 +176,14 @@ class TestSyncPlan(BaseCLI):
         with self.assertRaises(Exception):
             self._make_sync_plan({u'name': test_data['name']})
 
-    @data(
+    @data_set(lambda: (
         {u'description': generate_string('alpha', 15)},
         {u'description': generate_string('alphanumeric', 15)},
         {u'description': generate_string('numeric', 15)},
         {u'description': generate_string('latin1', 15)},
         {u'description': generate_string('utf8', 15)},
         {u'description': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'syncplan')
     def test_positive_update_1(self, test_data):
         """
@@ -241,7 +243,7 @@ class TestSyncPlan(BaseCLI):
             "Descriptions should not match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15),
          u'interval': u'daily', u'new-interval': u'hourly'},
         {u'name': generate_string('alphanumeric', 15),
@@ -278,7 +280,7 @@ class TestSyncPlan(BaseCLI):
          u'interval': u'hourly', u'new-interval': u'weekly'},
         {u'name': generate_string('html', 15),
          u'interval': u'hourly', u'new-interval': u'weekly'},
-    )
+    ))
     @attr('cli', 'syncplan')
     def test_positive_update_2(self, test_data):
         """
@@ -342,14 +344,14 @@ class TestSyncPlan(BaseCLI):
             "Intervals don't match"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'syncplan')
     def test_positive_update_3(self, test_data):
         """
@@ -415,14 +417,14 @@ class TestSyncPlan(BaseCLI):
             "Sync date was not updated"
         )
 
-    @data(
+    @data_set(lambda: (
         {u'name': generate_string('alpha', 15)},
         {u'name': generate_string('alphanumeric', 15)},
         {u'name': generate_string('numeric', 15)},
         {u'name': generate_string('latin1', 15)},
         {u'name': generate_string('utf8', 15)},
         {u'name': generate_string('html', 15)},
-    )
+    ))
     @attr('cli', 'syncplan')
     def test_positive_delete_1(self, test_data):
         """
@@ -16,7 +16,7 @@ from ddt import ddt
 from robottelo.cli.factory import make_user
 from robottelo.cli.user import User as UserObj
 from robottelo.common.constants import NOT_IMPLEMENTED
-from robottelo.common.decorators import data, bzbug, redminebug
+from robottelo.common.decorators import data, data_set, bzbug, redminebug
 from robottelo.common.helpers import generate_string
 from tests.foreman.cli.basecli import BaseCLI
 
@@ -97,12 +97,14 @@ class User(BaseCLI):
 
     # CRUD
 
-    @data({'login': generate_string("latin1", 10)},
-          {'login': generate_string("utf8", 10)},
-          {'login': generate_string("alpha", 10)},
-          {'login': generate_string("alphanumeric", 10)},
-          {'login': generate_string("numeric", 10)},
-          {'login': generate_string("alphanumeric", 100)})
+    @data_set(lambda: (
+        {'login': generate_string("latin1", 10)},
+        {'login': generate_string("utf8", 10)},
+        {'login': generate_string("alpha", 10)},
+        {'login': generate_string("alphanumeric", 10)},
+        {'login': generate_string("numeric", 10)},
+        {'login': generate_string("alphanumeric", 100)},
+    ))
     def test_positive_create_user_1(self, data):
         """
         @Test: Create User for all variations of Username
@@ -115,12 +117,14 @@ class User(BaseCLI):
         args = make_user(data)
         self.__assert_exists(args)
 
-    @data({'firstname': generate_string("latin1", 10)},
-          {'firstname': generate_string("utf8", 10)},
-          {'firstname': generate_string("alpha", 10)},
-          {'firstname': generate_string("alphanumeric", 10)},
-          {'firstname': generate_string("numeric", 10)},
-          {'firstname': generate_string("alphanumeric", 50)})
+    @data_set(lambda: (
+        {'firstname': generate_string("latin1", 10)},
+        {'firstname': generate_string("utf8", 10)},
+        {'firstname': generate_string("alpha", 10)},
+        {'firstname': generate_string("alphanumeric", 10)},
+        {'firstname': generate_string("numeric", 10)},
+        {'firstname': generate_string("alphanumeric", 50)},
+    ))
     def test_positive_create_user_2(self, data):
         """
         @Test: Create User for all variations of First Name
@@ -133,12 +137,14 @@ class User(BaseCLI):
         args = make_user(data)
         self.__assert_exists(args)
 
-    @data({'lastname': generate_string("latin1", 10)},
-          {'lastname': generate_string("utf8", 10)},
-          {'lastname': generate_string("alpha", 10)},
-          {'lastname': generate_string("alphanumeric", 10)},
-          {'lastname': generate_string("numeric", 10)},
-          {'lastname': generate_string("alphanumeric", 50)})
+    @data_set(lambda: (
+        {'lastname': generate_string("latin1", 10)},
+        {'lastname': generate_string("utf8", 10)},
+        {'lastname': generate_string("alpha", 10)},
+        {'lastname': generate_string("alphanumeric", 10)},
+        {'lastname': generate_string("numeric", 10)},
+        {'lastname': generate_string("alphanumeric", 50)},
+    ))
     def test_positive_create_user_3(self, data):
         """
         @Test: Create User for all variations of Surname
@@ -151,15 +157,17 @@ class User(BaseCLI):
         args = make_user(data)
         self.__assert_exists(args)
 
-    @data({'mail': generate_string("latin1", 10) +
-           "@somemail.com"},
-          {'mail': generate_string("utf8", 10) +
-           "@somemail.com"},
-          {'mail': generate_string("alpha", 10) + "@somemail.com"},
-          {'mail': generate_string("alphanumeric", 10) + "@somemail.com"},
-          {'mail': generate_string("numeric", 10) + "@somemail.com"},
-          {'mail': generate_string("alphanumeric", 50) +
-           "@somem.com"})  # max 60 chars
+    @data_set(lambda: (
+        {'mail': generate_string("latin1", 10) +
+         "@somemail.com"},
+        {'mail': generate_string("utf8", 10) +
+         "@somemail.com"},
+        {'mail': generate_string("alpha", 10) + "@somemail.com"},
+        {'mail': generate_string("alphanumeric", 10) + "@somemail.com"},
+        {'mail': generate_string("numeric", 10) + "@somemail.com"},
+        {'mail': generate_string("alphanumeric", 50) +
+         "@somem.com"},
+    ))  # max 60 chars
     def test_positive_create_user_4(self, data):
         """
         @Test: Create User for all variations of Email Address
@@ -172,12 +180,14 @@ class User(BaseCLI):
         args = make_user(data)
         self.__assert_exists(args)
 
-    @data({'password': generate_string("latin1", 10)},
-          {'password': generate_string("utf8", 10)},
-          {'password': generate_string("alpha", 10)},
-          {'password': generate_string("alphanumeric", 10)},
-          {'password': generate_string("numeric", 10)},
-          {'password': generate_string("alphanumeric", 3000)})
+    @data_set(lambda: (
+        {'password': generate_string("latin1", 10)},
+        {'password': generate_string("utf8", 10)},
+        {'password': generate_string("alpha", 10)},
+        {'password': generate_string("alphanumeric", 10)},
+        {'password': generate_string("numeric", 10)},
+        {'password': generate_string("alphanumeric", 3000)},
+    ))
     def test_positive_create_user_5(self, data):
         """
         @Test: Create User for all variations of Password
@@ -437,10 +447,12 @@ class User(BaseCLI):
         """
         pass
 
-    @data({'login': ''},
-          {'login': "space %s" % generate_string("alpha", 10)},
-          {'login': generate_string("alpha", 101)},
-          {'login': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'login': ''},
+        {'login': "space %s" % generate_string("alpha", 10)},
+        {'login': generate_string("alpha", 101)},
+        {'login': generate_string("html", 10)},
+    ))
     def test_negative_create_user_1(self, opts):
         """
         @Test: Create User with invalid Username
@@ -461,8 +473,10 @@ class User(BaseCLI):
         self.assertNotEqual(result.return_code, 0)
         self.assertTrue(result.stderr)
 
-    @data({'firstname': generate_string("alpha", 51)},
-          {'firstname': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'firstname': generate_string("alpha", 51)},
+        {'firstname': generate_string("html", 10)},
+    ))
     def test_negative_create_user_2(self, opts):
         """
         @Test: Create User with invalid Firstname
@@ -483,8 +497,10 @@ class User(BaseCLI):
         self.assertNotEqual(result.return_code, 0)
         self.assertTrue(result.stderr)
 
-    @data({'lastname': generate_string("alpha", 51)},
-          {'lastname': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'lastname': generate_string("alpha", 51)},
+        {'lastname': generate_string("html", 10)},
+    ))
     def test_negative_create_user_3(self, opts):
         """
         @Test: Create User with invalid Surname
@@ -506,17 +522,19 @@ class User(BaseCLI):
         self.assertTrue(result.stderr)
 
     @bzbug('1070730')
-    @data('foreman@',
-          '@foreman',
-          '@',
-          'Abc.example.com',
-          'A@b@c@example.com',
-          'email@brazil.b',
-          '%s@example.com' % generate_string("alpha", 49),  # total length 61
-          '',
-          '%s@example.com' % generate_string("html", 10),
-          's p a c e s@example.com',
-          'dot..dot@example.com')
+    @data_set(lambda: (
+        'foreman@',
+        '@foreman',
+        '@',
+        'Abc.example.com',
+        'A@b@c@example.com',
+        'email@brazil.b',
+        '%s@example.com' % generate_string("alpha", 49),  # total length 61
+        '',
+        '%s@example.com' % generate_string("html", 10),
+        's p a c e s@example.com',
+        'dot..dot@example.com',
+    ))
     def test_negative_create_user_4(self, email):
         """
         @Test: Create User with invalid Email Address
@@ -577,11 +595,13 @@ class User(BaseCLI):
         self.assertNotEqual(result.return_code, 0)
         self.assertTrue(result.stderr)
 
-    @data({'firstname': generate_string("latin1", 10)},
-          {'firstname': generate_string("utf8", 10)},
-          {'firstname': generate_string("alpha", 10)},
-          {'firstname': generate_string("alphanumeric", 10)},
-          {'firstname': generate_string("numeric", 10)},)
+    @data_set(lambda: (
+        {'firstname': generate_string("latin1", 10)},
+        {'firstname': generate_string("utf8", 10)},
+        {'firstname': generate_string("alpha", 10)},
+        {'firstname': generate_string("alphanumeric", 10)},
+        {'firstname': generate_string("numeric", 10)},
+    ))
     def test_positive_update_user_1(self, test_data):
         """
         @Test: Update Username in User
@@ -617,12 +637,14 @@ class User(BaseCLI):
             "User first name was not updated"
         )
 
-    @data({'login': generate_string("latin1", 10)},
-          {'login': generate_string("utf8", 10)},
-          {'login': generate_string("alpha", 10)},
-          {'login': generate_string("alphanumeric", 10)},
-          {'login': generate_string("numeric", 10)},
-          {'login': generate_string("alphanumeric", 100)})
+    @data_set(lambda: (
+        {'login': generate_string("latin1", 10)},
+        {'login': generate_string("utf8", 10)},
+        {'login': generate_string("alpha", 10)},
+        {'login': generate_string("alphanumeric", 10)},
+        {'login': generate_string("numeric", 10)},
+        {'login': generate_string("alphanumeric", 100)},
+    ))
     def test_positive_update_user_2(self, test_data):
         """
         @Test: Update Login in User
@@ -657,11 +679,13 @@ class User(BaseCLI):
             "User login was not updated"
         )
 
-    @data({'lastname': generate_string("latin1", 10)},
-          {'lastname': generate_string("utf8", 10)},
-          {'lastname': generate_string("alpha", 10)},
-          {'lastname': generate_string("alphanumeric", 10)},
-          {'lastname': generate_string("numeric", 10)},)
+    @data_set(lambda: (
+        {'lastname': generate_string("latin1", 10)},
+        {'lastname': generate_string("utf8", 10)},
+        {'lastname': generate_string("alpha", 10)},
+        {'lastname': generate_string("alphanumeric", 10)},
+        {'lastname': generate_string("numeric", 10)},
+    ))
     def test_positive_update_user_3(self, test_data):
         """
         @Test: Update Surname in User
@@ -699,11 +723,13 @@ class User(BaseCLI):
             "User last name was not updated"
         )
 
-    @data({'mail': generate_string("latin1", 10)},
-          {'mail': generate_string("utf8", 10)},
-          {'mail': generate_string("alpha", 10)},
-          {'mail': generate_string("alphanumeric", 10)},
-          {'mail': generate_string("numeric", 10)},)
+    @data_set(lambda: (
+        {'mail': generate_string("latin1", 10)},
+        {'mail': generate_string("utf8", 10)},
+        {'mail': generate_string("alpha", 10)},
+        {'mail': generate_string("alphanumeric", 10)},
+        {'mail': generate_string("numeric", 10)},
+    ))
     def test_positive_update_user_4(self, test_data):
         """
         @Test: Update Email Address in User
@@ -1053,8 +1079,10 @@ class User(BaseCLI):
         """
         pass
 
-    @data({'firstname': generate_string("alpha", 51)},
-          {'firstname': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'firstname': generate_string("alpha", 51)},
+        {'firstname': generate_string("html", 10)},
+    ))
     def test_negative_update_user_2(self, opts):
         """
         @Test: Update invalid Firstname in an User
@@ -1076,8 +1104,10 @@ class User(BaseCLI):
                                                       (new_user['firstname'],
                                                        new_user['lastname']))
 
-    @data({'lastname': generate_string("alpha", 51)},
-          {'lastname': generate_string("html", 10)})
+    @data_set(lambda: (
+        {'lastname': generate_string("alpha", 51)},
+        {'lastname': generate_string("html", 10)},
+    ))
     def test_negative_update_user_3(self, opts):
         """
         @Test: Update invalid Surname in an User
@@ -1100,17 +1130,19 @@ class User(BaseCLI):
                                                        new_user['lastname']))
 
     @bzbug('1070730')
-    @data('foreman@',
-          '@foreman',
-          '@',
-          'Abc.example.com',
-          'A@b@c@example.com',
-          'email@brazil.b',
-          '%s@example.com' % generate_string("alpha", 49),  # total length 61
-          '',
-          '%s@example.com' % generate_string("html", 10),
-          's p a c e s@example.com',
-          'dot..dot@example.com')
+    @data_set(lambda: (
+        'foreman@',
+        '@foreman',
+        '@',
+        'Abc.example.com',
+        'A@b@c@example.com',
+        'email@brazil.b',
+        '%s@example.com' % generate_string("alpha", 49),  # total length 61
+        '',
+        '%s@example.com' % generate_string("html", 10),
+        's p a c e s@example.com',
+        'dot..dot@example.com',
+    ))
     def test_negative_update_user_4(self, mail):
         """
         @Test: Update invalid Email Address in an User
@@ -1130,12 +1162,14 @@ class User(BaseCLI):
         self.assertEqual(updated_user.stdout['email'], new_user['mail'])
 
     @bzbug('1079649')
-    @data({'login': generate_string("latin1", 10)},
-          {'login': generate_string("utf8", 10)},
-          {'login': generate_string("alpha", 10)},
-          {'login': generate_string("alphanumeric", 10)},
-          {'login': generate_string("numeric", 10)},
-          {'login': generate_string("alphanumeric", 10)})
+    @data_set(lambda: (
+        {'login': generate_string("latin1", 10)},
+        {'login': generate_string("utf8", 10)},
+        {'login': generate_string("alpha", 10)},
+        {'login': generate_string("alphanumeric", 10)},
+        {'login': generate_string("numeric", 10)},
+        {'login': generate_string("alphanumeric", 10)},
+    ))
     def test_positive_delete_user_1(self, test_data):
         """
         @Test: Delete a user
@@ -1157,12 +1191,14 @@ class User(BaseCLI):
         self.assertGreater(len(result.stderr), 0)
 
     @bzbug('1079649')
-    @data({'login': generate_string("latin1", 10)},
-          {'login': generate_string("utf8", 10)},
-          {'login': generate_string("alpha", 10)},
-          {'login': generate_string("alphanumeric", 10)},
-          {'login': generate_string("numeric", 10)},
-          {'login': generate_string("alphanumeric", 10)})
+    @data_set(lambda: (
+        {'login': generate_string("latin1", 10)},
+        {'login': generate_string("utf8", 10)},
+        {'login': generate_string("alpha", 10)},
+        {'login': generate_string("alphanumeric", 10)},
+        {'login': generate_string("numeric", 10)},
+        {'login': generate_string("alphanumeric", 10)},
+    ))
     def test_positive_delete_user_2(self, test_data):
         """
         @Test: Delete an admin user
@@ -1202,12 +1238,14 @@ class User(BaseCLI):
         result = UserObj().exists(tuple_search=('login', 'admin'))
         self.assertTrue(result.stdout)
 
-    @data({'login': generate_string("alpha", 10)},
-          {'login': generate_string("alphanumeric", 10)},
-          {'login': generate_string("numeric", 10)},
-          {'login': generate_string("latin1", 10)},
-          {'login': generate_string("utf8", 10)},
-          {'login': generate_string("alphanumeric", 100)})
+    @data_set(lambda: (
+        {'login': generate_string("alpha", 10)},
+        {'login': generate_string("alphanumeric", 10)},
+        {'login': generate_string("numeric", 10)},
+        {'login': generate_string("latin1", 10)},
+        {'login': generate_string("utf8", 10)},
+        {'login': generate_string("alphanumeric", 100)},
+    ))
     def test_list_user_1(self, test_data):
         """
         @Test: List User for all variations of Username
@@ -1230,12 +1268,14 @@ class User(BaseCLI):
             'id': user['id'],
             'email': user['mail']}, result.stdout[0])
 
-    @data({'firstname': generate_string("latin1", 10)},
-          {'firstname': generate_string("utf8", 10)},
-          {'firstname': generate_string("alpha", 10)},
-          {'firstname': generate_string("alphanumeric", 10)},
-          {'firstname': generate_string("numeric", 10)},
-          {'firstname': generate_string("alphanumeric", 50)})
+    @data_set(lambda: (
+        {'firstname': generate_string("latin1", 10)},
+        {'firstname': generate_string("utf8", 10)},
+        {'firstname': generate_string("alpha", 10)},
+        {'firstname': generate_string("alphanumeric", 10)},
+        {'firstname': generate_string("numeric", 10)},
+        {'firstname': generate_string("alphanumeric", 50)},
+    ))
     def test_list_user_2(self, test_data):
         """
         @Test: List User for all variations of Firstname
@@ -1258,12 +1298,14 @@ class User(BaseCLI):
             'id': user['id'],
             'email': user['mail']} in result.stdout)
 
-    @data({'lastname': generate_string("latin1", 10)},
-          {'lastname': generate_string("utf8", 10)},
-          {'lastname': generate_string("alpha", 10)},
-          {'lastname': generate_string("alphanumeric", 10)},
-          {'lastname': generate_string("numeric", 10)},
-          {'lastname': generate_string("alphanumeric", 50)})
+    @data_set(lambda: (
+        {'lastname': generate_string("latin1", 10)},
+        {'lastname': generate_string("utf8", 10)},
+        {'lastname': generate_string("alpha", 10)},
+        {'lastname': generate_string("alphanumeric", 10)},
+        {'lastname': generate_string("numeric", 10)},
+        {'lastname': generate_string("alphanumeric", 50)},
+    ))
     def test_list_user_3(self, test_data):
         """
         @Test: List User for all variations of Surname
@@ -1286,12 +1328,14 @@ class User(BaseCLI):
             'id': user['id'],
             'email': user['mail']} in result.stdout)
 
-    @data({'mail': generate_string("latin1", 10) + "@somemail.com"},
-          {'mail': generate_string("utf8", 10) + "@somemail.com"},
-          {'mail': generate_string("alpha", 10) + "@somemail.com"},
-          {'mail': generate_string("alphanumeric", 10) + "@somemail.com"},
-          {'mail': generate_string("numeric", 10) + "@somemail.com"},
-          {'mail': generate_string("alphanumeric", 50) + "@somem.com"})
+    @data_set(lambda: (
+        {'mail': generate_string("latin1", 10) + "@somemail.com"},
+        {'mail': generate_string("utf8", 10) + "@somemail.com"},
+        {'mail': generate_string("alpha", 10) + "@somemail.com"},
+        {'mail': generate_string("alphanumeric", 10) + "@somemail.com"},
+        {'mail': generate_string("numeric", 10) + "@somemail.com"},
+        {'mail': generate_string("alphanumeric", 50) + "@somem.com"},
+    ))
     def test_list_user_4(self, test_data):
         """
         @Test: List User for all variations of Email Address
@@ -13,7 +13,7 @@ else:
 from ddt import ddt
 from nose.plugins.attrib import attr
 from robottelo.common.constants import NOT_IMPLEMENTED, ENVIRONMENT
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data_set, bzbug
 from robottelo.common.helpers import (generate_string,
                                       valid_names_list, invalid_names_list)
 from robottelo.ui.factory import make_org
@@ -81,7 +81,7 @@ class ActivationKey(BaseUI):
 
     @bzbug('1078676')
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_create_activation_key_1(self, name):
         """
         @Feature: Activation key - Positive Create
@@ -101,7 +101,7 @@ class ActivationKey(BaseUI):
 
     @bzbug('1078676')
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_create_activation_key_2(self, description):
         """
         @Feature: Activation key - Positive Create
@@ -122,7 +122,7 @@ class ActivationKey(BaseUI):
         self.assertIsNotNone(self.activationkey.search_key(name))
 
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_create_activation_key_3(self, env):
         """
         @Feature: Activation key - Positive Create
@@ -151,7 +151,7 @@ class ActivationKey(BaseUI):
         self.assertIsNotNone(self.activationkey.search_key(name))
 
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_create_activation_key_4(self, cv_name):
         """
         @Feature: Activation key - Positive Create
@@ -255,7 +255,7 @@ class ActivationKey(BaseUI):
         self.assertIsNotNone(self.activationkey.search_key(name))
 
     @bzbug('1083471')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_negative_create_activation_key_1(self, name):
         """
         @Feature: Activation key - Negative Create
@@ -297,7 +297,7 @@ class ActivationKey(BaseUI):
         self.assertIsNone(self.activationkey.search_key(name))
 
     @bzbug('1083027')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_negative_create_activation_key_3(self, limit):
         """
         @Feature: Activation key - Negative Create
@@ -318,7 +318,7 @@ class ActivationKey(BaseUI):
         self.assertIsNone(self.activationkey.search_key(name))
 
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_delete_activation_key_1(self, name):
         """
         @Feature: Activation key - Positive Delete
@@ -341,7 +341,7 @@ class ActivationKey(BaseUI):
         self.assertIsNone(self.activationkey.search_key(name))
 
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_delete_activation_key_2(self, description):
         """
         @Feature: Activation key - Positive Delete
@@ -365,7 +365,7 @@ class ActivationKey(BaseUI):
         self.assertIsNone(self.activationkey.search_key(name))
 
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_delete_activation_key_3(self, env):
         """
         @Feature: Activation key - Positive Delete
@@ -397,7 +397,7 @@ class ActivationKey(BaseUI):
         self.assertIsNone(self.activationkey.search_key(name))
 
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_delete_activation_key_4(self, cv_name):
         """
         @Feature: Activation key - Positive Delete
@@ -483,7 +483,7 @@ class ActivationKey(BaseUI):
 
     @bzbug('1078676')
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_update_activation_key_1(self, new_name):
         """
         @Feature: Activation key - Positive Update
@@ -506,7 +506,7 @@ class ActivationKey(BaseUI):
 
     @bzbug('1078676')
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_update_activation_key_2(self, new_description):
         """
         @Feature: Activation key - Positive Update
@@ -531,7 +531,7 @@ class ActivationKey(BaseUI):
 
     @bzbug('1089637')
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_update_activation_key_3(self, env_name):
         """
         @Feature: Activation key - Positive Update
@@ -567,7 +567,7 @@ class ActivationKey(BaseUI):
         self.assertEqual(env_name, selected_env)
 
     @attr('ui', 'ak', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_update_activation_key_4(self, cv2_name):
         """
         @Feature: Activation key - Positive Update
@@ -657,7 +657,7 @@ class ActivationKey(BaseUI):
                         (common_locators["alert.success"]))
 
     @bzbug('1083875')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_negative_update_activation_key_1(self, new_name):
         """
         @Feature: Activation key - Negative Update
@@ -706,7 +706,7 @@ class ActivationKey(BaseUI):
                         (common_locators["alert.error"]))
 
     @bzbug('1083027')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_negative_update_activation_key_3(self, limit):
         """
         @Feature: Activation key - Negative Update
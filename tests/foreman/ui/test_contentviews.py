@@ -15,7 +15,7 @@ else:
 from ddt import ddt
 from robottelo.common.constants import (NOT_IMPLEMENTED, REPO_TYPE,
                                         FILTER_CONTENT_TYPE, FILTER_TYPE)
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data_set, bzbug
 from robottelo.common.helpers import (generate_string, valid_names_list,
                                       invalid_names_list)
 from robottelo.ui.factory import make_org
@@ -63,7 +63,7 @@ class TestContentViewsUI(BaseUI):
         self.assertIsNotNone(self.content_views.search(cv_name))
 
     @bzbug('1083086')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_cv_create(self, name):
         """
         @test: create content views (positive)
@@ -82,7 +82,7 @@ class TestContentViewsUI(BaseUI):
                     name, self.org_name))
 
     @bzbug('1083086')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_cv_create_negative(self, name):
         # variations (subject to change):
         # zero length, symbols, html, etc.
@@ -15,7 +15,7 @@ from ddt import ddt
 from nose.plugins.attrib import attr
 from robottelo.common.constants import (NOT_IMPLEMENTED, VALID_GPG_KEY_FILE,
                                         VALID_GPG_KEY_BETA_FILE)
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data, data_set, bzbug
 from robottelo.common.helpers import (generate_string, get_data_file,
                                       read_data_file, valid_names_list,
                                       invalid_names_list, valid_data_list,
@@ -47,7 +47,7 @@ class GPGKey(BaseUI):
     # Positive Create
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_create_1(self, name):
         """
         @feature: GPG Keys
@@ -63,7 +63,7 @@ class GPGKey(BaseUI):
         self.assertIsNotNone(self.gpgkey.search(name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_create_2(self, name):
         """
         @feature: GPG Keys
@@ -82,7 +82,7 @@ class GPGKey(BaseUI):
     # Negative Create
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*valid_data_list())
+    @data_set(valid_data_list)
     def test_negative_create_1(self, name):
         """
         @feature: GPG Keys
@@ -102,7 +102,7 @@ class GPGKey(BaseUI):
                         (common_locators["alert.error"]))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*valid_data_list())
+    @data_set(valid_data_list)
     def test_negative_create_2(self, name):
         """
         @feature: GPG Keys
@@ -122,7 +122,7 @@ class GPGKey(BaseUI):
                         (common_locators["alert.error"]))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*valid_data_list())
+    @data_set(valid_data_list)
     def test_negative_create_3(self, name):
         """
         @feature: GPG Keys
@@ -138,7 +138,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.search(name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_negative_create_4(self, name):
         """
         @feature: GPG Keys
@@ -157,7 +157,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.search(name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_negative_create_5(self, name):
         """
         @feature: GPG Keys
@@ -178,7 +178,7 @@ class GPGKey(BaseUI):
     # Positive Delete
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_delete_1(self, name):
         """
         @feature: GPG Keys
@@ -197,7 +197,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.search(name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*valid_names_list())
+    @data_set(valid_names_list)
     def test_positive_delete_2(self, name):
         """
         @feature: GPG Keys
@@ -304,7 +304,7 @@ class GPGKey(BaseUI):
     # Negative Update
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_negative_update_1(self, new_name):
         """
         @feature: GPG Keys
@@ -326,7 +326,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.search(new_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*invalid_names_list())
+    @data_set(invalid_names_list)
     def test_negative_update_2(self, new_name):
         """
         @feature: GPG Keys
@@ -350,7 +350,7 @@ class GPGKey(BaseUI):
     # Product association
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_1(self, name):
         """
         @feature: GPG Keys
@@ -374,7 +374,7 @@ class GPGKey(BaseUI):
                          self.gpgkey.assert_product_repo(name, product=True))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_2(self, name):
         """
         @feature: GPG Keys
@@ -404,7 +404,7 @@ class GPGKey(BaseUI):
                              (name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_3(self, name):
         """
         @feature: GPG Keys
@@ -439,7 +439,7 @@ class GPGKey(BaseUI):
 
     @bzbug('1085035')
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_4(self, name):
         """
         @feature: GPG Keys
@@ -470,7 +470,7 @@ class GPGKey(BaseUI):
                              (name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_5(self, name):
         """
         @feature: GPG Keys
@@ -501,7 +501,7 @@ class GPGKey(BaseUI):
                              (name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_6(self, name):
         """
         @feature: GPG Keys
@@ -560,7 +560,7 @@ class GPGKey(BaseUI):
         pass
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_8(self, name):
         """
         @feature: GPG Keys
@@ -589,7 +589,7 @@ class GPGKey(BaseUI):
                          (new_name, product=True))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_9(self, name):
         """
         @feature: GPG Keys
@@ -626,7 +626,7 @@ class GPGKey(BaseUI):
                              (new_name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_10(self, name):
         """
         @feature: GPG Keys
@@ -668,7 +668,7 @@ class GPGKey(BaseUI):
 
     @bzbug('1085035')
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_11(self, name):
         """
         @feature: GPG Keys
@@ -705,7 +705,7 @@ class GPGKey(BaseUI):
                              (new_name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_12(self, name):
         """
         @feature: GPG Keys
@@ -743,7 +743,7 @@ class GPGKey(BaseUI):
                              (new_name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_13(self, name):
         """
         @feature: GPG Keys
@@ -809,7 +809,7 @@ class GPGKey(BaseUI):
         pass
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_15(self, name):
         """
         @feature: GPG Keys
@@ -838,7 +838,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.assert_key_from_product(name, prd_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_16(self, name):
         """
         @feature: GPG Keys
@@ -874,7 +874,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.assert_key_from_product(name, prd_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_17(self, name):
         """
         @feature: GPG Keys
@@ -914,7 +914,7 @@ class GPGKey(BaseUI):
 
     @bzbug('1085035')
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_18(self, name):
         """
         @feature: GPG Keys
@@ -949,7 +949,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.assert_key_from_product(name, prd_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_19(self, name):
         """
         @feature: GPG Keys
@@ -986,7 +986,7 @@ class GPGKey(BaseUI):
                           (name, prd_name, repo_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_20(self, name):
         """
         @feature: GPG Keys
@@ -1052,7 +1052,7 @@ class GPGKey(BaseUI):
         pass
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_22(self, name):
         """
         @feature: GPG Keys
@@ -1077,7 +1077,7 @@ class GPGKey(BaseUI):
                              (name, product=True))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_23(self, name):
         """
         @feature: GPG Keys
@@ -1109,7 +1109,7 @@ class GPGKey(BaseUI):
                              (name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_24(self, name):
         """
         @feature: GPG Keys
@@ -1146,7 +1146,7 @@ class GPGKey(BaseUI):
 
     @bzbug('1085035')
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_25(self, name):
         """
         @feature: GPG Keys
@@ -1177,7 +1177,7 @@ class GPGKey(BaseUI):
                              (name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_26(self, name):
         """
         @feature: GPG Keys
@@ -1209,7 +1209,7 @@ class GPGKey(BaseUI):
                              (name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_27(self, name):
         """
         @feature: GPG Keys
@@ -1269,7 +1269,7 @@ class GPGKey(BaseUI):
         pass
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_29(self, name):
         """
         @feature: GPG Keys
@@ -1298,7 +1298,7 @@ class GPGKey(BaseUI):
                          (new_name, product=True))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_30(self, name):
         """
         @feature: GPG Keys
@@ -1336,7 +1336,7 @@ class GPGKey(BaseUI):
                              (new_name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_31(self, name):
         """
         @feature: GPG Keys
@@ -1379,7 +1379,7 @@ class GPGKey(BaseUI):
 
     @bzbug('1085035')
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_32(self, name):
         """
         @feature: GPG Keys
@@ -1416,7 +1416,7 @@ class GPGKey(BaseUI):
                              (new_name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_33(self, name):
         """
         @feature: GPG Keys
@@ -1454,7 +1454,7 @@ class GPGKey(BaseUI):
                              (new_name, product=False))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_34(self, name):
         """
         @feature: GPG Keys
@@ -1521,7 +1521,7 @@ class GPGKey(BaseUI):
         pass
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_36(self, name):
         """
         @feature: GPG Keys
@@ -1550,7 +1550,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.assert_key_from_product(name, prd_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_37(self, name):
         """
         @feature: GPG Keys
@@ -1585,7 +1585,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.assert_key_from_product(name, prd_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_38(self, name):
         """
         @feature: GPG Keys
@@ -1625,7 +1625,7 @@ class GPGKey(BaseUI):
 
     @bzbug('1085035')
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_39(self, name):
         """
         @feature: GPG Keys
@@ -1660,7 +1660,7 @@ class GPGKey(BaseUI):
         self.assertIsNone(self.gpgkey.assert_key_from_product(name, prd_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_40(self, name):
         """
         @feature: GPG Keys
@@ -1696,7 +1696,7 @@ class GPGKey(BaseUI):
                           (name, prd_name, repo_name))
 
     @attr('ui', 'gpgkey', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_key_associate_41(self, name):
         """
         @feature: GPG Keys
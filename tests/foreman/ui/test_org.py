@@ -14,7 +14,7 @@ else:
 from ddt import ddt
 from nose.plugins.attrib import attr
 from robottelo.common import conf
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data, data_set
 from robottelo.common.helpers import (generate_strings_list,
                                       generate_string, generate_ipaddr,
                                       generate_email_address, get_data_file)
@@ -54,7 +54,7 @@ class Org(BaseUI):
     # Positive Create
 
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_create_1(self, org_name):
         """
         @feature: Organizations
@@ -68,24 +68,26 @@ class Org(BaseUI):
         self.assertIsNotNone(self.org.search(org_name))
 
     @attr('ui', 'org', 'implemented')
-    @data({'label': generate_string('alpha', 10),
-           'name': generate_string('alpha', 10),
-           'desc': generate_string('alpha', 10)},
-          {'label': generate_string('numeric', 10),
-           'name': generate_string('numeric', 10),
-           'desc': generate_string('numeric', 10)},
-          {'label': generate_string('alphanumeric', 10),
-           'name': generate_string('alphanumeric', 10),
-           'desc': generate_string('alphanumeric', 10)},
-          {'label': generate_string('alpha', 10),
-           'name': generate_string('utf8', 10),
-           'desc': generate_string('utf8', 10)},
-          {'label': generate_string('alpha', 10),
-           'name': generate_string('latin1', 20),
-           'desc': generate_string('latin1', 10)},
-          {'label': generate_string('alpha', 10),
-           'name': generate_string('html', 20),
-           'desc': generate_string('html', 10)})
+    @data_set(lambda: (
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('alpha', 10),
+         'desc': generate_string('alpha', 10)},
+        {'label': generate_string('numeric', 10),
+         'name': generate_string('numeric', 10),
+         'desc': generate_string('numeric', 10)},
+        {'label': generate_string('alphanumeric', 10),
+         'name': generate_string('alphanumeric', 10),
+         'desc': generate_string('alphanumeric', 10)},
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('utf8', 10),
+         'desc': generate_string('utf8', 10)},
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('latin1', 20),
+         'desc': generate_string('latin1', 10)},
+        {'label': generate_string('alpha', 10),
+         'name': generate_string('html', 20),
+         'desc': generate_string('html', 10)},
+    ))
     def test_positive_create_2(self, test_data):
         """
         @feature: Organizations
@@ -108,12 +110,14 @@ class Org(BaseUI):
         self.assertIsNotNone(self.org.search(org_name))
 
     @attr('ui', 'org', 'implemented')
-    @data({'name': generate_string('alpha', 10),
-           'label': generate_string('alpha', 10)},
-          {'name': generate_string('numeric', 10),
-           'label': generate_string('numeric', 10)},
-          {'name': generate_string('alphanumeric', 10),
-           'label': generate_string('alphanumeric', 10)})
+    @data_set(lambda: (
+        {'name': generate_string('alpha', 10),
+         'label': generate_string('alpha', 10)},
+        {'name': generate_string('numeric', 10),
+         'label': generate_string('numeric', 10)},
+        {'name': generate_string('alphanumeric', 10),
+         'label': generate_string('alphanumeric', 10)},
+    ))
     # As label cannot contain chars other than ascii alpha numerals, '_', '-'.
     def test_positive_create_3(self, test_data):
         """
@@ -136,9 +140,11 @@ class Org(BaseUI):
         self.assertNotEqual(name, label)
 
     @attr('ui', 'org', 'implemented')
-    @data({'data': generate_string('alpha', 10)},
-          {'data': generate_string('numeric', 10)},
-          {'data': generate_string('alphanumeric', 10)})
+    @data_set(lambda: (
+        {'data': generate_string('alpha', 10)},
+        {'data': generate_string('numeric', 10)},
+        {'data': generate_string('alphanumeric', 10)},
+    ))
     # As label cannot contain chars other than ascii alpha numerals, '_', '-'.
     def test_positive_create_4(self, test_data):
         """
@@ -160,18 +166,20 @@ class Org(BaseUI):
 
     @bzbug("1079482")
     @attr('ui', 'org', 'implemented')
-    @data({'name': generate_string('alpha', 10),
-           'desc': generate_string('alpha', 10)},
-          {'name': generate_string('numeric', 10),
-           'desc': generate_string('numeric', 10)},
-          {'name': generate_string('alphanumeric', 10),
-           'desc': generate_string('alphanumeric', 10)},
-          {'name': generate_string('utf8', 10),
-           'desc': generate_string('utf8', 10)},
-          {'name': generate_string('latin1', 20),
-           'desc': generate_string('latin1', 10)},
-          {'name': generate_string('html', 20),
-           'desc': generate_string('html', 10)})
+    @data_set(lambda: (
+        {'name': generate_string('alpha', 10),
+         'desc': generate_string('alpha', 10)},
+        {'name': generate_string('numeric', 10),
+         'desc': generate_string('numeric', 10)},
+        {'name': generate_string('alphanumeric', 10),
+         'desc': generate_string('alphanumeric', 10)},
+        {'name': generate_string('utf8', 10),
+         'desc': generate_string('utf8', 10)},
+        {'name': generate_string('latin1', 20),
+         'desc': generate_string('latin1', 10)},
+        {'name': generate_string('html', 20),
+         'desc': generate_string('html', 10)},
+    ))
     def test_positive_create_5(self, test_data):
         """
         @feature: Organizations
@@ -195,7 +203,7 @@ class Org(BaseUI):
         self.assertTrue(label_value)
 
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list(len1=256))
+    @data_set(generate_strings_list, len1=256)
     def test_negative_create_0(self, org_name):
         """
         @feature: Organizations
@@ -240,7 +248,7 @@ class Org(BaseUI):
         self.assertTrue(error)
 
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_negative_create_3(self, org_name):
         """
         @feature: Organizations
@@ -261,7 +269,7 @@ class Org(BaseUI):
     # Positive Delete
 
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_delete_1(self, org_name):
         """
         @feature: Organizations
@@ -282,7 +290,7 @@ class Org(BaseUI):
     # Positive Update
 
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_update_1(self, new_name):
         """
         @feature: Organizations
@@ -301,7 +309,7 @@ class Org(BaseUI):
     # Negative Update
 
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_negative_update_1(self, org_name):
         """
         @feature: Organizations
@@ -323,7 +331,7 @@ class Org(BaseUI):
     # Miscellaneous
 
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_search_key_1(self, org_name):
         """
         @feature: Organizations
@@ -341,7 +349,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_domain_1(self, domain):
         """
         @feature: Organizations
@@ -378,7 +386,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_user_3(self, user_name):
         """
         @feature: Organizations
@@ -419,7 +427,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_hostgroup_1(self, host_grp):
         """
         @feature: Organizations
@@ -476,7 +484,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_subnet_1(self, subnet_name):
         """
         @feature: Organizations
@@ -509,7 +517,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_domain_1(self, domain):
         """
         @feature: Organizations
@@ -539,7 +547,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_user_2(self, user):
         """
         @feature: Organizations
@@ -573,7 +581,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_hostgroup_1(self, host_grp):
         """
         @feature: Organizations
@@ -603,7 +611,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_location_1(self, location):
         """
         @feature: Organizations
@@ -633,7 +641,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_computeresource_1(self, resource_name):
         """
         @feature: Organizations
@@ -676,7 +684,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_medium_1(self, medium):
         """
         @feature: Organizations
@@ -715,7 +723,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_configtemplate_1(self, template):
         """
         @feature: Organizations
@@ -754,7 +762,7 @@ class Org(BaseUI):
         self.assertTrue(element)
 
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_environment_1(self, env):
         """
         @feature: Organizations
@@ -804,7 +812,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_computeresource_1(self, resource_name):
         """
         @feature: Organizations
@@ -840,7 +848,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_medium_1(self, medium):
         """
         @feature: Organizations
@@ -872,7 +880,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_add_configtemplate_1(self, template):
         """
         @feature: Organizations
@@ -906,7 +914,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_environment_1(self, env):
         """
         @feature: Organizations
@@ -943,7 +951,7 @@ class Org(BaseUI):
 
     @bzbug('1076562')
     @attr('ui', 'org', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_subnet_1(self, subnet_name):
         """
         @feature: Organizations
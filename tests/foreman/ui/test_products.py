@@ -4,7 +4,7 @@ Test class for Products UI
 
 from ddt import ddt
 from nose.plugins.attrib import attr
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data_set
 from robottelo.common.helpers import generate_string, generate_strings_list
 from robottelo.ui.factory import make_org
 from robottelo.ui.locators import common_locators
@@ -29,7 +29,7 @@ class Products(BaseUI):
                 make_org(session, org_name=Products.org_name)
 
     @attr('ui', 'prd', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_create_0(self, prd_name):
         """
         @Feature: Content Product - Positive Create
@@ -45,7 +45,7 @@ class Products(BaseUI):
         self.assertIsNotNone(self.products.search(prd_name))
 
     @attr('ui', 'prd', 'implemented')
-    @data(*generate_strings_list(len1=256))
+    @data_set(generate_strings_list, len1=256)
     def test_negative_create_0(self, prd_name):
         """
         @Feature: Content Product - Negative Create too long
@@ -97,7 +97,7 @@ class Products(BaseUI):
         self.assertTrue(invalid)
 
     @attr('ui', 'prd', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_negative_create_3(self, prd_name):
         """
         @Feature: Content Product - Negative Create with same name
@@ -117,7 +117,7 @@ class Products(BaseUI):
         self.assertTrue(error)
 
     @attr('ui', 'prd', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_update_0(self, prd_name):
         """
         @Feature: Content Product - Positive Update
@@ -136,7 +136,7 @@ class Products(BaseUI):
         self.assertIsNotNone(self.products.search(new_prd_name))
 
     @attr('ui', 'prd', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_negative_update_0(self, prd_name):
         """
         @Feature: Content Product - Negative Update
@@ -157,7 +157,7 @@ class Products(BaseUI):
         self.assertTrue(error)
 
     @attr('ui', 'prd', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_prd(self, prd_name):
         """
         @Feature: Content Product - Positive Delete
@@ -6,7 +6,7 @@ from ddt import ddt
 from nose.plugins.attrib import attr
 from robottelo.common.constants import (VALID_GPG_KEY_FILE,
                                         VALID_GPG_KEY_BETA_FILE)
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data_set, bzbug
 from robottelo.common.helpers import (generate_string,
                                       generate_strings_list, get_data_file)
 from robottelo.ui.factory import make_org
@@ -32,7 +32,7 @@ class Repos(BaseUI):
                 make_org(session, org_name=Repos.org_name)
 
     @attr('ui', 'repo', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_create_repo(self, repo_name):
         """
         @Feature: Content Repos - Positive Create
@@ -95,7 +95,7 @@ class Repos(BaseUI):
 
     @bzbug("1081059")
     @attr('ui', 'repo', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_negative_create_3(self, repo_name):
         """
         @Feature: Content Repos - Negative Create with same name
@@ -121,7 +121,7 @@ class Repos(BaseUI):
         self.assertTrue(invalid)
 
     @attr('ui', 'repo', 'implemented')
-    @data(*generate_strings_list(len1=256))
+    @data_set(generate_strings_list, len1=256)
     def test_negative_create_4(self, repo_name):
         """
         @Feature: Content Repos - Negative Create with same name
@@ -143,7 +143,7 @@ class Repos(BaseUI):
         self.assertTrue(error)
 
     @attr('ui', 'repo', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_update_1(self, repo_name):
         """
         @Feature: Content Repo - Positive Update
@@ -173,7 +173,7 @@ class Repos(BaseUI):
         self.assertEqual(url_text, new_repo_url)
 
     @attr('ui', 'repo', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_update_2(self, repo_name):
         """
         @Feature: Content Repo - Positive Update
@@ -212,7 +212,7 @@ class Repos(BaseUI):
         self.assertEqual(gpgkey_text2, gpgkey_name2)
 
     @attr('ui', 'repo', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_remove_repo(self, repo_name):
         """
         @Feature: Content Repos - Positive Delete
@@ -10,7 +10,7 @@ else:
 
 from ddt import ddt
 from nose.plugins.attrib import attr
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data_set
 from robottelo.common.helpers import generate_string, generate_strings_list
 from robottelo.ui.factory import make_org
 from robottelo.ui.session import Session
@@ -44,7 +44,7 @@ class Sync(BaseUI):
                 make_org(session, org_name=Sync.org_name)
 
     @attr('ui', 'sync', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_sync_repos(self, repo_name):
         """
         @Feature: Content Custom Sync - Positive Create
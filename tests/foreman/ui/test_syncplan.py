@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from ddt import ddt
 from nose.plugins.attrib import attr
 from robottelo.common.constants import SYNC_INTERVAL
-from robottelo.common.decorators import data, bzbug
+from robottelo.common.decorators import data_set, bzbug
 from robottelo.common.helpers import generate_string, generate_strings_list
 from robottelo.ui.factory import make_org
 from robottelo.ui.locators import locators, common_locators, tab_locators
@@ -39,51 +39,53 @@ class Syncplan(BaseUI):
         self.navigator.go_to_sync_plans()
 
     @attr('ui', 'syncplan', 'implemented')
-    @data({u'name': generate_string('alpha', 10),
-           u'desc': generate_string('alpha', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('numeric', 10),
-           u'desc': generate_string('numeric', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('alphanumeric', 10),
-           u'desc': generate_string('alphanumeric', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('utf8', 10),
-           u'desc': generate_string('utf8', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('html', 20),
-           u'desc': generate_string('html', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('alpha', 10),
-           u'desc': generate_string('alpha', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('numeric', 10),
-           u'desc': generate_string('numeric', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('alphanumeric', 10),
-           u'desc': generate_string('alphanumeric', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('utf8', 10),
-           u'desc': generate_string('utf8', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('html', 20),
-           u'desc': generate_string('html', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('alpha', 10),
-           u'desc': generate_string('alpha', 10),
-           u'interval': SYNC_INTERVAL['week']},
-          {u'name': generate_string('numeric', 10),
-           u'desc': generate_string('numeric', 10),
-           u'interval': SYNC_INTERVAL['week']},
-          {u'name': generate_string('alphanumeric', 10),
-           u'desc': generate_string('alphanumeric', 10),
-           u'interval': SYNC_INTERVAL['week']},
-          {u'name': generate_string('utf8', 10),
-           u'desc': generate_string('utf8', 10),
-           u'interval': SYNC_INTERVAL['week']},
-          {u'name': generate_string('html', 20),
-           u'desc': generate_string('html', 10),
-           u'interval': SYNC_INTERVAL['week']})
+    @data_set(lambda: (
+        {u'name': generate_string('alpha', 10),
+         u'desc': generate_string('alpha', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('numeric', 10),
+         u'desc': generate_string('numeric', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('alphanumeric', 10),
+         u'desc': generate_string('alphanumeric', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('utf8', 10),
+         u'desc': generate_string('utf8', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('html', 20),
+         u'desc': generate_string('html', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('alpha', 10),
+         u'desc': generate_string('alpha', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('numeric', 10),
+         u'desc': generate_string('numeric', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('alphanumeric', 10),
+         u'desc': generate_string('alphanumeric', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('utf8', 10),
+         u'desc': generate_string('utf8', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('html', 20),
+         u'desc': generate_string('html', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('alpha', 10),
+         u'desc': generate_string('alpha', 10),
+         u'interval': SYNC_INTERVAL['week']},
+        {u'name': generate_string('numeric', 10),
+         u'desc': generate_string('numeric', 10),
+         u'interval': SYNC_INTERVAL['week']},
+        {u'name': generate_string('alphanumeric', 10),
+         u'desc': generate_string('alphanumeric', 10),
+         u'interval': SYNC_INTERVAL['week']},
+        {u'name': generate_string('utf8', 10),
+         u'desc': generate_string('utf8', 10),
+         u'interval': SYNC_INTERVAL['week']},
+        {u'name': generate_string('html', 20),
+         u'desc': generate_string('html', 10),
+         u'interval': SYNC_INTERVAL['week']},
+    ))
     def test_positive_create_1(self, test_data):
         """
         @Feature: Content Sync Plan - Positive Create
@@ -98,7 +100,7 @@ class Syncplan(BaseUI):
 
     @bzbug("1087425")
     @attr('ui', 'syncplan', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_create_2(self, name):
         """
         @Feature: Content Sync Plan - Positive Create
@@ -206,7 +208,7 @@ class Syncplan(BaseUI):
 
     @bzbug("1087425")
     @attr('ui', 'syncplan', 'implemented')
-    @data(*generate_strings_list(len1=256))
+    @data_set(generate_strings_list, len1=256)
     def test_negative_create_3(self, name):
         """
         @Feature: Content Sync Plan - Negative Create
@@ -223,7 +225,7 @@ class Syncplan(BaseUI):
         self.assertTrue(error)
 
     @attr('ui', 'syncplan', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_update_1(self, plan_name):
         """
         @Feature: Content Sync Plan - Positive Update name
@@ -240,36 +242,38 @@ class Syncplan(BaseUI):
         self.assertIsNotNone(self.products.search(new_plan_name))
 
     @attr('ui', 'syncplan', 'implemented')
-    @data({u'name': generate_string('alpha', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('numeric', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('alphanumeric', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('utf8', 10),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('html', 20),
-           u'interval': SYNC_INTERVAL['hour']},
-          {u'name': generate_string('alpha', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('numeric', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('alphanumeric', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('utf8', 10),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('html', 20),
-           u'interval': SYNC_INTERVAL['day']},
-          {u'name': generate_string('alpha', 10),
-           u'interval': SYNC_INTERVAL['week']},
-          {u'name': generate_string('numeric', 10),
-           u'interval': SYNC_INTERVAL['week']},
-          {u'name': generate_string('alphanumeric', 10),
-           u'interval': SYNC_INTERVAL['week']},
-          {u'name': generate_string('utf8', 10),
-           u'interval': SYNC_INTERVAL['week']},
-          {u'name': generate_string('html', 20),
-           u'interval': SYNC_INTERVAL['week']})
+    @data_set(lambda: (
+        {u'name': generate_string('alpha', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('numeric', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('alphanumeric', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('utf8', 10),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('html', 20),
+         u'interval': SYNC_INTERVAL['hour']},
+        {u'name': generate_string('alpha', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('numeric', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('alphanumeric', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('utf8', 10),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('html', 20),
+         u'interval': SYNC_INTERVAL['day']},
+        {u'name': generate_string('alpha', 10),
+         u'interval': SYNC_INTERVAL['week']},
+        {u'name': generate_string('numeric', 10),
+         u'interval': SYNC_INTERVAL['week']},
+        {u'name': generate_string('alphanumeric', 10),
+         u'interval': SYNC_INTERVAL['week']},
+        {u'name': generate_string('utf8', 10),
+         u'interval': SYNC_INTERVAL['week']},
+        {u'name': generate_string('html', 20),
+         u'interval': SYNC_INTERVAL['week']},
+    ))
     def test_positive_update_2(self, test_data):
         """
         @Feature: Content Sync Plan - Positive Update interval
@@ -290,7 +294,7 @@ class Syncplan(BaseUI):
         self.assertEqual(interval_text, test_data['interval'])
 
     @attr('ui', 'syncplan', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_update_3(self, plan_name):
         """
         @Feature: Content Sync Plan - Positive Update add products
@@ -320,7 +324,7 @@ class Syncplan(BaseUI):
         self.assertTrue(prd_element)
 
     @attr('ui', 'syncplan', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_update_4(self, plan_name):
         """
         @Feature: Content Sync Plan - Positive Update remove products
@@ -363,7 +367,7 @@ class Syncplan(BaseUI):
         self.assertTrue(prd_element)
 
     @attr('ui', 'syncplan', 'implemented')
-    @data(*generate_strings_list())
+    @data_set(generate_strings_list)
     def test_positive_delete_1(self, plan_name):
         """
         @Feature: Content Sync Plan - Positive Delete
@@ -14,7 +14,7 @@ else:
 from ddt import ddt
 from nose.plugins.attrib import attr
 from robottelo.common.constants import NOT_IMPLEMENTED, LANGUAGES
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data, data_set
 from robottelo.common.helpers import (generate_email_address,
                                       generate_string)
 from robottelo.ui.factory import make_org
@@ -214,7 +214,7 @@ class User(BaseUI):
         self.assertTrue(element2)
 
     @attr('ui', 'user', 'implemented')
-    @data(*gen_valid_usernames())
+    @data_set(gen_valid_usernames)
     def test_positive_create_user_1(self, user_name):
         """
         @Feature: User - Positive Create
@@ -231,7 +231,7 @@ class User(BaseUI):
         self.assertIsNotNone(self.user.search(user_name, search_key))
 
     @attr('ui', 'user', 'implemented')
-    @data(*gen_valid_usernames(50))
+    @data_set(gen_valid_usernames, 50)
     def test_positive_create_user_2(self, first):
         """
         @Feature: User - Positive Create
@@ -253,7 +253,7 @@ class User(BaseUI):
             "users.firstname"]).get_attribute("value") == first)
 
     @attr('ui', 'user', 'implemented')
-    @data(*gen_valid_usernames(50))
+    @data_set(gen_valid_usernames, 50)
     def test_positive_create_user_3(self, last_name):
         """
         @Feature: User - Positive Create
@@ -323,7 +323,7 @@ class User(BaseUI):
         pass
 
     @attr('ui', 'user', 'implemented')
-    @data(*gen_valid_strings())
+    @data_set(gen_valid_strings)
     def test_positive_create_user_7(self, password):
         """
         @Feature: User - Positive Create
@@ -663,7 +663,7 @@ class User(BaseUI):
         pass
 
     @attr('ui', 'user', 'implemented')
-    @data(*gen_invalid_strings())
+    @data_set(gen_invalid_strings)
     def test_negative_create_user_2(self, user_name):
         """
         @Feature: User - Negative Create
@@ -680,7 +680,7 @@ class User(BaseUI):
         self.assertTrue(error)
 
     @attr('ui', 'user', 'implemented')
-    @data(*gen_invalid_surnames())
+    @data_set(gen_invalid_surnames)
     def test_negative_create_user_3(self, first):
         """
         @Feature: User - Negative Create
@@ -697,7 +697,7 @@ class User(BaseUI):
         self.assertTrue(error)
 
     @attr('ui', 'user', 'implemented')
-    @data(*gen_invalid_surnames())
+    @data_set(gen_invalid_surnames)
     def test_negative_create_user_4(self, last_name):
         """
         @Feature: User - Negative Create
@@ -762,7 +762,7 @@ class User(BaseUI):
         self.assertTrue(error)
 
     @attr('ui', 'user', 'implemented')
-    @data(*gen_valid_usernames())
+    @data_set(gen_valid_usernames)
     def test_positive_update_user_1(self, new_username):
         """
         @Feature: User - Positive Update
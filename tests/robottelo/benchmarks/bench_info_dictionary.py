@@ -0,0 +1,158 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Compares helpers.info_dictionary with its former implementation on large
+synthetic ``info`` outputs::
+
+    $ python -m tests.robottelo.benchmarks.bench_info_dictionary [repeat]
+"""
+
+import re
+import sys
+
+from robottelo.common.benchmark import format_summary, measure, summarize
+from robottelo.common.helpers import info_dictionary
+
+
+class Result(object):
+    """Stands for the SSHCommandResult info_dictionary is given"""
+    def __init__(self, stdout):
+        self.stdout = stdout
+
+
+def organization_info(entries):
+    """Output of ``organization info`` with ``entries`` per collection"""
+    lines = [u'Id:                   1', u'Name:                 org1']
+    for group in (u'Users', u'Subnets', u'Domains', u'Templates',
+                  u'Environments', u'Hostgroups'):
+        lines.append(u'%s:        ' % group)
+        lines.extend(
+            u' %d) %s %d' % (index, group.lower(), index)
+            for index in range(1, entries + 1))
+    lines.append(u'Parameters:           ')
+    lines.extend(
+        u' param%d => value%d' % (index, index)
+        for index in range(1, entries + 1))
+    return lines
+
+
+def content_view_info(entries):
+    """Output of ``content-view info`` with ``entries`` repositories"""
+    lines = [u'ID:                     4', u'Name:                   cv1']
+    lines.append(u'Yum Repositories:       ')
+    for index in range(1, entries + 1):
+        lines.extend([
+            u' %d) ID:    %d' % (index, index),
+            u'    Name:  repo%d' % index,
+            u'    Label: repo%d' % index,
+        ])
+    return lines
+
+
+OUTPUTS = (
+    ('organization info x500', organization_info(500)),
+    ('content-view info x500', content_view_info(500)),
+)
+
+
+def legacy_info_dictionary(result):
+    """
+    info_dictionary as it was before being rewritten as a single pass
+    parser, kept as the baseline.
+    """
+    # info dictionary
+    r = {}
+    sub_prop = None  # stores name of the last group of sub-properties
+    sub_num = None  # is not None when list of properties
+
+    for line in result.stdout:
+        # skip empty lines
+        if line == '':
+            continue
+        if line.startswith(' '):  # sub-properties are indented
+            # values are separated by ':' or '=>'
+            if line.find(':') != -1:
+                key, value = line.lstrip().split(":", 1)
+            elif line.find('=>') != -1:
+                key, value = line.lstrip().split(" =>", 1)
+            else:
+                key = value = None
+
+            if key is None and value is None:
+                # Parse single attribute collection properties
+                # Template
+                #  1) template1
+                #  2) template2
+                #
+                # or
+                # Template
+                #  template1
+                #  template2
+                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
+
+                if match is None:
+                    match = re.match(r'(.*)$', line.lstrip())
+
+                value = match.group(1)
+
+                if isinstance(r[sub_prop], dict):
+                    r[sub_prop] = []
+
+                r[sub_prop].append(value)
+            else:
+                # some properties have many numbered values
+                # Example:
+                # Content:
+                #  1) Repo Name: repo1
+                #     URL:       /custom/4f84fc90-9ffa-...
+                #  2) Repo Name: puppet1
+                #     URL:       /custom/4f84fc90-9ffa-...
+                starts_with_number = re.match(r'(\d+)\)', key)
+                if starts_with_number:
+                    sub_num = int(starts_with_number.group(1))
+                    # no. 1) we need to change dict() to list()
+                    if sub_num == 1:
+                        r[sub_prop] = []
+                    # remove number from key
+                    key = re.sub(r'\d+\)', '', key)
+                    # append empty dict to array
+                    r[sub_prop].append({})
+
+                key = key.lstrip().replace(' ', '-').lower()
+
+                # add value to dictionary
+                if sub_num is not None:
+                    r[sub_prop][-1][key] = value.lstrip()
+                else:
+                    r[sub_prop][key] = value.lstrip()
+        else:
+            sub_num = None  # new property implies no sub property
+            key, value = line.lstrip().split(":", 1)
+            key = key.lstrip().replace(' ', '-').lower()
+            if value.lstrip() == '':  # 'key:' no value, new sub-property
+                sub_prop = key
+                r[sub_prop] = {}
+            else:  # 'key: value' line
+                r[key] = value.lstrip()
+
+    # update result
+    result.stdout = r
+
+    return result
+
+
+def main(repeat=50):
+    """Prints the timings of both implementations on every output"""
+    for name, lines in OUTPUTS:
+        assert (legacy_info_dictionary(Result(list(lines))).stdout ==
+                info_dictionary(Result(list(lines))).stdout)
+        for label, parser in (('legacy', legacy_info_dictionary),
+                              ('current', info_dictionary)):
+            summary = summarize(
+                measure(lambda: parser(Result(list(lines))), repeat))
+            print format_summary(u'%s: %s' % (label, name), summary)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,174 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Measures the hammer output parsers on synthetic outputs of 10 to 100k rows:
+throughput in rows and megabytes per second and the peak memory of a
+process parsing the output::
+
+    $ python -m tests.robottelo.benchmarks.bench_parsers \\
+        --output results.json [--baseline baseline.json]
+
+With ``--baseline`` the throughputs are compared with a previous results
+file, and the exit status is 1 if any of them regressed by more than the
+threshold.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+
+from robottelo.common import ssh
+from robottelo.common.benchmark import measure, percentile
+from robottelo.common.helpers import csv_to_dictionary, info_dictionary
+from tests.robottelo.benchmarks.generators import csv_output, info_output
+
+SIZES = (10, 1000, 10000, 100000)
+
+
+def _lines(output, structured):
+    """The lines ssh.command hands to the parsers"""
+    return ssh.command_result(output, '', 0, expect_csv=structured).lines
+
+
+# name: (output generator, setup run outside the timing, parse)
+PARSERS = (
+    ('command_result.csv', csv_output, lambda output: output,
+     lambda output: ssh.command_result(
+         output, '', 0, expect_csv=True).stdout),
+    ('command_result.info', info_output, lambda output: output,
+     lambda output: ssh.command_result(output, '', 0).lines),
+    ('csv_to_dictionary', csv_output,
+     lambda output: _lines(output, True), csv_to_dictionary),
+    ('info_dictionary', info_output,
+     lambda output: _lines(output, False),
+     lambda lines: info_dictionary(ssh.SSHCommandResult(lines))),
+)
+
+
+def _peak_memory(generate, setup, parse, rows, queue):
+    """Puts the peak resident size of a process parsing the data, in KiB"""
+    parse(setup(generate(rows)))
+    queue.put(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def peak_memory(generate, setup, parse, rows):
+    """
+    Generates an output of ``rows`` rows and parses it in a child process,
+    then returns the peak resident size of the child, in KiB.
+
+    A forked child starts with the resident size of its parent, so this
+    must run before the parent generates or parses anything.
+    """
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_peak_memory, args=(generate, setup, parse, rows, queue))
+    process.start()
+    peak = queue.get()
+    process.join()
+    return peak
+
+
+def run(sizes=SIZES, repeat=None):
+    """
+    Benchmarks every parser on every size and returns a dictionary of
+    results keyed by ``<parser>/<rows>``.
+    """
+    # Each parse measured in its own child, forked before any other parse
+    memory = {}
+    for name, generate, setup, parse in PARSERS:
+        for rows in sizes:
+            memory['%s/%d' % (name, rows)] = peak_memory(
+                generate, setup, parse, rows)
+
+    results = {}
+    for name, generate, setup, parse in PARSERS:
+        for rows in sizes:
+            key = '%s/%d' % (name, rows)
+            output = generate(rows)
+            data = setup(output)
+            # Keep the small sizes from being lost in the timer resolution
+            times = repeat or max(3, min(100, 100000 // rows))
+            median = percentile(measure(parse, times, data), 50)
+            results[key] = {
+                'rows': rows,
+                'bytes': len(output),
+                'repeat': times,
+                'seconds': median,
+                'rows_per_second': rows / median if median else None,
+                'mb_per_second': (
+                    len(output) / median / 1024 / 1024 if median else None),
+                'peak_memory_kb': memory[key],
+            }
+    return results
+
+
+def compare(results, baseline, threshold=0.2):
+    """
+    Returns ``(key, baseline, current)`` rows per second for the results
+    whose throughput dropped by more than ``threshold`` from the baseline.
+    Results missing from either side are not compared.
+    """
+    regressions = []
+    for key in sorted(results):
+        if key not in baseline:
+            continue
+        current = results[key]['rows_per_second']
+        previous = baseline[key]['rows_per_second']
+        if current and previous and current < previous * (1 - threshold):
+            regressions.append((key, previous, current))
+    return regressions
+
+
+def format_result(key, result):
+    """Formats a result as a single report line"""
+    return u'%-32s %10.0f rows/s %8.2f MB/s %8d KiB' % (
+        key, result['rows_per_second'] or 0, result['mb_per_second'] or 0,
+        result['peak_memory_kb'])
+
+
+def main(argv=None):
+    """Runs the benchmarks, prints and saves the results"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        '--sizes', default=','.join(str(size) for size in SIZES),
+        help='comma separated row counts, default: %(default)s')
+    parser.add_argument(
+        '--repeat', type=int, help='parses per measurement')
+    parser.add_argument('--output', help='file to save the results to')
+    parser.add_argument('--baseline', help='results file to compare with')
+    parser.add_argument(
+        '--threshold', type=float, default=0.2,
+        help='throughput drop flagged as a regression, default: '
+             '%(default)s')
+    args = parser.parse_args(argv)
+
+    results = run(
+        [int(size) for size in args.sizes.split(',')], args.repeat)
+    for key in sorted(results):
+        print format_result(key, results[key])
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'results': results,
+            }, handle, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for key, previous, current in regressions:
+            print u'REGRESSION %-32s %10.0f -> %10.0f rows/s' % (
+                key, previous, current)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Compares the generation of records with StringField values generated by
+rstr.xeger, as they were before, and by the compiled generators::
+
+    $ python -m tests.robottelo.benchmarks.bench_records [repeat]
+"""
+
+import rstr
+import sys
+
+from robottelo.common.benchmark import format_summary, measure, summarize
+from robottelo.common.helpers import generate_string
+from robottelo.common.records import StringField
+from robottelo.common.records.xeger import xeger
+from robottelo.records.content_view_definition import ContentViewDefinition
+from robottelo.records.host import Host
+from robottelo.records.organization import Organization
+from robottelo.records.user import User
+
+RECORDS = (
+    ('Host() x100', lambda: [Host() for _ in range(100)]),
+    ('User() x100', lambda: [User() for _ in range(100)]),
+    ('Organization.enumerate()', Organization.enumerate),
+    ('ContentViewDefinition.enumerate()', ContentViewDefinition.enumerate),
+)
+
+PATTERNS = (
+    r'Organization_\d\d\d\d\d\d',
+    r'host\d\d\d\d\d',
+    r'[a-f0-9]{2}(:[a-f0-9]{2}){5}',
+)
+
+
+def legacy_generate(self):
+    """StringField.generate as it was before compiling the formats"""
+    if self.str_type == 'xeger':
+        pattern = self.format
+        if '{' in pattern:
+            pattern = self._parse_field_format(pattern)
+        return rstr.xeger(pattern)[:self.maxlen]
+    else:
+        return generate_string(self.str_type, self.maxlen)
+
+
+def main(repeat=50):
+    """Prints the timings of both generators on every pattern and record"""
+    for pattern in PATTERNS:
+        for label, generate in (('rstr', rstr.xeger), ('compiled', xeger)):
+            summary = summarize(measure(
+                lambda: [generate(pattern) for _ in range(100)], repeat))
+            print format_summary(
+                u'%s: %s x100' % (label, pattern), summary)
+
+    generate = StringField.__dict__['generate']
+    try:
+        for name, create in RECORDS:
+            for label, method in (('rstr', legacy_generate),
+                                  ('compiled', generate)):
+                StringField.generate = method
+                summary = summarize(measure(create, repeat))
+                print format_summary(u'%s: %s' % (label, name), summary)
+    finally:
+        StringField.generate = generate
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
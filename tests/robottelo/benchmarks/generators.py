@@ -0,0 +1,95 @@
+# -*- encoding: utf-8 -*-
+# vim: ts=4 sw=4 expandtab ai
+
+"""
+Synthetic hammer outputs for the parser benchmarks.
+
+The outputs are built as the raw bytes ssh.command receives with hammer
+running in verbose mode: Rails traffic log lines and color codes included.
+They are deterministic for a given size, so runs can be compared.
+"""
+
+import random
+
+# Names mixing ascii, latin1 and utf8 characters, some needing CSV quotes
+NAMES = (
+    u'x86_64',
+    u'org, with comma',
+    u'say "hi"',
+    u'été déjà',
+    u'сервер',
+    u'テスト',
+    u'',
+)
+
+LOG_LINE = u'[ INFO 2014-06-10 12:00:00 API] GET /api/%s'
+
+
+def _name(rand, index):
+    """A name for the record ``index``"""
+    return u'%s %d' % (rand.choice(NAMES), index)
+
+
+def _csv_field(value):
+    """Quotes a CSV field the way hammer does"""
+    if value == u'' or any(char in value for char in u',"\n'):
+        return u'"%s"' % value.replace(u'"', u'""')
+    return value
+
+
+def csv_output(rows, seed=0):
+    """
+    Output of a ``list --output csv`` command with ``rows`` records, as
+    raw bytes.
+    """
+    rand = random.Random(seed)
+    lines = [LOG_LINE % u'hosts', u'Id,Name,Operating System,Environment,IP']
+    for index in range(1, rows + 1):
+        lines.append(u','.join(_csv_field(value) for value in (
+            unicode(index),
+            _name(rand, index),
+            u'RHEL 6.%d' % rand.randint(0, 5),
+            u'\x1b[32mproduction\x1b[0m' if index % 7 == 0
+            else u'production',
+            u'10.%d.%d.%d' % (
+                index // 65536 % 256, index // 256 % 256, index % 256),
+        )))
+    lines.append(u'')
+    return u'\n'.join(lines).encode('utf-8')
+
+
+def info_output(rows, seed=0):
+    """
+    Output of an ``info`` command with ``rows`` sub-property entries, as
+    raw bytes: numbered collections of dictionaries, of single values and
+    key => value parameters.
+    """
+    rand = random.Random(seed)
+    lines = [
+        LOG_LINE % u'content_views/1',
+        u'ID:                     1',
+        u'Name:                   %s' % _name(rand, 0),
+        u'Description:            ""',
+    ]
+    # Split the entries between the three kinds of collections
+    numbered = rows // 2
+    single = rows // 4
+    params = rows - numbered - single
+
+    lines.append(u'Yum Repositories:       ')
+    for index in range(1, numbered + 1):
+        lines.extend([
+            u' %d) ID:    %d' % (index, index),
+            u'    Name:  %s' % _name(rand, index),
+            u'    Label: repo_%d' % index,
+        ])
+    lines.append(u'Environments:           ')
+    lines.extend(
+        u' %d) %s' % (index, _name(rand, index))
+        for index in range(1, single + 1))
+    lines.append(u'Parameters:             ')
+    lines.extend(
+        u' param%d => \x1b[1m%s\x1b[0m' % (index, _name(rand, index))
+        for index in range(1, params + 1))
+    lines.append(u'')
+    return u'\n'.join(lines).encode('utf-8')
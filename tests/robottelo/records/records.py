@@ -22,3 +22,15 @@ class SampleRecord(records.Record):
     class Meta:
         api_path = "/api/operatingsystems"
         api_json_key = u"operatingsystem"
+
+
+class ChoicesRecord(records.Record):
+    """Counts its instances"""
+    instances = 0
+
+    name = records.ChoiceField(['n1', 'n2', 'n3'])
+    label = records.ChoiceField(['l1', 'l2'])
+    description = records.ChoiceField(['d1', 'd2', 'd3', 'd4'])
+
+    def _post_init(self):
+        ChoicesRecord.instances += 1
@@ -1,11 +1,17 @@
+import itertools
+import random
+import rstr
 import sys
+
+from robottelo.common.records.covering import covering_array
+from robottelo.common.records.xeger import compile_xeger, xeger
+from .records import ChoicesRecord, SampleRecord
+
 if sys.hexversion >= 0x2070000:
     import unittest
 else:
     import unittest2 as unittest
 
-from .records import SampleRecord
-
 
 class RecordsTestCase(unittest.TestCase):
     def setUp(self):
@@ -48,3 +54,121 @@ class RecordsTestCase(unittest.TestCase):
         """Post init is executed"""
         instance = self.record_class()
         self.assertTrue(hasattr(instance, 'post_init_var'))
+
+    def test_format_not_modified(self):
+        """Generating a value keeps the placeholders of the field format"""
+        self.record_class()
+        field = self.record_class._meta.fields['name']
+        self.assertIn('{record_name}', field.format)
+        field.format = r'{record_name}-\d'
+        self.assertRegexpMatches(
+            self.record_class().name, r'^SampleRecord-\d$')
+
+
+class EnumerateTestCase(unittest.TestCase):
+    def setUp(self):
+        ChoicesRecord.instances = 0
+
+    def test_matrix(self):
+        """Every combination of choices is enumerated once"""
+        records = ChoicesRecord.enumerate(MATRIX=2)
+        self.assertEqual(
+            len(set((r.name, r.label, r.description) for r in records)), 24)
+
+    def test_lazy(self):
+        """Records are only created as they are iterated over"""
+        records = ChoicesRecord.iter_enumerate(MATRIX=2)
+        self.assertEqual(ChoicesRecord.instances, 0)
+        first = next(records)
+        self.assertEqual(
+            (first.name, first.label, first.description), ('n1', 'l1', 'd1'))
+        self.assertEqual(ChoicesRecord.instances, 1)
+
+    def test_fixed_fields(self):
+        """A single record is enumerated when every field is given"""
+        records = ChoicesRecord.enumerate(
+            name='n', label='l', description='d', MATRIX=2)
+        self.assertEqual(
+            [(r.name, r.label, r.description) for r in records],
+            [('n', 'l', 'd')])
+        records = ChoicesRecord.enumerate(
+            name='n', label='l', description='d', MATRIX='pairwise')
+        self.assertEqual(
+            [(r.name, r.label, r.description) for r in records],
+            [('n', 'l', 'd')])
+
+    def test_single_choices(self):
+        """Each choice is enumerated once without matrix"""
+        self.assertEqual(len(ChoicesRecord.enumerate(MATRIX=1)), 9)
+
+    def test_random_record(self):
+        """Only the record picked at random is created"""
+        self.assertEqual(len(ChoicesRecord.enumerate(MATRIX=0)), 1)
+        self.assertEqual(ChoicesRecord.instances, 1)
+
+    def test_sample(self):
+        """Samples are distinct records"""
+        records = list(ChoicesRecord.iter_enumerate(MATRIX=2, SAMPLE=10))
+        self.assertEqual(
+            len(set((r.name, r.label, r.description) for r in records)), 10)
+        self.assertEqual(ChoicesRecord.instances, 10)
+        self.assertEqual(
+            len(list(ChoicesRecord.iter_enumerate(MATRIX=2, SAMPLE=100))),
+            24)
+
+    def test_pairwise(self):
+        """Every pair of choices of any two fields is enumerated"""
+        records = ChoicesRecord.enumerate(MATRIX='pairwise')
+        self.assertLess(len(records), 24)
+        for first, second in itertools.combinations(
+                ('name', 'label', 'description'), 2):
+            pairs = set((r[first], r[second]) for r in records)
+            self.assertEqual(len(pairs), len(
+                ChoicesRecord._meta.fields[first].choices) * len(
+                ChoicesRecord._meta.fields[second].choices))
+
+
+class CoveringArrayTestCase(unittest.TestCase):
+    def assertCovers(self, sizes, strength, rows):
+        for columns in itertools.combinations(range(len(sizes)), strength):
+            self.assertEqual(
+                set(tuple(row[index] for index in columns) for row in rows),
+                set(itertools.product(
+                    *[range(sizes[index]) for index in columns])))
+
+    def test_pairwise(self):
+        """Every pair of values of any two parameters is covered"""
+        for sizes in ([6, 6, 6], [2] * 10, [3, 5, 2, 4], [10, 2, 2, 2]):
+            rows = covering_array(sizes)
+            self.assertCovers(sizes, 2, rows)
+        self.assertEqual(len(covering_array([6] * 6)), 55)
+
+    def test_strength(self):
+        """Every combination of values of any t parameters is covered"""
+        rows = covering_array([3, 3, 3, 3, 3], 3)
+        self.assertCovers([3, 3, 3, 3, 3], 3, rows)
+        self.assertLess(len(rows), 243)
+
+    def test_few_parameters(self):
+        """Parameters fewer than the strength are fully enumerated"""
+        self.assertEqual(covering_array([3]), [[0], [1], [2]])
+        self.assertEqual(covering_array([]), [[]])
+        self.assertEqual(covering_array([2, 0, 3]), [])
+
+
+class XegerTestCase(unittest.TestCase):
+    def test_same_as_rstr(self):
+        """Compiled patterns generate the same strings as rstr.xeger"""
+        patterns = (
+            r'[A-Z]\d[A-Z] \d[A-Z]\d', r'(foo|ba[rz])+\1', r'[^abc]{3,5}',
+            r'.{1,8}', r'\w+\s\W\S\D', r'x*?y+?[\d_-]', r'^a(?=b)b$')
+        for pattern in patterns:
+            for seed in range(20):
+                random.seed(seed)
+                expected = rstr.xeger(pattern)
+                random.seed(seed)
+                self.assertEqual(xeger(pattern), expected)
+
+    def test_compiled_once(self):
+        """Patterns are compiled once and shared"""
+        self.assertIs(compile_xeger(r'shared\d'), compile_xeger(r'shared\d'))
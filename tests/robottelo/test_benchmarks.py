@@ -0,0 +1,40 @@
+import unittest
+
+from robottelo.common import ssh
+from robottelo.common.helpers import info_dictionary
+from tests.robottelo.benchmarks.bench_parsers import compare
+from tests.robottelo.benchmarks.generators import csv_output, info_output
+
+
+class GeneratorsTestCase(unittest.TestCase):
+    def test_csv_output(self):
+        """The CSV output parses to as many rows as requested"""
+        rows = ssh.command_result(
+            csv_output(100), '', 0, expect_csv=True).stdout
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(rows[6][u'environment'], u'production')
+        self.assertEqual(csv_output(10), csv_output(10))
+
+    def test_info_output(self):
+        """The info output has as many sub-property entries as requested"""
+        info = info_dictionary(ssh.command_result(info_output(100), '', 0))
+        self.assertEqual(len(info.stdout[u'yum-repositories']), 50)
+        self.assertEqual(len(info.stdout[u'environments']), 25)
+        self.assertEqual(len(info.stdout[u'parameters']), 25)
+
+
+class CompareTestCase(unittest.TestCase):
+    def test_regressions(self):
+        """Only throughput drops above the threshold are flagged"""
+        baseline = {
+            'a/10': {'rows_per_second': 100.0},
+            'b/10': {'rows_per_second': 100.0},
+            'c/10': {'rows_per_second': 100.0},
+        }
+        results = {
+            'a/10': {'rows_per_second': 85.0},
+            'b/10': {'rows_per_second': 70.0},
+            'd/10': {'rows_per_second': 1.0},
+        }
+        self.assertEqual(
+            compare(results, baseline, 0.2), [('b/10', 100.0, 70.0)])
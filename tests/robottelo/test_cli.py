@@ -1,19 +1,26 @@
+import random
+import sys
+import threading
+import time
 import unittest
 
-from robottelo.cli.base import Base
+from robottelo.cli.base import Base, Batch, Command, CreatedObject
+from robottelo.cli.org import Org
+from robottelo.cli.repository import Repository
+from robottelo.common import concurrency, conf, ledger
+from robottelo.common.ssh import SSHCommandResult
 
 
 class BaseCliTestCase(unittest.TestCase):
     def test_construct_command(self):
         """_construct_command builds a command using flags and arguments"""
         Base.command_base = 'basecommand'
-        Base.command_sub = 'subcommand'
         command_parts = Base._construct_command({
             u'flag-one': True,
             u'flag-two': False,
             u'argument': u'value',
             u'ommited-arg': None,
-        }).split()
+        }, u'subcommand').split()
 
         self.assertIn(u'basecommand', command_parts)
         self.assertIn(u'subcommand', command_parts)
@@ -21,3 +28,336 @@ class BaseCliTestCase(unittest.TestCase):
         self.assertIn(u'--argument=\'value\'', command_parts)
         self.assertNotIn(u'--flag-two', command_parts)
         self.assertEqual(len(command_parts), 4)
+
+    def test_command(self):
+        """A command is a string exposing the parts it was built from"""
+        options = {u'id': 1}
+        command = Command(u'basecommand', u'info', options)
+        options[u'id'] = 2
+        self.assertEqual(command, u"basecommand info --id='1'")
+        self.assertEqual(command.command_sub, u'info')
+        self.assertEqual(command.options, {u'id': 1})
+
+    def test_requires_org(self):
+        """Subcommands can be exempted from requiring organization-id"""
+        self.assertTrue(Repository._requires_org(u'list'))
+        self.assertFalse(Repository._requires_org(u'info'))
+        self.assertFalse(Org._requires_org(u'list'))
+
+
+class CreatedObjectTestCase(unittest.TestCase):
+    def setUp(self):
+        self.fetched = 0
+
+    def fetch(self, info=None):
+        self.fetched += 1
+        if info is None:
+            info = {u'id': u'1', u'name': u'foo', u'label': u'foo'}
+        return info
+
+    def test_created_fields_without_info(self):
+        """Fields of the create output do not need the info command"""
+        obj = CreatedObject(
+            {u'message': u'Created', u'id': u'1', u'name': u'foo'},
+            self.fetch)
+        self.assertEqual((obj[u'id'], obj[u'name']), (u'1', u'foo'))
+        self.assertEqual(self.fetched, 0)
+        self.assertFalse(obj.loaded)
+
+    def test_other_fields_fetched_once(self):
+        """Other fields are fetched with the info command, only once"""
+        obj = CreatedObject(
+            {u'id': u'1'}, self.fetch, defaults={u'organization-id': 3})
+        self.assertEqual(obj[u'label'], u'foo')
+        self.assertEqual(obj.get(u'missing'), None)
+        self.assertEqual(dict(obj), {
+            u'id': u'1', u'name': u'foo', u'label': u'foo',
+            u'organization-id': 3})
+        self.assertEqual(self.fetched, 1)
+
+    def test_update_from_created_object(self):
+        """Updating a dictionary with the object fetches all fields"""
+        args = {u'name': u'foo', u'label': None}
+        args.update(CreatedObject({u'id': u'1'}, self.fetch))
+        self.assertEqual(args[u'label'], u'foo')
+
+    def test_empty_info(self):
+        """The create output is kept when info returns nothing"""
+        obj = CreatedObject(
+            {u'message': u'Created', u'id': u'1'}, lambda: self.fetch([]))
+        self.assertEqual(
+            obj.copy(), {u'message': u'Created', u'id': u'1'})
+        self.assertFalse(obj.found)
+
+    def test_is_ready(self):
+        """Probing fills the object, no other info is needed to read it"""
+        infos = [[], None]
+        obj = CreatedObject({u'id': u'1'}, lambda: self.fetch(infos.pop(0)))
+        self.assertFalse(Org.is_ready(obj))
+        self.assertTrue(Org.is_ready(obj))
+        self.assertTrue(Org.is_ready(obj))
+        self.assertEqual(obj[u'label'], u'foo')
+        self.assertEqual(self.fetched, 2)
+
+    def test_fill(self):
+        """Filling the object replaces the fields fetched before"""
+        obj = CreatedObject({u'id': u'1'}, self.fetch)
+        obj.load()
+        self.assertTrue(obj.found)
+        self.assertFalse(obj.fill({}))
+        self.assertEqual(dict(obj), {u'id': u'1'})
+        self.assertEqual(self.fetched, 1)
+
+
+class JsonOutputTestCase(unittest.TestCase):
+    def setUp(self):
+        self.execute = Base.__dict__['execute']
+        self.output = conf.properties.get('hammer.output')
+        conf.properties['hammer.output'] = 'json'
+        self.calls = []
+        Base._json_unsupported.clear()
+
+    def tearDown(self):
+        Base.execute = self.execute
+        if self.output is None:
+            del conf.properties['hammer.output']
+        else:
+            conf.properties['hammer.output'] = self.output
+        Base._json_unsupported.clear()
+
+    def fake_execute(self, json_result):
+        def execute(cls, command, user=None, password=None,
+                    expect_csv=False, timeout=None, idempotent=False,
+                    expect_json=False):
+            self.calls.append(expect_json)
+            if not expect_json:
+                return SSHCommandResult([{u'id': u'1'}])
+            if isinstance(json_result, Exception):
+                raise json_result
+            return json_result
+        Base.execute = classmethod(execute)
+
+    def test_json(self):
+        """list uses the JSON output when enabled"""
+        self.fake_execute(SSHCommandResult([{u'id': 1}]))
+        self.assertEqual(Org.list().stdout, [{u'id': 1}])
+        self.assertEqual(self.calls, [True])
+
+    def test_fallback(self):
+        """Commands without JSON output fall back to the legacy output"""
+        self.fake_execute(ValueError('No JSON object could be decoded'))
+        self.assertEqual(Org.list().stdout, [{u'id': u'1'}])
+        self.assertEqual(Org.list().stdout, [{u'id': u'1'}])
+        # JSON is not tried again for the same command
+        self.assertEqual(self.calls, [True, False, False])
+
+    def test_failed_command(self):
+        """Failed commands are not run again with the legacy output"""
+        self.fake_execute(
+            SSHCommandResult([], 'Error: not found', return_code=65))
+        self.assertEqual(Org.info({u'id': 1}).stdout, {})
+        self.assertEqual(self.calls, [True])
+
+
+class FakeHammer(object):
+    """
+    Replaces Base.execute, answering like hammer would and recording the
+    commands of each thread.
+    """
+
+    def __init__(self):
+        self.commands = {}
+
+    def __call__(self, cls, command, user=None, password=None,
+                 expect_csv=False, timeout=None, idempotent=False):
+        # Give the other threads every chance to run in between
+        time.sleep(0)
+        name = threading.current_thread().name
+        self.commands.setdefault(name, []).append(command)
+        options = command.options
+        if command.command_sub == u'create':
+            return SSHCommandResult([{u'id': options[u'name']}])
+        if command.command_sub == u'info':
+            return SSHCommandResult(
+                [u'Id: %s' % options[u'id'],
+                 u'Organization: %s' % options.get(u'organization-id')])
+        if command.command_sub == u'list':
+            return SSHCommandResult([{u'id': options[u'organization-id']}])
+        return SSHCommandResult([])
+
+
+class ReentrancyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.execute = Base.__dict__['execute']
+        self.hammer = FakeHammer()
+        Base.execute = classmethod(self.hammer)
+        self.check_interval = sys.getcheckinterval()
+        sys.setcheckinterval(1)
+
+    def tearDown(self):
+        Base.execute = self.execute
+        sys.setcheckinterval(self.check_interval)
+
+    def test_concurrent_commands(self):
+        """Threads sharing cli classes each build their own commands"""
+        errors = []
+
+        def worker(seed):
+            rand = random.Random(seed)
+            name = threading.current_thread().name
+            try:
+                for i in range(100):
+                    org = u'%s-%d' % (name, i)
+                    action = rand.choice(('create', 'info', 'list', 'delete'))
+                    if action == 'create':
+                        result = Repository.create(
+                            {u'name': org, u'organization-id': org})
+                        self.assertEqual(result.stdout[u'id'], org)
+                        # The repository info does not require the org
+                        self.assertEqual(
+                            result.stdout[u'organization'], u'None')
+                    elif action == 'info':
+                        result = Org.info({u'id': org})
+                        self.assertEqual(result.stdout[u'id'], org)
+                    elif action == 'list':
+                        result = Repository.list({u'organization-id': org})
+                        self.assertEqual(result.stdout, [{u'id': org}])
+                    else:
+                        Org.delete({u'id': org})
+            except Exception, e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=worker, args=(seed,))
+            for seed in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        for name, commands in self.hammer.commands.items():
+            for command in commands:
+                # Commands never carry another thread's options
+                self.assertIn(name, command)
+                self.assertEqual(
+                    command.split()[:2],
+                    [command.command_base, command.command_sub])
+
+
+class DeleteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.execute = Base.__dict__['execute']
+        Base.execute = classmethod(FakeHammer())
+        self.cleanup = conf.properties.get('main.cleanup')
+        conf.properties['main.cleanup'] = 'test'
+        self.scope = ledger.open_scope('test')
+
+    def tearDown(self):
+        ledger.close_scope(self.scope)
+        Base.execute = self.execute
+        if self.cleanup is None:
+            del conf.properties['main.cleanup']
+        else:
+            conf.properties['main.cleanup'] = self.cleanup
+
+    def test_delete_forgets(self):
+        """Objects deleted by id are not cleaned up again"""
+        deleted = []
+        ledger.record(
+            u'Org 1', lambda: deleted.append(u'1'), key=('cli', 'Org', u'1'))
+        Org.delete({u'id': 1})
+        self.assertEqual(ledger.find(('cli', 'Org', u'1')), None)
+        self.assertEqual(ledger.close_scope(self.scope), [])
+        self.assertEqual(deleted, [])
+
+
+class CreateManyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.execute = Batch.__dict__['execute']
+        self.batches = []
+        test = self
+
+        def execute(batch):
+            test.batches.append(len(batch.commands))
+            batch.results = [
+                SSHCommandResult([{u'id': command.options[u'name']}])
+                if command.command_sub == u'create' else
+                SSHCommandResult([u'Id: %s' % command.options[u'id']])
+                for command, _ in batch.commands]
+            return batch.results
+        Batch.execute = execute
+
+    def tearDown(self):
+        Batch.execute = self.execute
+
+    def test_create_many(self):
+        """Objects are created in batches, results in order"""
+        names = [u'org%d' % index for index in range(10)]
+        results = Org.create_many(
+            [{u'name': name} for name in names], batch_size=4)
+        # The create commands, then the info commands
+        self.assertEqual(sorted(self.batches), [2, 2, 4, 4, 4, 4])
+        self.assertEqual([result.stdout[u'id'] for result in results], names)
+        self.assertTrue(isinstance(results[0].stdout, CreatedObject))
+        self.assertEqual(
+            results[0].stdout.info_options, {u'id': u'org0'})
+        self.assertTrue(results[0].stdout.found)
+
+    def test_create_many_lazy(self):
+        """With lazy_info the objects are not fetched"""
+        results = Org.create_many(
+            [{u'name': u'org%d' % index} for index in range(4)],
+            lazy_info=True, batch_size=4)
+        self.assertEqual(self.batches, [4])
+        self.assertFalse(results[0].stdout.loaded)
+
+    def test_default_batch_size(self):
+        """By default there is one batch per worker of the executor"""
+        pool_size = conf.properties.get('main.server.ssh.pool_size')
+        conf.properties['main.server.ssh.pool_size'] = '3'
+        try:
+            Org.create_many(
+                [{u'name': u'org%d' % i} for i in range(7)], lazy_info=True)
+        finally:
+            if pool_size is None:
+                del conf.properties['main.server.ssh.pool_size']
+            else:
+                conf.properties['main.server.ssh.pool_size'] = pool_size
+        self.assertEqual(sorted(self.batches), [1, 3, 3])
+
+    def test_nested_create_many(self):
+        """create_many run by the single worker does not wait for itself"""
+        pool_size = conf.properties.get('main.server.ssh.pool_size')
+        conf.properties['main.server.ssh.pool_size'] = '1'
+        executor = concurrency._executor
+        concurrency._executor = None
+        try:
+            future = concurrency.submit(
+                Org.create_many,
+                [{u'name': u'org%d' % i} for i in range(3)])
+            results = concurrency.gather([future], timeout=5)[0]
+        finally:
+            concurrency.get_executor().shutdown(wait=False)
+            concurrency._executor = executor
+            if pool_size is None:
+                del conf.properties['main.server.ssh.pool_size']
+            else:
+                conf.properties['main.server.ssh.pool_size'] = pool_size
+        self.assertEqual(
+            [result.stdout[u'id'] for result in results],
+            [u'org0', u'org1', u'org2'])
+        self.assertTrue(results[0].stdout.loaded)
+
+    def test_ready_many(self):
+        """Objects are probed with batches of info commands, and filled"""
+        new_objs = [
+            CreatedObject({u'id': org_id}, None, info_options={u'id': org_id})
+            for org_id in (u'1', u'2')]
+        self.assertEqual(Org.ready_many(new_objs), [True, True])
+        self.assertEqual(sum(self.batches), 2)
+        self.assertEqual(new_objs[1][u'id'], u'2')
+        self.assertTrue(new_objs[1].loaded)
+        # Objects found already are not probed again
+        self.assertEqual(Org.ready_many(new_objs), [True, True])
+        self.assertEqual(sum(self.batches), 2)
@@ -0,0 +1,54 @@
+import threading
+import time
+import unittest
+
+from concurrent import futures
+from robottelo.common import concurrency
+
+
+def delayed(value, delay):
+    time.sleep(delay)
+    return value
+
+
+class GatherTestCase(unittest.TestCase):
+    def test_results_in_order(self):
+        """gather returns the results in the order of the futures"""
+        fs = [
+            concurrency.submit(delayed, value, delay)
+            for value, delay in ((1, 0.03), (2, 0.0), (3, 0.01))
+        ]
+        self.assertEqual(concurrency.gather(fs), [1, 2, 3])
+
+    def test_raises_after_all_done(self):
+        """The first failure is raised once every future is done"""
+        event = threading.Event()
+
+        def fail():
+            raise ValueError('boom')
+
+        def slow():
+            time.sleep(0.05)
+            event.set()
+
+        fs = [concurrency.submit(fail), concurrency.submit(slow)]
+        with self.assertRaises(ValueError):
+            concurrency.gather(fs)
+        self.assertTrue(event.is_set())
+
+    def test_timeout(self):
+        """Futures still running after the timeout raise TimeoutError"""
+        future = concurrency.submit(time.sleep, 0.2)
+        with self.assertRaises(futures.TimeoutError):
+            concurrency.gather([future], timeout=0.01)
+        future.result()
+
+
+class AsCompletedTestCase(unittest.TestCase):
+    def test_yields_all(self):
+        """as_completed yields every future once"""
+        fs = [concurrency.submit(delayed, i, 0) for i in range(5)]
+        self.assertEqual(
+            sorted(future.result()
+                   for future in concurrency.as_completed(fs)),
+            range(5))
@@ -0,0 +1,73 @@
+import random
+import shutil
+import tempfile
+import unittest
+
+from robottelo.common import conf, datasets
+from robottelo.common.helpers import generate_strings_list
+
+
+class DatasetsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.properties = dict(conf.properties)
+        self.cache_dir = tempfile.mkdtemp()
+        conf.properties['main.data.seed'] = '42'
+        conf.properties['main.data.cache_dir'] = self.cache_dir
+        self.seed = datasets._seed
+        datasets._seed = None
+        datasets._datasets.clear()
+        self.calls = 0
+
+    def tearDown(self):
+        conf.properties.clear()
+        conf.properties.update(self.properties)
+        datasets._seed = self.seed
+        datasets._datasets.clear()
+        shutil.rmtree(self.cache_dir)
+
+    def generator(self, count):
+        self.calls += 1
+        return [random.random() for _ in range(count)]
+
+    def test_reproducible(self):
+        """The same seed and name give the same values"""
+        first = datasets.load('strings', generate_strings_list)
+        datasets._datasets.clear()
+        shutil.rmtree(self.cache_dir)
+        self.assertEqual(
+            datasets.load('strings', generate_strings_list), first)
+        self.assertNotEqual(
+            datasets.load('other', generate_strings_list), first)
+
+    def test_cached(self):
+        """Data sets are generated once and then loaded from the cache"""
+        first = datasets.load('numbers', self.generator, (3,))
+        self.assertIs(datasets.load('numbers', self.generator, (3,)), first)
+        datasets._datasets.clear()
+        self.assertEqual(datasets.load('numbers', self.generator, (3,)), first)
+        self.assertEqual(self.calls, 1)
+        # Other arguments are another data set
+        datasets.load('numbers', self.generator, (4,))
+        self.assertEqual(self.calls, 2)
+
+    def test_generator_changed(self):
+        """Editing the generator of a data set generates it again"""
+        first = datasets.load('numbers', lambda: [random.random()])
+        datasets._datasets.clear()
+        self.assertEqual(
+            datasets.load('numbers', lambda: [random.random()]), first)
+        datasets._datasets.clear()
+        self.assertNotEqual(
+            datasets.load('numbers', lambda: [random.random(), 1]), first)
+        # Nested code objects are part of the generator code too
+        nested = datasets.load('nested', lambda: [
+            (lambda: random.random())()])
+        datasets._datasets.clear()
+        self.assertNotEqual(datasets.load('nested', lambda: [
+            (lambda: random.random() + 1)()]), nested)
+
+    def test_random_state_restored(self):
+        """Generating a data set leaves the random module as it was"""
+        state = random.getstate()
+        datasets.load('numbers', self.generator, (3,))
+        self.assertEqual(random.getstate(), state)
@@ -3,7 +3,7 @@ import unittest
 from ddt import DATA_ATTR
 
 from robottelo.common import conf
-from robottelo.common.decorators import data
+from robottelo.common.decorators import data, data_set
 
 
 def function():
@@ -29,3 +29,9 @@ class DataDecoratorTestCase(unittest.TestCase):
 
         self.assertEqual(len(data_attr), len(self.test_data))
         self.assertEqual(getattr(decorated, DATA_ATTR), self.test_data)
+
+    def test_data_set_decorator(self):
+        conf.properties['main.smoke'] = '0'
+        decorated = data_set(lambda count: range(count), 3)(function)
+
+        self.assertEqual(getattr(decorated, DATA_ATTR), (0, 1, 2))
@@ -0,0 +1,175 @@
+import threading
+import time
+import unittest
+
+from robottelo.cli.activationkey import ActivationKey
+from robottelo.cli.base import CreatedObject
+from robottelo.cli.factory import (Reference, create_objects, fixture_levels,
+                                   make_fixtures, mark_names, record_object)
+from robottelo.cli.hostgroup import HostGroup
+from robottelo.common import conf, ledger
+from robottelo.common.ssh import SSHCommandResult
+
+
+class FixturesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.created = []
+        self.lock = threading.Lock()
+
+    def factory(self, kind):
+        def make(options):
+            time.sleep(0.1)
+            with self.lock:
+                self.created.append(kind)
+                obj = {u'id': u'%s-%d' % (kind, len(self.created))}
+            obj.update(options)
+            return obj
+        return make
+
+    def test_levels(self):
+        """Objects come after the objects they refer to"""
+        self.assertEqual(fixture_levels({
+            'org': (None, {}),
+            'env1': (None, {u'organization-id': Reference('org')}),
+            'env2': (None, {u'prior': Reference('env1', 'label')}),
+            'product': (None, {u'organization-id': Reference('org')}),
+            'gpg': (None, None),
+        }), [['gpg', 'org'], ['env1', 'product'], ['env2']])
+
+    def test_invalid_references(self):
+        """Unknown and circular references are rejected"""
+        self.assertRaises(ValueError, fixture_levels, {
+            'env': (None, {u'organization-id': Reference('org')})})
+        self.assertRaises(ValueError, fixture_levels, {
+            'a': (None, {u'b': Reference('b')}),
+            'b': (None, {u'a': Reference('a')})})
+
+    def test_make_fixtures(self):
+        """References are resolved and each level is created at once"""
+        start = time.time()
+        objects = make_fixtures({
+            'org': (self.factory('org'), {}),
+            'env1': (self.factory('env'), {
+                u'organization-id': Reference('org')}),
+            'env2': (self.factory('env'), {
+                u'organization-id': Reference('org'),
+                u'prior': Reference('env1', u'organization-id')}),
+            'product': (self.factory('product'), {
+                u'organization-id': Reference('org')}),
+            'repository': (self.factory('repository'), {
+                u'product-id': Reference('product')}),
+        })
+        elapsed = time.time() - start
+        org_id = objects['org'][u'id']
+        self.assertEqual(objects['env1'][u'organization-id'], org_id)
+        self.assertEqual(objects['env2'][u'prior'], org_id)
+        self.assertEqual(
+            objects['repository'][u'product-id'], objects['product'][u'id'])
+        # Three levels of 0.1 seconds, not five objects
+        self.assertLess(elapsed, 0.45)
+
+
+class FakeCli(object):
+    """Creates objects which are ready from the second probe on"""
+    __name__ = 'FakeCli'
+    probes = None
+
+    @classmethod
+    def create_many(cls, options_list):
+        cls.probes = []
+        return [
+            SSHCommandResult(CreatedObject(
+                {u'id': index}, None, info_options={u'id': index}),
+                return_code=0 if options[u'name'] else 65)
+            for index, options in enumerate(options_list)]
+
+    @classmethod
+    def ready_many(cls, new_objs):
+        cls.probes.append(len(new_objs))
+        return [
+            len(cls.probes) > 1 or new_obj.info_options[u'id'] % 2 == 0
+            for new_obj in new_objs]
+
+
+class LoadedFakeCli(FakeCli):
+    """Creates objects fetched at once, whose description later changes"""
+    __name__ = 'LoadedFakeCli'
+    description = u'created'
+
+    @classmethod
+    def create_many(cls, options_list):
+        results = super(LoadedFakeCli, cls).create_many(options_list)
+        for result in results:
+            result.stdout._fetch = lambda: {
+                u'id': 0, u'description': cls.description}
+            result.stdout.load()
+        return results
+
+
+class CreateObjectsTestCase(unittest.TestCase):
+    def test_loaded_objects(self):
+        """Objects fetched at creation keep the values they had then"""
+        obj = create_objects(LoadedFakeCli, [{u'name': u'obj'}])[0]
+        LoadedFakeCli.description = u'updated'
+        self.assertEqual(obj[u'description'], u'created')
+        self.assertEqual(obj[u'name'], u'obj')
+
+    def test_create_objects(self):
+        """Objects are laid over their arguments and waited for"""
+        objects = create_objects(
+            FakeCli, [{u'name': u'obj%d' % index} for index in range(5)])
+        self.assertEqual([obj[u'id'] for obj in objects], range(5))
+        self.assertEqual(objects[3].defaults, {u'name': u'obj3'})
+        # Only the objects not ready at the first probe are probed again
+        self.assertEqual(FakeCli.probes, [5, 2])
+
+    def test_failure(self):
+        """Any failure is raised"""
+        self.assertRaises(
+            Exception, create_objects, FakeCli,
+            [{u'name': u'obj'}, {u'name': None}])
+
+
+class MarkNamesTestCase(unittest.TestCase):
+    def tearDown(self):
+        conf.properties.pop('main.data.name_prefix', None)
+
+    def test_mark_names(self):
+        """Default names and logins get the configured prefix"""
+        args = {u'name': u'abc', u'login': None, u'label': u'abc'}
+        self.assertEqual(mark_names(dict(args)), args)
+        conf.properties['main.data.name_prefix'] = u'robottelo_'
+        self.assertEqual(
+            mark_names(dict(args)),
+            {u'name': u'robottelo_abc', u'login': None, u'label': u'abc'})
+
+
+class RecordObjectTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cleanup = conf.properties.get('main.cleanup')
+        conf.properties['main.cleanup'] = 'test'
+        self.scope = ledger.open_scope('test')
+
+    def tearDown(self):
+        for entry in self.scope.entries:
+            entry.delete = lambda: None
+        ledger.close_scope(self.scope)
+        if self.cleanup is None:
+            conf.properties.pop('main.cleanup', None)
+        else:
+            conf.properties['main.cleanup'] = self.cleanup
+
+    def test_environment_references(self):
+        """environment-id refers to the environment kind of each command"""
+        environments = dict(
+            (name, ledger.record(name, None, key=('cli', name, u'5')))
+            for name in ('Environment', 'LifecycleEnvironment'))
+        hostgroup = record_object(
+            HostGroup, {u'environment-id': 5}, {u'id': 1})
+        key = record_object(
+            ActivationKey, {u'environment-id': 5, u'organization-id': 7},
+            {u'id': 2})
+        self.assertEqual(
+            hostgroup.dependencies, [environments['Environment']])
+        self.assertEqual(
+            key.dependencies, [environments['LifecycleEnvironment']])
@@ -1,9 +1,15 @@
+import glob
+import json
+import os
+import time
 import unittest
 
 from robottelo.common.helpers import (
     generate_name, generate_email_address, valid_names_list, valid_data_list,
     invalid_names_list, generate_ipaddr, generate_mac, generate_string,
-    generate_strings_list, escape_search, info_dictionary)
+    generate_strings_list, generate_strings, STRING_CHARACTERS,
+    escape_search, info_dictionary, wait_for, WaitTimeOut,
+    json_to_dictionary, csv_to_dictionary, iter_csv_rows)
 
 
 class FakeSSHResult(object):
@@ -83,6 +89,32 @@ class GenerateStringTestCase(unittest.TestCase):
         self.assertIsInstance(generate_string('html', 8), unicode)
 
 
+class GenerateStringsTestCase(unittest.TestCase):
+    def test_count_and_length(self):
+        """Tests if all strings have the requested length and type"""
+        for str_type, characters in STRING_CHARACTERS.items():
+            strings = generate_strings(str_type, 5, 100)
+            self.assertEqual(len(strings), 100)
+            for string in strings:
+                self.assertIsInstance(string, unicode)
+                self.assertEqual(len(string), 5)
+                self.assertTrue(set(string) <= set(characters))
+
+    def test_html(self):
+        """Tests if html strings wrap alpha strings in a tag"""
+        for string in generate_strings('HTML', 5, 10):
+            self.assertRegexpMatches(string, r'^<(\w+)>[a-zA-Z]{5}</\1>$')
+
+    def test_empty(self):
+        """Tests if zero length strings are empty"""
+        self.assertEqual(generate_strings('utf8', 0, 2), [u'', u''])
+        self.assertEqual(generate_strings('utf8', 3, 0), [])
+
+    def test_unknown_type(self):
+        """Tests if unknown types are rejected"""
+        self.assertRaises(Exception, generate_strings, 'cuneiform', 5, 1)
+
+
 class GenerateStringListTestCase(unittest.TestCase):
     def test_return_type(self):
         """Tests if generate string list returns a unicode string"""
@@ -200,3 +232,119 @@ class InfoDictionaryTestCase(unittest.TestCase):
                 'url': '/custom/url2',
             }],
         })
+
+
+class InfoDictionaryCorpusTestCase(unittest.TestCase):
+    def test_golden_output(self):
+        """info_dictionary output matches the recorded dictionaries"""
+        corpus = os.path.join(
+            os.path.dirname(__file__), 'data', 'info_dictionary')
+        paths = sorted(glob.glob(os.path.join(corpus, '*.txt')))
+        self.assertGreater(len(paths), 0)
+        for path in paths:
+            with open(path) as output:
+                lines = output.read().decode('utf-8').split(u'\n')
+            with open(path[:-len('.txt')] + '.json') as expected:
+                self.assertEqual(
+                    info_dictionary(FakeSSHResult(lines)).stdout,
+                    json.load(expected),
+                    os.path.basename(path))
+
+
+class WaitForTestCase(unittest.TestCase):
+    def test_ready_right_away(self):
+        """No time is spent waiting when the condition is already met"""
+        self.assertLess(wait_for(lambda: True), 0.01)
+
+    def test_backoff(self):
+        """The delay between calls doubles up to the maximum"""
+        calls = []
+
+        def predicate():
+            calls.append(time.time())
+            return len(calls) == 5
+
+        wait_for(predicate, delay=0.01, max_delay=0.04)
+        delays = [after - before for before, after in zip(calls, calls[1:])]
+        for delay, expected in zip(delays, [0.01, 0.02, 0.04, 0.04]):
+            self.assertGreaterEqual(delay, expected)
+            self.assertLess(delay, expected + 0.05)
+
+    def test_timeout(self):
+        """WaitTimeOut is raised when the condition is never met"""
+        with self.assertRaises(WaitTimeOut):
+            wait_for(lambda: False, timeout=0.05, delay=0.01)
+
+
+class JsonToDictionaryTestCase(unittest.TestCase):
+    def test_keys(self):
+        """Keys are named like the legacy parsers name them"""
+        self.assertEqual(
+            json_to_dictionary(
+                '[{"Id": 1, "Name": "a, \\"b\\"", "Puppet Classes": []}]'),
+            [{u'id': 1, u'name': u'a, "b"', u'puppet-classes': []}])
+
+    def test_nested(self):
+        """Keys of nested objects are renamed too"""
+        self.assertEqual(
+            json_to_dictionary(
+                '{"Content": [{"Repo Name": "repo1", "URL": ""}]}'),
+            {u'content': [{u'repo-name': u'repo1', u'url': u''}]})
+
+    def test_invalid(self):
+        """Anything but JSON raises ValueError"""
+        with self.assertRaises(ValueError):
+            json_to_dictionary('Id,Name\n1,foo')
+
+
+class CSVToDictionaryTestCase(unittest.TestCase):
+    def test_parse(self):
+        """Headers become keys, in lower case and dashed"""
+        rows = csv_to_dictionary([u'Id,Full Name', u'1,foo', u'', u'2,bar'])
+        self.assertEqual(
+            rows,
+            [{u'id': u'1', u'full-name': u'foo'},
+             {u'id': u'2', u'full-name': u'bar'}])
+
+    def test_quoted_fields(self):
+        """Quoted fields keep their commas, quotes and line breaks"""
+        rows = csv_to_dictionary([
+            u'Id,Name,Description',
+            u'1,"foo, bar","say ""hi"""',
+            u'2,"",\u0431',
+            u'3,baz,"two',
+            u'lines"',
+            ])
+        self.assertEqual([row[u'name'] for row in rows],
+                         [u'foo, bar', u'', u'baz'])
+        self.assertEqual([row[u'description'] for row in rows],
+                         [u'say "hi"', u'\u0431', u'two\nlines'])
+
+    def test_empty(self):
+        """No rows are parsed out of an empty output or a lone header"""
+        self.assertEqual(csv_to_dictionary([]), [])
+        self.assertEqual(csv_to_dictionary([u'Id,Name']), [])
+
+    def test_rows_are_lazy(self):
+        """Rows are parsed as they are iterated over"""
+        def lines():
+            yield u'Id,Name'
+            yield u'1,foo'
+            raise AssertionError('read past the first row')
+
+        self.assertEqual(
+            next(iter_csv_rows(lines())), {u'id': u'1', u'name': u'foo'})
+
+    def test_row_mapping(self):
+        """Rows behave like dictionaries"""
+        row = csv_to_dictionary([u'Id,Name', u'1,foo'])[0]
+        self.assertEqual(row.get(u'missing'), None)
+        self.assertNotIn(u'missing', row)
+        row[u'name'] = u'bar'
+        row[u'extra'] = 1
+        self.assertEqual(row.copy(),
+                         {u'id': u'1', u'name': u'bar', u'extra': 1})
+        self.assertEqual(len(row), 3)
+        args = {u'id': None}
+        args.update(row)
+        self.assertEqual(args[u'extra'], 1)
@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from robottelo.common import conf, ledger, metrics
+
+
+class LedgerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cleanup = conf.properties.get('main.cleanup')
+        conf.properties['main.cleanup'] = 'test'
+        self.deleted = []
+        self.lock = threading.Lock()
+        self.scope = ledger.open_scope('class')
+
+    def tearDown(self):
+        ledger.close_scope(self.scope)
+        if self.cleanup is None:
+            conf.properties.pop('main.cleanup', None)
+        else:
+            conf.properties['main.cleanup'] = self.cleanup
+
+    def record(self, name, dependencies=(), fail=False):
+        def delete():
+            time.sleep(0.05)
+            with self.lock:
+                self.deleted.append(name)
+            if fail:
+                raise Exception('Still in use')
+        return ledger.record(
+            name, delete, dependencies, obj={u'name': name},
+            key=('test', name))
+
+    def test_reverse_order(self):
+        """Entities are deleted before the entities they depend on"""
+        scope = ledger.open_scope('test')
+        org = self.record('org')
+        env = self.record('env', [org])
+        product = self.record('product', [org])
+        self.record('repository', [product])
+        self.record('view', [env, product])
+        self.assertEqual(ledger.find(('test', 'env')), env)
+
+        start = time.time()
+        self.assertEqual(ledger.close_scope(scope), [])
+        elapsed = time.time() - start
+
+        self.assertEqual(
+            sorted(self.deleted[:2]), ['repository', 'view'])
+        self.assertEqual(sorted(self.deleted[2:4]), ['env', 'product'])
+        self.assertEqual(self.deleted[4], 'org')
+        # Three levels, not five entities one after the other
+        self.assertLess(elapsed, 0.22)
+        self.assertEqual(ledger.find(('test', 'env')), None)
+
+    def test_failures(self):
+        """Failures are reported and do not stop the cleanup"""
+        failed = metrics.counter('cleanup.failed')
+        scope = ledger.open_scope('test')
+        org = self.record('org')
+        product = self.record('product', [org], fail=True)
+        self.assertEqual(ledger.close_scope(scope), [product])
+        self.assertEqual(self.deleted, ['product', 'org'])
+        self.assertEqual(metrics.counter('cleanup.failed'), failed + 1)
+
+    def test_keep(self):
+        """Kept objects and their dependencies move to the outer scope"""
+        scope = ledger.open_scope('test')
+        org = self.record('org')
+        product = self.record('product', [org])
+        self.record('repository', [product])
+        ledger.close_scope(scope, [product.obj, {u'name': u'other'}])
+        self.assertEqual(self.deleted, ['repository'])
+        self.assertEqual(self.scope.entries, [product, org])
+
+        ledger.close_scope(self.scope)
+        self.assertEqual(self.deleted, ['repository', 'product', 'org'])
+
+    def test_forget(self):
+        """Entities deleted by the tests are not deleted again"""
+        scope = ledger.open_scope('test')
+        org = self.record('org')
+        product = self.record('product', [org])
+        self.assertIs(ledger.forget(('test', 'product')), product)
+        self.assertEqual(ledger.find(('test', 'product')), None)
+        self.assertEqual(scope.entries, [org])
+        self.assertEqual(ledger.forget(('test', 'product')), None)
+        self.assertEqual(ledger.close_scope(scope), [])
+        self.assertEqual(self.deleted, ['org'])
+
+    def test_forget_ledger_file(self):
+        """The deletion of forgotten entities is written to the file"""
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        conf.properties['main.cleanup.ledger_file'] = path
+        self.addCleanup(conf.properties.pop, 'main.cleanup.ledger_file')
+        # Without cleanup only the file and the keys are kept
+        del conf.properties['main.cleanup']
+        ledger.record(u'org', None, key=('test', 'org'), ref={'id': 1})
+        ledger.forget(('test', 'org'))
+        with open(path) as lines:
+            events = [json.loads(line)['event'] for line in lines]
+        self.assertEqual(events, ['created', 'deleted'])
+
+    def test_using(self):
+        """Entities are recorded in the scope in use in the thread"""
+        other = ledger.Scope('session')
+        scope = ledger.open_scope('test')
+        with ledger.using(other):
+            org = self.record('org')
+        ledger.close_scope(scope)
+        self.assertEqual(self.deleted, [])
+        self.assertEqual(other.entries, [org])
+
+    def test_disabled(self):
+        """Nothing is recorded without cleanup"""
+        conf.properties['main.cleanup'] = 'class'
+        self.assertEqual(ledger.open_scope('test'), None)
+        del conf.properties['main.cleanup']
+        self.assertEqual(self.record('org'), None)
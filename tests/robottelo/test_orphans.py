@@ -0,0 +1,165 @@
+import os
+import re
+import tempfile
+import unittest
+
+from robottelo.common import conf, ledger, orphans
+from robottelo.common.ssh import SSHCommandResult
+
+
+class LedgerFileTestCase(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        self.ledger_file = conf.properties.get('main.cleanup.ledger_file')
+        conf.properties['main.cleanup.ledger_file'] = self.path
+        self.scope = ledger.Scope('test')
+
+    def tearDown(self):
+        if self.ledger_file is None:
+            conf.properties.pop('main.cleanup.ledger_file', None)
+        else:
+            conf.properties['main.cleanup.ledger_file'] = self.ledger_file
+        os.remove(self.path)
+
+    def record(self, name, dependencies=()):
+        with ledger.using(self.scope):
+            return ledger.record(
+                name, None, dependencies, key=('cli', 'Org', name),
+                ref={'cli': 'Org', 'options': {u'id': name}})
+
+    def test_read_ledger(self):
+        """Entities created and not deleted are read with dependencies"""
+        org = self.record(u'1')
+        product = self.record(u'2', [org])
+        self.record(u'3', [product])
+        deleted = self.record(u'4', [org])
+        ledger.write(self.path, 'deleted', deleted)
+
+        entries = orphans.read_ledger(self.path)
+        self.assertEqual(
+            [entry.name for entry in entries], [u'1', u'2', u'3'])
+        self.assertEqual(entries[1].dependencies, [entries[0]])
+        self.assertEqual(entries[2].dependencies, [entries[1]])
+        self.assertEqual(entries[0].ref['options'], {u'id': u'1'})
+        self.assertEqual(
+            [[entry.name for entry in level]
+             for level in ledger.deletion_levels(entries)],
+            [[u'3'], [u'2'], [u'1']])
+
+    def test_not_kept(self):
+        """Without cleaning up, entities are only written to the file"""
+        cleanup = conf.properties.pop('main.cleanup', None)
+        try:
+            org = self.record(u'1')
+            with ledger.using(self.scope):
+                ledger.record(
+                    u'2', None, [org], obj={u'id': u'2'},
+                    key=('cli', 'Org', u'2'),
+                    ref={'cli': 'Org', 'options': {u'id': u'2'}})
+        finally:
+            if cleanup is not None:
+                conf.properties['main.cleanup'] = cleanup
+        self.assertEqual(self.scope.entries, [])
+        self.assertEqual(ledger.find(('cli', 'Org', u'2')).obj, None)
+        entries = orphans.read_ledger(self.path)
+        self.assertEqual(entries[1].dependencies, [entries[0]])
+
+    def test_write_ledger(self):
+        """The ledger file is rewritten with the given entries"""
+        org = self.record(u'1')
+        self.record(u'2', [org])
+        entries = orphans.read_ledger(self.path)
+        orphans.write_ledger(self.path, entries[1:])
+        entries = orphans.read_ledger(self.path)
+        self.assertEqual([entry.name for entry in entries], [u'2'])
+        # Dependencies which are gone are forgotten
+        self.assertEqual(entries[0].dependencies, [])
+
+    def test_collect(self):
+        """Entities are deleted, dependent ones first"""
+        deleted = []
+        org = self.record(u'1')
+        self.record(u'2', [org])
+        entries = orphans.read_ledger(self.path)
+        for entry in entries:
+            entry.delete = lambda name=entry.name: deleted.append(name)
+
+        self.assertEqual(orphans.collect(entries), [])
+        self.assertEqual(deleted, [])
+        self.assertEqual(orphans.collect(entries, delete=True), [])
+        self.assertEqual(deleted, [u'2', u'1'])
+
+
+class Listing(object):
+    """Future of a list command"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def result(self):
+        return SSHCommandResult(self.rows)
+
+
+def fake_kind(name, rows):
+    """Returns a cli class listing ``rows``"""
+    return type(name, (object,), {
+        'list': classmethod(lambda cls, options=None: Listing(rows).result()),
+        'list_async': classmethod(lambda cls, options=None: Listing(rows)),
+        '_requires_org': classmethod(lambda cls, command_sub: False),
+    })
+
+
+class FindMarkedTestCase(unittest.TestCase):
+    def setUp(self):
+        self.kinds = orphans.KINDS
+        self.org = orphans.Org
+
+    def tearDown(self):
+        orphans.KINDS = self.kinds
+        orphans.Org = self.org
+
+    def test_protected(self):
+        """Built-in and default entities are never matched"""
+        orphans.Org = fake_kind('Org', [
+            {u'id': 1, u'name': u'Default Organization'},
+            {u'id': 2, u'name': u'test-org'},
+        ])
+        users = fake_kind('User', [
+            {u'id': 1, u'login': u'admin', u'name': u'Admin User'},
+            {u'id': 2, u'login': u'test-user', u'name': u'Admin'},
+        ])
+        orphans.KINDS = ((users, False), (orphans.Org, False))
+
+        found = orphans.find_marked(u'^test-|Default|Admin')
+        self.assertEqual(
+            [[entry.ref['options'] for entry in entries] for entries in found],
+            [[{u'id': 2}], [{u'id': 2}]])
+
+    def test_organizations_not_listed(self):
+        """Failing to list the organizations is an error"""
+        orphans.Org = fake_kind('Org', [])
+        orphans.Org.list = classmethod(
+            lambda cls, options=None: SSHCommandResult(
+                [], u'Error: unauthorized', return_code=129))
+        orphans.KINDS = ()
+        with self.assertRaisesRegexp(Exception, 'unauthorized'):
+            orphans.find_marked(u'^test-')
+
+    def test_default_marker(self):
+        """The marker defaults to the prefix of the factory names"""
+        markers = []
+        find_marked = orphans.find_marked
+        orphans.find_marked = lambda marker: markers.append(marker) or []
+        conf.properties['main.data.name_prefix'] = u'robottelo_'
+        try:
+            self.assertEqual(orphans.main(['--ledger', '']), 0)
+        finally:
+            orphans.find_marked = find_marked
+            del conf.properties['main.data.name_prefix']
+        self.assertTrue(re.search(markers[0], u'robottelo_abc'))
+        self.assertFalse(re.search(markers[0], u'abc robottelo_'))
+
+    def test_marker_required(self):
+        """Markers matching any name are refused"""
+        self.assertRaises(SystemExit, orphans.main, ['--marker', u'.*'])
@@ -0,0 +1,90 @@
+import itertools
+import threading
+import unittest
+
+from robottelo.cli.factory import Reference
+from robottelo.cli.pool import Pool, get_pool
+from robottelo.common import metrics
+from robottelo.common.helpers import wait_for
+
+
+class PoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.spec = {
+            'org': (self.make, {}),
+            'product': (self.make, {u'organization-id': Reference('org')}),
+        }
+
+    def make(self, options):
+        with self.lock:
+            obj = {u'id': next(self.ids)}
+        obj.update(options)
+        return obj
+
+    def counter(self, name):
+        return metrics.counter('pool.%s.%s' % (name, self.id()))
+
+    def pool(self, size):
+        pool = Pool(self.id(), self.spec, size)
+        pool.fill()
+        wait_for(lambda: pool._ready and not pool._pending, 5, 0.01)
+        return pool
+
+    def test_hit(self):
+        """Leases are served from the objects created in the background"""
+        pool = self.pool(2)
+        self.assertEqual(len(pool._ready), 2)
+        lease = pool.lease()
+        self.assertEqual(
+            lease['product'][u'organization-id'], lease['org'][u'id'])
+        self.assertEqual(self.counter('hit'), 1)
+        self.assertEqual(self.counter('miss'), 0)
+
+    def test_miss(self):
+        """Leases create their objects when none is ready"""
+        pool = Pool(self.id(), self.spec, 1)
+        lease = pool.lease()
+        self.assertEqual(
+            lease['product'][u'organization-id'], lease['org'][u'id'])
+        self.assertEqual(self.counter('miss'), 1)
+
+    def test_release(self):
+        """Released objects go back to the pool"""
+        pool = self.pool(1)
+        lease = pool.lease()
+        lease.release()
+        lease.release()
+        self.assertEqual(pool.lease(), lease)
+        self.assertEqual(self.counter('hit'), 2)
+        self.assertEqual(pool._pending, 0)
+
+    def test_tainted(self):
+        """Tainted objects are replaced, not given back"""
+        pool = self.pool(1)
+        lease = pool.lease()
+        lease.taint()
+        lease.release()
+        wait_for(lambda: pool._ready and not pool._pending, 5, 0.01)
+        replacement = pool.lease()
+        self.assertNotEqual(replacement, lease)
+        self.assertEqual(self.counter('tainted'), 1)
+
+        replacement.release()
+        tainted = pool.lease(tainted=True)
+        wait_for(lambda: pool._ready and not pool._pending, 5, 0.01)
+        self.assertNotEqual(pool.lease(), tainted)
+
+    def test_disabled(self):
+        """Without a size every lease creates its objects"""
+        pool = Pool(self.id(), self.spec, 0)
+        lease = pool.lease()
+        lease.release()
+        self.assertNotEqual(pool.lease(), lease)
+        self.assertEqual(len(pool._ready), 0)
+        self.assertEqual(self.counter('miss'), 0)
+
+    def test_unknown_kind(self):
+        """Only the kinds of objects known to the pools can be leased"""
+        self.assertRaises(ValueError, get_pool, 'unknown')
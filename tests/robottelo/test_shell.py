@@ -0,0 +1,168 @@
+import os
+import subprocess
+import threading
+import unittest
+
+from distutils.spawn import find_executable
+from robottelo.cli.shell import BOOTSTRAP, HammerShellError, HammerShellSession
+
+from .test_ssh import FakeChannel
+
+
+class FakeShellChannel(FakeChannel):
+    """Channel of a shell session that is still running"""
+    def __init__(self, stdout=(), stderr=()):
+        super(FakeShellChannel, self).__init__(stdout, stderr, eof=False)
+        self.sent = []
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+
+class ProcessChannel(object):
+    """Channel of a local process, read like a paramiko channel"""
+    def __init__(self, args, env):
+        self.process = subprocess.Popen(
+            args, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE)
+        self.closed = False
+        self.eof_received = False
+        self.buffers = {'stdout': [], 'stderr': []}
+        self.lock = threading.Lock()
+        # Readable while some output is buffered, like the channel pipe
+        self.pipe = os.pipe()
+        for name in self.buffers:
+            thread = threading.Thread(target=self._read, args=(name,))
+            thread.daemon = True
+            thread.start()
+
+    def _read(self, name):
+        stream = getattr(self.process, name)
+        while True:
+            data = os.read(stream.fileno(), 4096)
+            with self.lock:
+                if not data:
+                    self.eof_received = True
+                else:
+                    self.buffers[name].append(data)
+                os.write(self.pipe[1], 'x')
+            if not data:
+                return
+
+    def _pop(self, name):
+        with self.lock:
+            data = self.buffers[name].pop(0)
+            if not (self.buffers['stdout'] or self.buffers['stderr'] or
+                    self.eof_received):
+                os.read(self.pipe[0], 4096)
+            return data
+
+    def fileno(self):
+        return self.pipe[0]
+
+    def recv_ready(self):
+        return len(self.buffers['stdout']) > 0
+
+    def recv(self, nbytes):
+        return self._pop('stdout')
+
+    def recv_stderr_ready(self):
+        return len(self.buffers['stderr']) > 0
+
+    def recv_stderr(self, nbytes):
+        return self._pop('stderr')
+
+    def exit_status_ready(self):
+        return self.process.poll() is not None
+
+    def sendall(self, data):
+        self.process.stdin.write(data)
+        self.process.stdin.flush()
+
+    def close(self):
+        self.closed = True
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+
+def make_session(channel, token='TOKEN'):
+    """Builds a session around the channel without starting hammer"""
+    session = HammerShellSession.__new__(HammerShellSession)
+    session.token = token
+    session.channel = channel
+    session._stdout = ''
+    session._stderr = ''
+    return session
+
+
+class HammerShellSessionTestCase(unittest.TestCase):
+    def test_execute_reads_one_frame(self):
+        """A command output is split at the frame markers"""
+        channel = FakeShellChannel(
+            stdout=['Id,Name\n1,x86', '_64\n\nTOKEN ', '0\n', 'next'],
+            stderr=['\nTOK', 'EN\nnext'],
+        )
+        session = make_session(channel)
+        stdout, stderr, status = session.execute('architecture list')
+
+        self.assertEqual(channel.sent, ['architecture list\n'])
+        self.assertEqual(stdout, 'Id,Name\n1,x86_64\n')
+        self.assertEqual(stderr, '')
+        self.assertEqual(status, 0)
+        # Output received after the markers is kept for the next command
+        self.assertEqual(session._stdout, 'next')
+        self.assertEqual(session._stderr, 'next')
+
+    def test_execute_error_status(self):
+        """Errors and the exit status of a failed command are returned"""
+        channel = FakeShellChannel(
+            stdout=['\nTOKEN 65\n'],
+            stderr=['Could not find the architecture\n\nTOKEN\n'],
+        )
+        stdout, stderr, status = make_session(channel).execute(
+            'architecture info --id 999')
+        self.assertEqual(stdout, '')
+        self.assertEqual(stderr, 'Could not find the architecture\n')
+        self.assertEqual(status, 65)
+
+    def test_session_exited(self):
+        """A session whose process exited raises HammerShellError"""
+        channel = FakeShellChannel(stderr=['ruby: command not found\n'])
+        channel.eof_received = True
+        with self.assertRaises(HammerShellError):
+            make_session(channel).execute('architecture list')
+
+
+@unittest.skipUnless(find_executable('ruby'), 'ruby is not installed')
+class HammerShellBootstrapTestCase(unittest.TestCase):
+    """Frames written by the bootstrap around a hammer_cli like shell"""
+    def setUp(self):
+        # Gem.bin_path is pointed at the hammer stand-in of the data dir
+        hammer = os.path.join(os.path.dirname(__file__), 'data', 'hammer')
+        stub = 'module Gem; def self.bin_path(*args); %r; end; end' % hammer
+        env = dict(os.environ, ROBOTTELO_TOKEN='TOKEN')
+        self.channel = ProcessChannel(
+            ['ruby', '-e', stub, '-e', BOOTSTRAP, '--',
+             '-u', 'admin', '-p', 'changeme', 'shell'],
+            env)
+        self.session = make_session(self.channel)
+        self.session._read_frame(10)
+
+    def tearDown(self):
+        self.channel.close()
+
+    def test_exit_status(self):
+        """Each frame carries the exit status of its command"""
+        self.assertEqual(
+            self.session.execute('architecture info', 10),
+            ('', 'Could not find the architecture\n', 65))
+        self.assertEqual(
+            self.session.execute('architecture list', 10),
+            ('Id,Name\n1,x86_64\n', '', 0))
+
+    def test_usage_error_status(self):
+        """The status of a command exiting on usage errors is kept"""
+        stdout, stderr, status = self.session.execute('domain list', 10)
+        self.assertIn('No such sub-command', stderr)
+        self.assertEqual(status, 64)
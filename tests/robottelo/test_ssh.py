@@ -0,0 +1,366 @@
+import os
+import threading
+import unittest
+
+from robottelo.common import ssh
+
+
+class FakeTransport(object):
+    def __init__(self):
+        self.active = True
+        self.channels = []
+
+    def is_active(self):
+        return self.active
+
+    def open_session(self):
+        if not self.active:
+            raise EOFError()
+        return self.channels.pop(0)
+
+
+class FakeClient(object):
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+        self.transport.active = False
+
+
+class FakeChannel(object):
+    """Channel whose output is already fully received"""
+    def __init__(self, stdout=(), stderr=(), exit_status=0, eof=True):
+        self.stdout = list(stdout)
+        self.stderr = list(stderr)
+        self.exit_status = exit_status
+        self.eof_received = eof
+        self.closed = False
+        self.status_event = threading.Event()
+        if eof:
+            self.status_event.set()
+
+    def fileno(self):
+        # Never becomes readable, selecting on it just times out
+        if not hasattr(self, 'pipe'):
+            self.pipe = os.pipe()
+        return self.pipe[0]
+
+    def recv_ready(self):
+        return len(self.stdout) > 0
+
+    def recv(self, nbytes):
+        return self.stdout.pop(0)
+
+    def recv_stderr_ready(self):
+        return len(self.stderr) > 0
+
+    def recv_stderr(self, nbytes):
+        return self.stderr.pop(0)
+
+    def exit_status_ready(self):
+        return self.status_event.is_set()
+
+    def recv_exit_status(self):
+        return self.exit_status
+
+    def settimeout(self, timeout):
+        pass
+
+    def exec_command(self, command):
+        self.command = command
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnectionPool(ssh.SSHConnectionPool):
+    def __init__(self, size, channels=()):
+        super(FakeConnectionPool, self).__init__(
+            'example.com', 'root', None, size=size)
+        self.opened = []
+        # Channels handed out by the connections, in order
+        self.channels = list(channels)
+
+    def _connect(self):
+        client = FakeClient()
+        client.transport.channels = self.channels
+        self.opened.append(client)
+        return client
+
+
+class SSHConnectionPoolTestCase(unittest.TestCase):
+    def test_reuses_returned_connection(self):
+        """A connection given back to the pool is handed out again"""
+        pool = FakeConnectionPool(size=2)
+        with pool.connection() as client:
+            pass
+        with pool.connection() as other:
+            self.assertIs(client, other)
+        self.assertEqual(len(pool.opened), 1)
+
+    def test_opens_up_to_size(self):
+        """The pool opens new connections only up to its size"""
+        pool = FakeConnectionPool(size=2)
+        first = pool.checkout()
+        second = pool.checkout()
+        self.assertIsNot(first, second)
+        with self.assertRaises(ssh.ConnectionPoolTimeOut):
+            pool.checkout(timeout=0.01)
+        pool.checkin(first)
+        self.assertIs(pool.checkout(timeout=0.01), first)
+
+    def test_replaces_dead_connection(self):
+        """Connections with an inactive transport are not handed out"""
+        pool = FakeConnectionPool(size=1)
+        with pool.connection() as client:
+            pass
+        client.transport.active = False
+        with pool.connection() as other:
+            self.assertIsNot(client, other)
+        self.assertTrue(client.closed)
+        self.assertEqual(len(pool.opened), 2)
+
+    def test_waiting_thread_gets_returned_connection(self):
+        """A blocked checkout is woken up when a connection is returned"""
+        pool = FakeConnectionPool(size=1)
+        client = pool.checkout()
+        received = []
+        waiter = threading.Thread(
+            target=lambda: received.append(pool.checkout(timeout=5)))
+        waiter.start()
+        pool.checkin(client)
+        waiter.join()
+        self.assertEqual(received, [client])
+
+    def test_concurrent_checkouts_are_bounded(self):
+        """Concurrent users never hold more connections than the size"""
+        pool = FakeConnectionPool(size=3)
+        lock = threading.Lock()
+        in_use = set()
+        peak = []
+
+        def worker():
+            for _ in range(50):
+                with pool.connection(timeout=5) as client:
+                    with lock:
+                        self.assertNotIn(client, in_use)
+                        in_use.add(client)
+                        peak.append(len(in_use))
+                    with lock:
+                        in_use.remove(client)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(max(peak), 3)
+        self.assertLessEqual(len(pool.opened), 3)
+
+
+class ReconnectTestCase(unittest.TestCase):
+    def setUp(self):
+        self.get_connection_pool = ssh.get_connection_pool
+
+    def tearDown(self):
+        ssh.get_connection_pool = self.get_connection_pool
+
+    def use_pool(self, pool):
+        ssh.get_connection_pool = lambda hostname=None: pool
+
+    def test_dead_connection_replaced_before_sending(self):
+        """A connection that died while idle is replaced transparently"""
+        pool = FakeConnectionPool(size=1, channels=[FakeChannel(['ok\n'])])
+        with pool.connection() as client:
+            pass
+        # The transport still looks active but the server went away
+        client.transport.open_session = lambda: self.fail_eof()
+        self.use_pool(pool)
+        result = ssh.command('true')
+        self.assertEqual(result.stdout, [u'ok', u''])
+        self.assertEqual(len(pool.opened), 2)
+        self.assertTrue(client.closed)
+
+    def fail_eof(self):
+        raise EOFError()
+
+    def lost_channel(self, pool):
+        """Channel closed by the connection dropping mid-command"""
+        channel = FakeChannel(['partial'], exit_status=-1)
+
+        def exec_command(command):
+            pool.opened[-1].transport.active = False
+        channel.exec_command = exec_command
+        return channel
+
+    def test_idempotent_command_retried(self):
+        """Idempotent commands run again when the connection drops"""
+        pool = FakeConnectionPool(size=1)
+        pool.channels.extend([self.lost_channel(pool), FakeChannel(['ok'])])
+        self.use_pool(pool)
+        result = ssh.command('true', idempotent=True)
+        self.assertEqual(result.return_code, 0)
+        self.assertEqual(result.stdout, [u'ok'])
+        self.assertEqual(len(pool.opened), 2)
+
+    def test_command_not_retried(self):
+        """Other commands raise ConnectionLost when the connection drops"""
+        pool = FakeConnectionPool(size=1)
+        pool.channels.extend([self.lost_channel(pool), FakeChannel(['ok'])])
+        self.use_pool(pool)
+        with self.assertRaises(ssh.ConnectionLost):
+            ssh.command('true')
+        self.assertEqual(len(pool.channels), 1)
+
+    def test_failed_command_not_mistaken_for_lost(self):
+        """A command exiting with -1 on a live connection is not retried"""
+        pool = FakeConnectionPool(
+            size=1, channels=[FakeChannel(exit_status=-1)])
+        self.use_pool(pool)
+        result = ssh.command('true', idempotent=True)
+        self.assertEqual(result.return_code, -1)
+
+
+class IterChannelTestCase(unittest.TestCase):
+    def test_reads_all_output(self):
+        """All stdout and stderr chunks are yielded"""
+        channel = FakeChannel(
+            stdout=['a' * 10, 'b' * 10], stderr=['error'], exit_status=2)
+        timings = {'wait': 0.0, 'transfer': 0.0}
+        chunks = list(ssh._iter_channel(channel, 1, timings))
+        self.assertEqual(chunks, [
+            ('stdout', 'a' * 10),
+            ('stdout', 'b' * 10),
+            ('stderr', 'error'),
+        ])
+        self.assertEqual(channel.recv_exit_status(), 2)
+        self.assertGreaterEqual(timings['transfer'], 0)
+
+    def test_output_arriving_with_eof(self):
+        """Output arriving along with the EOF is not dropped"""
+        channel = FakeChannel(eof=False)
+
+        def recv_stderr_ready():
+            # The last chunk and the EOF arrive right after recv_ready
+            if not channel.eof_received:
+                channel.stdout.append('last')
+                channel.eof_received = True
+                channel.status_event.set()
+            return False
+        channel.recv_stderr_ready = recv_stderr_ready
+
+        timings = {'wait': 0.0, 'transfer': 0.0}
+        chunks = list(ssh._iter_channel(channel, 1, timings))
+        self.assertEqual(chunks, [('stdout', 'last')])
+
+    def test_timeout(self):
+        """A command that does not finish in time raises CommandTimeOut"""
+        channel = FakeChannel(eof=False)
+        timings = {'wait': 0.0, 'transfer': 0.0}
+        with self.assertRaises(ssh.CommandTimeOut):
+            list(ssh._iter_channel(channel, 0.05, timings))
+        self.assertGreater(timings['wait'], 0)
+
+
+class LineDecoderTestCase(unittest.TestCase):
+    def test_lines_split_across_chunks(self):
+        """Lines and multibyte characters split across chunks are joined"""
+        data = u'Id,Name\n1,\u65b0\u7528\u6236\n2,foo'.encode('utf-8')
+        decoder = ssh._LineDecoder()
+        lines = []
+        for i in range(len(data)):
+            lines.extend(decoder.feed(data[i:i + 1]))
+        lines.extend(decoder.flush())
+        self.assertEqual(
+            lines, [u'Id,Name', u'1,\u65b0\u7528\u6236', u'2,foo'])
+
+    def test_clean_lines(self):
+        """Rails traffic and color codes are stripped from lines"""
+        lines = list(ssh._clean_lines([
+            u'[ INFO 2014-06-10 Server] GET /api/organizations',
+            u'\x1b[32mName\x1b[0m',
+            u'foo,"",bar',
+        ]))
+        self.assertEqual(lines, [u'Name', u'foo,,bar'])
+
+
+class SplitBatchOutputTestCase(unittest.TestCase):
+    def test_split(self):
+        """Batch output is split per command at the markers"""
+        stdout = (
+            'Id,Name\n1,foo\n'
+            '\nTOKEN 0 0\n'
+            'no newline'
+            '\nTOKEN 1 65\n'
+        )
+        stderr = (
+            '\nTOKEN 0\n'
+            'Could not find\n'
+            '\nTOKEN 1\n'
+        )
+        self.assertEqual(
+            ssh._split_batch_output(stdout, stderr, 'TOKEN', 2),
+            [('Id,Name\n1,foo\n', '', 0),
+             ('no newline', 'Could not find\n', 65)])
+
+    def test_missing_output(self):
+        """A script that ended early raises CommandBatchError"""
+        with self.assertRaises(ssh.CommandBatchError):
+            ssh._split_batch_output(
+                'out\nTOKEN 0 0\n', '\nTOKEN 0\n', 'TOKEN', 2)
+
+
+class CommandResultTestCase(unittest.TestCase):
+    def test_json(self):
+        """JSON output is decoded, log lines are stripped"""
+        result = ssh.command_result(
+            '[ INFO 2014-06-10 12:00:00 API] GET /api/architectures\n'
+            '[\n  {"Id": 1, "Name": "", "OS": "\x1b[32mx\x1b[0m"}\n]\n',
+            '', 0, expect_json=True)
+        self.assertEqual(
+            result.stdout, [{u'id': 1, u'name': u'', u'os': u'x'}])
+
+    def test_json_failed_command(self):
+        """The output of failed commands is not decoded"""
+        result = ssh.command_result(
+            'not json', 'Error: not found', 65, expect_json=True)
+        self.assertEqual(result.stdout, [u'not json'])
+        self.assertEqual(result.stderr, 'Error: not found')
+
+    def test_csv(self):
+        """CSV output keeps its quotes, log lines are stripped"""
+        result = ssh.command_result(
+            '[ INFO 2014-06-10 12:00:00 API] GET /api/architectures\n'
+            'Id,Name\n1,"[x], y"\n2,""\n', '', 0, expect_csv=True)
+        self.assertEqual(
+            list(result.rows()),
+            [{u'id': u'1', u'name': u'[x], y'}, {u'id': u'2', u'name': u''}])
+        self.assertEqual(result.stdout[0][u'name'], u'[x], y')
+        # Once parsed the rows are not parsed again
+        self.assertIs(next(result.rows()), result.stdout[0])
+
+    def test_csv_failed_command(self):
+        """The output of failed commands is not parsed"""
+        result = ssh.command_result(
+            'Id,Name\n', 'Error: not found', 65, expect_csv=True)
+        self.assertEqual(result.stdout, [u'Id,Name', u''])
+
+    def test_lazy(self):
+        """The output is only decoded and parsed when stdout is accessed"""
+        result = ssh.command_result('\xff\n', '', 0, expect_csv=True)
+        self.assertEqual(result.return_code, 0)
+        self.assertRaises(UnicodeDecodeError, getattr, result, 'stdout')
+
+    def test_legacy_output(self):
+        """Other output is split in lines, Rails traffic is stripped"""
+        result = ssh.command_result(
+            '[ INFO 2014-06-10 12:00:00 API] GET /api/hosts\n'
+            'Name: ""\n\x1b[32mId: 1\x1b[0m\n', '', 0)
+        self.assertEqual(result.stdout, [u'Name: ', u'Id: 1', u''])
+        self.assertIs(result.stdout, result.lines)
+        self.assertEqual(ssh.command_result('', '', 0).stdout, [])